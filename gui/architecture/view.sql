@@ -27,15 +27,25 @@ CREATE OR REPLACE VIEW public.v_live_valuations
            FROM dates d
              JOIN raw_stock_valuations earliest ON d.ticker::text = earliest.ticker::text AND d.start_date = earliest.results_period_end
              JOIN raw_stock_valuations latest ON d.ticker::text = latest.ticker::text AND d.end_date = latest.results_period_end
+        ), growth_rate AS (
+         SELECT g_1.ticker,
+            g_1.financials_date,
+            g_1.start_heps,
+            g_1.end_heps,
+            g_1.latest_div,
+            g_1.latest_nav,
+            g_1.num_years,
+                CASE
+                    WHEN g_1.start_heps > 0::numeric AND g_1.end_heps > g_1.start_heps AND g_1.num_years >= 1::numeric THEN (power((g_1.end_heps / g_1.start_heps)::double precision, 1.0::double precision / g_1.num_years::double precision) - 1.0::double precision) * 100.0::double precision
+                    ELSE NULL::double precision
+                END AS growth_pct
+           FROM growth_calc g_1
         )
  SELECT p.ticker,
     p.current_price,
     round(p.current_price / NULLIF(g.end_heps, 0::numeric), 2) AS pe_ratio,
     round(g.latest_div / NULLIF(p.current_price, 0::numeric) * 100::numeric, 2) AS div_yield_perc,
-        CASE
-            WHEN g.start_heps > 0::numeric AND g.end_heps > g.start_heps AND g.num_years >= 1::numeric THEN round(p.current_price / NULLIF(g.end_heps, 0::numeric) / NULLIF((power(g.end_heps / g.start_heps, 1.0 / g.num_years) - 1::numeric) * 100::numeric, 0::numeric), 2)
-            ELSE NULL::numeric
-        END AS peg_ratio_historical,
+    round(p.current_price / NULLIF(g.end_heps, 0::numeric) / NULLIF(g.growth_pct::numeric, 0::numeric), 2) AS peg_ratio_historical,
         CASE
             WHEN g.end_heps > 0::numeric AND g.latest_nav > 0::numeric THEN round(sqrt(22.5 * g.end_heps * g.latest_nav), 0)
             ELSE NULL::numeric
@@ -44,13 +54,10 @@ CREATE OR REPLACE VIEW public.v_live_valuations
             WHEN g.end_heps > 0::numeric AND g.latest_nav > 0::numeric THEN round((p.current_price - sqrt(22.5 * g.end_heps * g.latest_nav)) / sqrt(22.5 * g.end_heps * g.latest_nav) * 100::numeric, 2)
             ELSE NULL::numeric
         END AS valuation_premium_perc,
-        CASE
-            WHEN g.start_heps > 0::numeric AND g.end_heps > g.start_heps AND g.num_years >= 1::numeric THEN round((power(g.end_heps / g.start_heps, 1.0 / g.num_years) - 1::numeric) * 100::numeric, 2)
-            ELSE NULL::numeric
-        END AS historical_growth_cagr,
+    round(g.growth_pct::numeric, 2) AS historical_growth_cagr,
     g.financials_date
    FROM latest_price p
-     JOIN growth_calc g ON p.ticker::text = g.ticker::text;
+     JOIN growth_rate g ON p.ticker::text = g.ticker::text;
 
 ALTER TABLE public.v_live_valuations
     OWNER TO postgres;
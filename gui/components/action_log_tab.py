@@ -4,6 +4,7 @@ from ttkbootstrap.constants import TOP, X, RIGHT, HORIZONTAL, BOTH, LEFT, VERTIC
 
 from modules.data.research import get_action_logs, mark_log_read
 from components.button_utils import run_bg_with_button
+from core.utils.dates import format_minutes
 
 
 class ActionLogTab(ttk.Frame):
@@ -107,7 +108,7 @@ class ActionLogTab(ttk.Frame):
 
             if action_logs:
                 for item in action_logs:
-                    d_str = item["log_timestamp"].strftime("%Y-%m-%d %H:%M")
+                    d_str = format_minutes(item["log_timestamp"])
                     status = "Read" if item.get("is_read") else "Unread"
                     first_line = item["trigger_content"].strip().split("\n")[0] if item["trigger_content"] else "No content"
 
@@ -3,8 +3,24 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import X, W, BOTH, E, END, LEFT, BOTTOM
 from ttkbootstrap.scrolled import ScrolledText
 import logging
+import re
 from ttkbootstrap.dialogs import Messagebox
 
+# Plain decimal price as typed by the user, e.g. "12", "12.5", ".5", "12."
+_PRICE_RE = re.compile(r"^\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)\s*$")
+
+
+def _parse_price(raw):
+    """Return `raw` as a float rounded to cents, or None if it is empty or not a plain number.
+
+    Validates with a compiled regex first so partial input typed into the
+    price entries does not go through float()'s exception path.
+    """
+    if not raw or not _PRICE_RE.match(raw):
+        return None
+    return round(float(raw), 2)
+
+
 class AnalysisControlPanel(ttk.Frame):
     """
     A control panel for editing technical analysis parameters:
@@ -30,6 +46,11 @@ class AnalysisControlPanel(ttk.Frame):
         self.entry_var = ttk.StringVar()
         self.target_var = ttk.StringVar()
         self.stop_var = ttk.StringVar()
+        # Pending after() id for the debounced value-label refresh
+        self._labels_after_id = None
+        # Last (raw text, parsed price) per price variable, shared by the
+        # value labels and get_values so each edit is parsed once
+        self._parsed_prices = {}
         
         self.create_widgets()
         
@@ -138,22 +159,36 @@ class AnalysisControlPanel(ttk.Frame):
 
         # Ensure the value labels update whenever the entry boxes change
         try:
-            self.entry_var.trace_add("write", lambda *a: self._update_value_label(self.entry_var, self.entry_value_label))
-            self.target_var.trace_add("write", lambda *a: self._update_value_label(self.target_var, self.target_value_label))
-            self.stop_var.trace_add("write", lambda *a: self._update_value_label(self.stop_var, self.stop_value_label))
+            for var in (self.entry_var, self.target_var, self.stop_var):
+                var.trace_add("write", self._schedule_value_labels)
         except Exception:
             pass
 
+    def _schedule_value_labels(self, *_args) -> None:
+        """Coalesce keystrokes so the labels refresh once typing pauses."""
+        if self._labels_after_id is not None:
+            try:
+                self.after_cancel(self._labels_after_id)
+            except Exception:
+                pass
+        self._labels_after_id = self.after(150, self._refresh_value_labels)
+
+    def _refresh_value_labels(self) -> None:
+        self._labels_after_id = None
+        self._update_value_label(self.entry_var, self.entry_value_label)
+        self._update_value_label(self.target_var, self.target_value_label)
+        self._update_value_label(self.stop_var, self.stop_value_label)
+
     def _update_value_label(self, var: ttk.StringVar, label_widget: ttk.Label) -> None:
         """Update the label next to a price entry when the underlying variable changes."""
         try:
             val = var.get()
             if val:
                 # Accept either float or string; ensure numeric formatting if possible
-                try:
-                    v = float(val)
+                v = self._parsed_price(var, val)
+                if v is not None:
                     label_widget.config(text=f"R{v:.2f}")
-                except Exception:
+                else:
                     label_widget.config(text=val)
             else:
                 label_widget.config(text="")
@@ -285,24 +320,26 @@ class AnalysisControlPanel(ttk.Frame):
             except Exception:
                 pass
             
+    def _parsed_price(self, var, raw=None):
+        """Parse `var`'s text, reusing the last result while the text is unchanged."""
+        if raw is None:
+            raw = var.get()
+        key = str(var)
+        cached = self._parsed_prices.get(key)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        value = _parse_price(raw)
+        self._parsed_prices[key] = (raw, value)
+        return value
+
     def get_values(self):
         """Return a dictionary of current values from the UI."""
-        try:
-            entry = float(self.entry_var.get()) if self.entry_var.get() else None
-        except ValueError:
-            entry = None
-            
-        try:
-            target = float(self.target_var.get()) if self.target_var.get() else None
-        except ValueError:
-            target = None
-            
-        try:
-            stop = float(self.stop_var.get()) if self.stop_var.get() else None
-        except ValueError:
-            stop = None
-            
-        strategy = self.strategy_text.get("1.0", END).strip()
+        entry = self._parsed_price(self.entry_var)
+        target = self._parsed_price(self.target_var)
+        stop = self._parsed_price(self.stop_var)
+
+        # end-1c excludes the trailing newline Tk always appends
+        strategy = self.strategy_text.get("1.0", "end-1c").strip()
         
         return {
             "entry_price": entry,
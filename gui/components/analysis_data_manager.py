@@ -1,5 +1,10 @@
 from core.db.engine import DBEngine
-from components.analysis_service import fetch_analysis, delete_price_level
+from components.analysis_service import (
+    fetch_analysis,
+    delete_price_level,
+    invalidate_analysis_cache,
+    invalidate_chart_cache,
+)
 from core.utils.technical_utils import build_saved_levels_from_row, price_from_db, update_analysis_db
 
 class AnalysisDataManager:
@@ -24,10 +29,14 @@ class AnalysisDataManager:
 
     # ---------- Mutations ----------
     async def update_analysis(self, ticker, entry_c, stop_c, target_c, is_long, strategy, support_cs, resistance_cs):
-        await update_analysis_db(ticker, entry_c, stop_c, target_c, is_long, strategy, support_cs, resistance_cs)
+        try:
+            await update_analysis_db(ticker, entry_c, stop_c, target_c, is_long, strategy, support_cs, resistance_cs)
+        finally:
+            invalidate_analysis_cache(ticker)
+            invalidate_chart_cache(ticker)
 
     async def delete_price_level(self, level_id):
-        await delete_price_level(level_id)
+        return await delete_price_level(level_id)
 
     # ---------- Small helpers reused by UI ----------
     def saved_levels_from_row(self, row):
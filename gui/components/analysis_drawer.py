@@ -31,7 +31,17 @@ class AnalysisDrawer:
             # Fall back to immediate draw on error
             self._perform_draw(lines)
 
+    def cancel(self):
+        """Drop a pending (debounced) draw, e.g. when a newer redraw supersedes it."""
+        if self._after_id is not None and hasattr(self.chart, "after_cancel"):
+            try:
+                self.chart.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+
     def _perform_draw(self, lines: List[Any]):
+        self._after_id = None
         setter = getattr(self.chart, 'set_horizontal_lines', None)
         if callable(setter):
             try:
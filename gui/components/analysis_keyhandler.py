@@ -1,6 +1,15 @@
 from typing import Any
 import logging
 
+# key -> (window attribute, line colour, analysis panel field)
+_KEY_MAP = {
+    'e': ('entry_price', 'blue', 'entry'),
+    'l': ('stop_loss', 'red', 'stop'),
+    't': ('target_price', 'green', 'target'),
+    'f': ('support', 'green', 'support'),
+    'r': ('resistance', 'red', 'resistance'),
+}
+
 
 class AnalysisKeyHandler:
     """Handle key events for technical analysis.
@@ -17,31 +26,24 @@ class AnalysisKeyHandler:
 
     def handle_key(self, event: Any):
         try:
+            # Most keystrokes are not ours; reject them before the focus checks
+            key = (getattr(event, 'char', '') or '').lower()
+            if key not in _KEY_MAP:
+                return False
+
             # Focus checks: panel input focus and chart focus
             if hasattr(self.window, 'analysis_panel') and callable(getattr(self.window.analysis_panel, 'has_any_input_focus', None)) and self.window.analysis_panel.has_any_input_focus():
                 return False
             if not hasattr(self.window, 'chart') or not callable(getattr(self.window.chart, 'has_focus', None)) or not self.window.chart.has_focus():
                 return False
 
-            key = getattr(event, 'char', '') or ''
-            key = key.lower()
-            if key not in ['e', 'l', 't', 'f', 'r']:
-                return False
-
             getter = getattr(self.window.chart, 'get_cursor_y', None)
             cursor_y = getter() if callable(getter) else None
             if cursor_y is None or not isinstance(cursor_y, (int, float)):
                 logging.getLogger(__name__).warning('[KeyHandler] No cursor position')
                 return False
 
-            key_map = {
-                'e': ('entry_price', 'blue', 'entry'),
-                'l': ('stop_loss', 'red', 'stop'),
-                't': ('target_price', 'green', 'target'),
-                'f': ('support', 'green', 'support'),
-                'r': ('resistance', 'red', 'resistance'),
-            }
-            attr_name, color, panel_field = key_map[key]
+            attr_name, color, panel_field = _KEY_MAP[key]
             price = round(cursor_y, 2)
 
             # Update state on window
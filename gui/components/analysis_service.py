@@ -1,42 +1,134 @@
+import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from core.db.engine import DBEngine
 
+# Recently fetched analysis rows, keyed by ticker. Flicking between tickers in
+# the technical analysis window re-reads the same rows; GUI writers invalidate
+# the ticker they touched and the TTL covers changes made elsewhere.
+_ANALYSIS_CACHE_TTL = 300  # seconds
+_ANALYSIS_CACHE_MAX = 64
+_analysis_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_MISSING = object()
+
+
+def _analysis_cache_get(ticker):
+    entry = _analysis_cache.get(ticker)
+    if entry is None:
+        return _MISSING
+    stored_at, row = entry
+    if time.monotonic() - stored_at > _ANALYSIS_CACHE_TTL:
+        _analysis_cache.pop(ticker, None)
+        return _MISSING
+    _analysis_cache.move_to_end(ticker)
+    # Hand out a copy so callers can't mutate the cached row
+    return dict(row) if row is not None else None
+
+
+def _analysis_cache_put(ticker, row):
+    _analysis_cache[ticker] = (time.monotonic(), row)
+    _analysis_cache.move_to_end(ticker)
+    while len(_analysis_cache) > _ANALYSIS_CACHE_MAX:
+        _analysis_cache.popitem(last=False)
+
+
+def invalidate_analysis_cache(ticker: Optional[str] = None) -> None:
+    """Drop the cached analysis row for ``ticker`` (or every row if None)."""
+    if ticker is None:
+        _analysis_cache.clear()
+    else:
+        _analysis_cache.pop(ticker, None)
+
+
+# Chart window payloads (prices, saved levels, metrics) keyed by ticker, so
+# flicking back to a ticker skips the whole query chain. Level saves/deletes
+# and in-process price downloads invalidate; the TTL covers the market agent,
+# which writes prices from its own process.
+_CHART_CACHE_TTL = 900  # seconds
+_CHART_CACHE_MAX = 32
+_chart_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def chart_cache_get(ticker: str) -> Optional[Dict[str, Any]]:
+    """Return the cached chart payload for ``ticker``, or None if absent/expired."""
+    entry = _chart_cache.get(ticker)
+    if entry is None:
+        return None
+    stored_at, payload = entry
+    if time.monotonic() - stored_at > _CHART_CACHE_TTL:
+        _chart_cache.pop(ticker, None)
+        return None
+    _chart_cache.move_to_end(ticker)
+    return payload
+
+
+def chart_cache_put(ticker: str, payload: Dict[str, Any]) -> None:
+    _chart_cache[ticker] = (time.monotonic(), payload)
+    _chart_cache.move_to_end(ticker)
+    while len(_chart_cache) > _CHART_CACHE_MAX:
+        _chart_cache.popitem(last=False)
+
+
+def invalidate_chart_cache(ticker: Optional[str] = None) -> None:
+    """Drop the cached chart payload for ``ticker`` (or every payload if None)."""
+    if ticker is None:
+        _chart_cache.clear()
+    else:
+        _chart_cache.pop(ticker, None)
+
+# Aggregate support/resistance ids and prices in a single pass over the
+# ticker's price levels (newest first) instead of four correlated subqueries.
+# Level prices come back in rands as float8[], which asyncpg decodes straight
+# to lists of Python floats (no per-element Decimal conversion in the caller)
+_LEVELS_LATERAL = """
+    SELECT
+        array_agg(spl.level_id ORDER BY spl.date_added DESC) FILTER (WHERE spl.level_type = 'support') AS support_ids,
+        array_agg(spl.price_level / 100.0::float8 ORDER BY spl.date_added DESC) FILTER (WHERE spl.level_type = 'support') AS support_prices,
+        array_agg(spl.level_id ORDER BY spl.date_added DESC) FILTER (WHERE spl.level_type = 'resistance') AS resistance_ids,
+        array_agg(spl.price_level / 100.0::float8 ORDER BY spl.date_added DESC) FILTER (WHERE spl.level_type = 'resistance') AS resistance_prices
+    FROM public.stock_price_levels spl
+    WHERE spl.ticker = $1
+"""
+
 
 async def fetch_analysis(ticker: str) -> Optional[Dict[str, Any]]:
     """Fetch analysis/watchlist + support/resistance for a ticker.
 
-    Returns a single dict row or None if not found.
+    Returns a single dict row or None if not found. Results are cached for
+    ``_ANALYSIS_CACHE_TTL`` seconds; see ``invalidate_analysis_cache``.
     """
+    cached = _analysis_cache_get(ticker)
+    if cached is not _MISSING:
+        return cached
+
     query = """
         SELECT 
             w.entry_price, w.target_price, w.stop_loss, w.status,
             sa.strategy,
-            (SELECT array_agg(spl.level_id ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'support') AS support_ids,
-            (SELECT array_agg(spl.price_level ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'support') AS support_prices,
-            (SELECT array_agg(spl.level_id ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'resistance') AS resistance_ids,
-            (SELECT array_agg(spl.price_level ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'resistance') AS resistance_prices
+            lv.support_ids, lv.support_prices, lv.resistance_ids, lv.resistance_prices
         FROM watchlist w
         LEFT JOIN stock_analysis sa ON w.ticker = sa.ticker
+        LEFT JOIN LATERAL (""" + _LEVELS_LATERAL + """) lv ON true
         WHERE w.ticker = $1
     """
     rows = await DBEngine.fetch(query, ticker)
     if rows:
-        return dict(rows[0])
+        row = dict(rows[0])
+        _analysis_cache_put(ticker, row)
+        return dict(row)
     # fallback: try stock_analysis + levels only
     fallback_query = """
         SELECT
             sa.strategy,
-            (SELECT array_agg(spl.level_id ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = $1 AND spl.level_type = 'support') AS support_ids,
-            (SELECT array_agg(spl.price_level ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = $1 AND spl.level_type = 'support') AS support_prices,
-            (SELECT array_agg(spl.level_id ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = $1 AND spl.level_type = 'resistance') AS resistance_ids,
-            (SELECT array_agg(spl.price_level ORDER BY spl.date_added DESC) FROM public.stock_price_levels spl WHERE spl.ticker = $1 AND spl.level_type = 'resistance') AS resistance_prices
+            lv.support_ids, lv.support_prices, lv.resistance_ids, lv.resistance_prices
         FROM stock_analysis sa
+        LEFT JOIN LATERAL (""" + _LEVELS_LATERAL + """) lv ON true
         WHERE sa.ticker = $1
     """
     rows2 = await DBEngine.fetch(fallback_query, ticker)
-    if rows2:
-        return dict(rows2[0])
-    return None
+    row = dict(rows2[0]) if rows2 else None
+    _analysis_cache_put(ticker, row)
+    return dict(row) if row is not None else None
 
 
 async def delete_price_level(level_id: int) -> bool:
@@ -44,6 +136,9 @@ async def delete_price_level(level_id: int) -> bool:
     """
     try:
         await DBEngine.execute("DELETE FROM public.stock_price_levels WHERE level_id = $1", level_id)
+        # The level's ticker isn't known here, so drop every cached row
+        invalidate_analysis_cache()
+        invalidate_chart_cache()
         return True
     except Exception:
         return False
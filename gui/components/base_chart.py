@@ -1,5 +1,6 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import mplfinance as mpf
 import matplotlib.pyplot as plt
@@ -13,9 +14,44 @@ from core.utils.chart_drawing_utils import (
     prepare_mpf_hlines,
     add_legend_for_hlines,
     build_ma_addplots,
+    compute_daily_mas,
+    hline_style,
 )
 from core.utils.dataframe_utils import prepare_df_source
 
+# One worker shared by every chart: the pandas side of a plot (frame build,
+# daily MAs, resampling) runs here so a 5Y load doesn't stall the Tk loop.
+# Matplotlib artists stay on the Tk thread, since the figure is live in a
+# Tk canvas.
+_PREP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-prep")
+
+
+def _resample_for_period(df_source: pd.DataFrame, period_key: Optional[str]) -> pd.DataFrame:
+    """Resample daily OHLC to the candle size used for period_key (5Y monthly, 1Y weekly)."""
+    df = df_source.copy()
+    if period_key == "5Y":
+        df = (
+            df.resample("ME")
+            .agg({"Open": "first", "High": "max", "Low": "min", "Close": "last"})
+            .dropna()
+        )
+    elif period_key == "1Y":
+        df = (
+            df.resample("W")
+            .agg({"Open": "first", "High": "max", "Low": "min", "Close": "last"})
+            .dropna()
+        )
+    # Require valid OHLC after resampling
+    return df.dropna(subset=["Open", "High", "Low", "Close"])
+
+
+def _prepare_frames(data: Any, period_key: Optional[str]):
+    """Build (df_source, daily_mas, df_display, err) for plot; touches no Tk/matplotlib state."""
+    df_source, err = prepare_df_source(data, period_key)
+    if err is not None:
+        return None, None, None, err
+    return df_source, compute_daily_mas(df_source), _resample_for_period(df_source, period_key), None
+
 
 class BaseChart(ttk.Frame):
     """A base class for a single mplfinance chart.
@@ -43,12 +79,27 @@ class BaseChart(ttk.Frame):
         # Holds a list of (price, color, label)
         self.horizontal_lines: List[Tuple[float, str, str]] = []
 
+        # The stored lines (and their legend) are animated artists: full
+        # canvas draws skip them and they are blitted over a cached copy of
+        # the candles, so changing a level does not re-run mplfinance.
+        self._hline_artists: List[Any] = []
+        self._background = None
+        # The lines the current artists were built from, to skip no-op redraws
+        self._drawn_hlines: Optional[List[Tuple[float, str, str]]] = None
+        # y-limits of the candles alone; lines outside them need a full replot
+        self._base_ylim: Optional[Tuple[float, float]] = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
         # Dataframes:
         # - df_source: "source" OHLC data (daily or whatever you pass in),
         #              cleaned but BEFORE resampling.
         # - df_display: last plotted dataframe AFTER resampling (used for cursor mapping).
         self.df_source: Optional[pd.DataFrame] = None
         self.df_display: Optional[pd.DataFrame] = None
+        # Daily (ma50, ma200) computed from df_source
+        self._daily_mas = None
+        # Bumped per load so a slow plot_async can't overwrite a newer plot
+        self._plot_seq = 0
 
         # Last used period key (e.g. "1Y", "5Y") for replotting
         self.last_period_key: Optional[str] = None
@@ -81,6 +132,7 @@ class BaseChart(ttk.Frame):
         lines: Optional[Any] = None,
         addplot: Optional[Any] = None,
         _reuse_source: bool = False,
+        _prepared: Optional[tuple] = None,
     ):
         """Plots the candlestick chart with optional horizontal lines and addplot.
 
@@ -98,11 +150,15 @@ class BaseChart(ttk.Frame):
         )
 
         # ---------------------------------------------------------------------
-        # 1) Prepare df_source
+        # 1) Prepare df_source and build df_display via resampling
         # ---------------------------------------------------------------------
         if not _reuse_source:
-            # Delegate data preparation/validation to util
-            df_source, err = prepare_df_source(data, period_key)
+            self._plot_seq += 1
+            # Delegate data preparation/validation to util (plot_async hands
+            # in frames already prepared on the worker thread)
+            if _prepared is None:
+                _prepared = _prepare_frames(data, period_key)
+            df_source, daily_mas, df, err = _prepared
             if err is not None:
                 self._show_no_data(err)
                 logging.getLogger(__name__).warning(
@@ -113,6 +169,9 @@ class BaseChart(ttk.Frame):
             # Store for future replots (e.g. horizontal line changes)
             self.df_source = df_source
             self.last_period_key = period_key
+            # The daily MAs depend only on the source data: computed once
+            # per load and reused on replots
+            self._daily_mas = daily_mas
 
         else:
             # Replot using existing source data and period
@@ -125,31 +184,14 @@ class BaseChart(ttk.Frame):
                     "  [BaseChart:%s] No df_source/period to reuse.", self.period_label
                 )
                 return
+            df = _resample_for_period(df_source, period_key)
 
-        # ---------------------------------------------------------------------
-        # 2) Build df_display via resampling
-        # ---------------------------------------------------------------------
         self.ax.clear()
+        self._hline_artists = []
+        self._background = None
+        self._base_ylim = None
+        self._drawn_hlines = None
 
-        assert df_source is not None
-        df = df_source.copy()
-
-        # Resample based on period
-        if period_key == "5Y":
-            df = (
-                df.resample("ME")
-                .agg({"Open": "first", "High": "max", "Low": "min", "Close": "last"})
-                .dropna()
-            )
-        elif period_key == "1Y":
-            df = (
-                df.resample("W")
-                .agg({"Open": "first", "High": "max", "Low": "min", "Close": "last"})
-                .dropna()
-            )
-
-        # Require valid OHLC after resampling
-        df = df.dropna(subset=["Open", "High", "Low", "Close"])
         if df.empty:
             self._show_no_data("Insufficient data for resampling")
             logging.getLogger(__name__).warning(
@@ -162,18 +204,19 @@ class BaseChart(ttk.Frame):
         )
 
         # ---------------------------------------------------------------------
-        # 3) Build moving-average addplots (50d & 200d using last 300 days)
+        # 2) Build moving-average addplots (50d & 200d using last 300 days)
         #     (attach to external Axes via ax=self.ax)
         # ---------------------------------------------------------------------
-        ma_addplots = build_ma_addplots(self.df_source, df, self.ax)
+        ma_addplots = build_ma_addplots(self.df_source, df, self.ax, daily_mas=self._daily_mas)
 
         # ---------------------------------------------------------------------
-        # 4) Build hlines for mplfinance (from stored_horizontal_lines + lines)
+        # 3) Build hlines for mplfinance from the caller's 'lines' (stored
+        #    horizontal lines are drawn separately as animated artists)
         # ---------------------------------------------------------------------
-        hline_kwargs = prepare_mpf_hlines(self.horizontal_lines, lines)
+        hline_kwargs = prepare_mpf_hlines([], lines)
 
         # ---------------------------------------------------------------------
-        # 5) Build final addplot payload (merge caller's addplot with our MAs)
+        # 4) Build final addplot payload (merge caller's addplot with our MAs)
         # ---------------------------------------------------------------------
         final_addplot: Optional[Any] = None
 
@@ -188,7 +231,7 @@ class BaseChart(ttk.Frame):
             final_addplot = ma_addplots
 
         # ---------------------------------------------------------------------
-        # 6) Call mplfinance.plot
+        # 5) Call mplfinance.plot
         # ---------------------------------------------------------------------
         plot_kwargs = {
             "type": "candle",
@@ -205,6 +248,7 @@ class BaseChart(ttk.Frame):
             plot_kwargs["addplot"] = final_addplot
 
         mpf.plot(df, **plot_kwargs)
+        self._base_ylim = self.ax.get_ylim()
 
         # Axis labels and grid
         self.ax.set_xlabel("Date", fontsize=9)
@@ -216,20 +260,60 @@ class BaseChart(ttk.Frame):
         min_p, max_p = df["Low"].min(), df["High"].max()
         self.ax.set_title(f"Range: R{min_p:.2f} - R{max_p:.2f}", fontsize=10)
 
-        # Legend for horizontal lines
-        add_legend_for_hlines(self.ax, self.horizontal_lines)
+        # Stored horizontal lines + their legend, with the y-range pinned the
+        # same way later line edits compute it
+        self._draw_hline_artists()
+        self.ax.set_ylim(self._ylim_for_lines())
 
         self.fig.tight_layout()
 
         # Store display df for cursor mapping
         self.df_display = df
 
-        # Draw canvas
-        self.canvas.draw()
+        # Schedule the render rather than drawing now: the same Figure/canvas
+        # is reused across reloads, and callers usually follow a plot with
+        # set_horizontal_lines (or flick on to the next ticker), so coalescing
+        # leaves one full draw per Tk idle instead of one per call
+        self.canvas.draw_idle()
         logging.getLogger(__name__).debug(
-            "  [BaseChart:%s] Canvas drawn.", self.period_label
+            "  [BaseChart:%s] Canvas draw scheduled.", self.period_label
         )
 
+    def plot_async(self, data: Any, period_key: Optional[str], lines: Optional[Any] = None):
+        """Like plot(data, period_key), but the DataFrame work runs on a worker thread.
+
+        Only the matplotlib/mplfinance drawing happens back on the Tk thread.
+        If another load starts first, this result is dropped.
+        """
+        self._plot_seq += 1
+        seq = self._plot_seq
+
+        def _apply(prepared):
+            if seq != self._plot_seq:
+                return
+            try:
+                self.plot(data, period_key, lines=lines, _prepared=prepared)
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "  [BaseChart:%s] Plot failed", self.period_label
+                )
+
+        def _done(fut):
+            try:
+                prepared = fut.result()
+            except Exception as e:
+                logging.getLogger(__name__).exception(
+                    "  [BaseChart:%s] Preparing chart data failed", self.period_label
+                )
+                prepared = (None, None, None, f"Error preparing data: {e}")
+            try:
+                self.after(0, _apply, prepared)
+            except Exception:
+                # Widget destroyed while the worker ran
+                pass
+
+        _PREP_POOL.submit(_prepare_frames, data, period_key).add_done_callback(_done)
+
     # -------------------------------------------------------------------------
     # Mouse interaction
     # -------------------------------------------------------------------------
@@ -289,29 +373,111 @@ class BaseChart(ttk.Frame):
         if self.df_source is not None and self.last_period_key is not None:
             self.plot(_reuse_source=True)
 
+    def _draw_hline_artists(self):
+        """(Re)create the stored horizontal lines and legend as animated artists."""
+        for artist in self._hline_artists:
+            try:
+                artist.remove()
+            except Exception:
+                pass
+        self._hline_artists = []
+
+        for price, color, label in self.horizontal_lines:
+            try:
+                y = float(price)
+            except Exception:
+                continue
+            linestyle, linewidth = hline_style(label)
+            self._hline_artists.append(
+                self.ax.axhline(
+                    y, color=color, linestyle=linestyle, linewidth=linewidth,
+                    alpha=0.7, animated=True,
+                )
+            )
+
+        self._drawn_hlines = list(self.horizontal_lines)
+
+        add_legend_for_hlines(self.ax, self.horizontal_lines)
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.set_animated(True)
+            self._hline_artists.append(legend)
+
+    def _on_draw(self, event):
+        """After every full draw, cache the background and paint the lines on top."""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._hline_artists:
+            self.ax.draw_artist(artist)
+
+    def _update_horizontal_lines(self):
+        """Show the stored lines, blitting them over the cached candles when possible."""
+        if self.df_display is None or self._base_ylim is None:
+            self._replot_with_current_data()
+            return
+
+        self._draw_hline_artists()
+
+        ylim = self._ylim_for_lines()
+        if ylim != tuple(self.ax.get_ylim()):
+            # A level outside the candle range (now or before) changes the
+            # y-limits: rescale and redraw the canvas, but keep the plotted
+            # candles and MAs rather than re-running mplfinance
+            self.ax.set_ylim(ylim)
+            self._background = None
+            self.canvas.draw_idle()
+            return
+
+        if self._background is None:
+            # Nothing cached yet; the next full draw paints the lines
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._background)
+        for artist in self._hline_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+    def _ylim_for_lines(self) -> Tuple[float, float]:
+        """The candles' y-limits, stretched (with a small margin) to cover every stored line."""
+        lo, hi = self._base_ylim
+        prices = []
+        for price, _color, _label in self.horizontal_lines:
+            try:
+                prices.append(float(price))
+            except Exception:
+                continue
+        if not prices or (lo <= min(prices) and max(prices) <= hi):
+            return (lo, hi)
+        lo, hi = min(lo, min(prices)), max(hi, max(prices))
+        pad = (hi - lo) * 0.05
+        return (lo - pad, hi + pad)
+
     def add_horizontal_line(self, price: float, color: str, label: str):
-        """Store a horizontal line level and re-plot using mplfinance hlines."""
+        """Store a horizontal line level and draw it."""
         try:
             price = float(price)
         except Exception:
             return
 
         self.horizontal_lines.append((price, color, label))
-        self._replot_with_current_data()
+        self._update_horizontal_lines()
 
     def clear_horizontal_lines(self):
-        """Clear all horizontal line levels and re-plot."""
+        """Clear all horizontal line levels."""
         self.horizontal_lines.clear()
-        self._replot_with_current_data()
+        self._update_horizontal_lines()
 
     def redraw_horizontal_lines(self):
-        """Re-plot chart to ensure stored lines are rendered."""
-        self._replot_with_current_data()
+        """Ensure stored lines are rendered."""
+        self._update_horizontal_lines()
 
     def set_horizontal_lines(self, items: List[Tuple[float, str, str]]):
         """Replace stored horizontal lines with the provided items."""
         self.horizontal_lines = list(items)
-        self._replot_with_current_data()
+        if self.horizontal_lines == self._drawn_hlines:
+            # Already on screen (e.g. a save that did not move any level)
+            return
+        self._update_horizontal_lines()
 
     def get_cursor_y(self) -> Optional[float]:
         """Return the latest cursor y-position or None."""
@@ -323,6 +489,13 @@ class BaseChart(ttk.Frame):
     def _show_no_data(self, message: str):
         """Displays a message on the chart area when no data is available."""
         self.ax.clear()
+        self._hline_artists = []
+        self._background = None
+        self._base_ylim = None
+        self._drawn_hlines = None
+        # Nothing is plotted, so there is no candle frame to map the cursor or
+        # blit lines onto
+        self.df_display = None
         self.ax.text(0.5, 0.5, message, ha="center", va="center", fontsize=12)
         self.ax.set_title("No Data", fontsize=10)
         self.fig.tight_layout()
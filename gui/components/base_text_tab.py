@@ -1,8 +1,9 @@
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import TOP, X, RIGHT, Y, LEFT, BOTH, WORD, END, NORMAL
+from ttkbootstrap.constants import TOP, X, RIGHT, Y, LEFT, BOTH, WORD, NORMAL
 import logging
 from ttkbootstrap.dialogs import Messagebox
 from components.button_utils import run_bg_with_button, wrap_sync_button
+from components.text_utils import mark_text_clean, set_text, text_or_none
 
 
 class BaseTextTab(ttk.Frame):
@@ -47,12 +48,36 @@ class BaseTextTab(ttk.Frame):
     def load_content(self, content):
         """Fills the text widget with content."""
         self.text_widget.config(state=NORMAL)
-        self.text_widget.delete("1.0", END)
-        self.text_widget.insert("1.0", content if content else "No data available.")
+        set_text(self.text_widget, content if content else "No data available.")
+
+    def load_unsaved_content(self, content):
+        """Fill the widget with content not yet persisted (e.g. AI output).
+
+        The widget is flagged as modified so Save writes it even though the
+        user has not typed anything.
+        """
+        self.load_content(content)
+        try:
+            self.text_widget.edit_modified(True)
+        except Exception:
+            pass
+
+    def is_dirty(self):
+        """Return True if the text has been edited since it was last loaded or saved."""
+        try:
+            return bool(self.text_widget.edit_modified())
+        except Exception:
+            # If the modified flag is unavailable, always treat as dirty
+            return True
 
     def get_content(self):
         """Returns the current content of the text widget."""
-        return self.text_widget.get("1.0", END).strip()
+        # end-1c excludes the trailing newline Tk always appends
+        return self.text_widget.get("1.0", "end-1c").strip()
+
+    def get_save_content(self):
+        """Returns the text to persist, or None if the widget is blank."""
+        return text_or_none(self.text_widget)
 
     def save_content(self):
         """Placeholder for the save method. Must be implemented by subclasses."""
@@ -73,13 +98,26 @@ class BaseTextTab(ttk.Frame):
             # non-fatal if logging introspection fails
             pass
 
+        # Nothing edited since the last load/save: skip the database write.
+        if not self.is_dirty():
+            logging.getLogger(__name__).info(
+                "_safe_save: %s for %s unchanged; skipping save", self.__class__.__name__, getattr(self, 'ticker', None)
+            )
+            return
+
         # If the subclass provides an async-saving coroutine factory `save_async`
         # and the UI has a background runner (`async_run_bg`) then prefer to
         # run the coroutine in the background while disabling the save button.
         try:
             if hasattr(self, "async_run_bg") and getattr(self, "async_run_bg") and hasattr(self, "save_async") and callable(getattr(self, "save_async")):
                 try:
-                    run_bg_with_button(self.save_btn, self.async_run_bg, self.save_async())
+                    saved_content = self.get_save_content()
+                    run_bg_with_button(
+                        self.save_btn,
+                        self.async_run_bg,
+                        self._save_and_confirm(self.save_async()),
+                        callback=lambda ok: self._mark_clean(saved_content) if ok else None,
+                    )
                     return
                 except Exception:
                     logging.getLogger(__name__).exception("Failed to start background save via run_bg_with_button; falling back to sync save")
@@ -96,4 +134,18 @@ class BaseTextTab(ttk.Frame):
                     pass
         except Exception:
             # Catch any unexpected error to avoid crashing the UI
-            logging.getLogger(__name__).exception("Unexpected error in _safe_save for %s", self.__class__.__name__)
\ No newline at end of file
+            logging.getLogger(__name__).exception("Unexpected error in _safe_save for %s", self.__class__.__name__)
+
+    @staticmethod
+    async def _save_and_confirm(coro):
+        """Await a save coroutine and return True so callers can tell success from failure."""
+        await coro
+        return True
+
+    def _mark_clean(self, saved_content):
+        """Clear the modified flag if the widget still holds what was saved."""
+        try:
+            if self.get_save_content() == saved_content:
+                mark_text_clean(self.text_widget)
+        except Exception:
+            pass
@@ -1,14 +1,16 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import TOP, X, BOTH, NONE, W, E, VERTICAL, LEFT, RIGHT, Y, END
 import matplotlib.pyplot as plt
+import asyncio
 import logging
 from datetime import date
 
 # --- NEW IMPORT ---
 from modules.data.market import get_historical_prices
-from modules.data.metrics import get_stock_metrics
+from modules.data.metrics import get_stock_metrics, get_next_release_date
 from core.db.engine import DBEngine
 from components.base_chart import BaseChart
+from components.analysis_service import chart_cache_get, chart_cache_put
 
 
 class ChartWindow(ttk.Toplevel):
@@ -54,7 +56,13 @@ class ChartWindow(ttk.Toplevel):
             title_frame,
             text=f"{self.ticker} - Historical Price Charts",
             font=("Helvetica", 16, "bold"),
-        ).pack()
+        ).pack(side=LEFT, expand=True)
+        ttk.Button(
+            title_frame,
+            text="Refresh",
+            bootstyle="info-outline",
+            command=self.refresh,
+        ).pack(side=RIGHT, padx=5)
 
         # Create Notebook for tabs
         self.notebook = ttk.Notebook(self, bootstyle="primary")
@@ -134,21 +142,37 @@ class ChartWindow(ttk.Toplevel):
         
         return frame
 
-    def load_charts(self):
+    def refresh(self):
+        """Reload the charts from the database, ignoring the cached payload."""
+        self.load_charts(force=True)
+
+    def load_charts(self, force=False):
         """Load and display all charts asynchronously to avoid blocking the GUI."""
         logging.getLogger(__name__).debug("[ChartWindow] load_charts called.")
         periods = {"3M": 90}
+        ticker = self.ticker
 
-        async def _fetch():
+        async def _fetch_levels():
             # Fetch saved horizontal-line prices
             saved_levels = []
             try:
+                # Prices come back already in rands as float8, which asyncpg
+                # decodes straight to Python floats (no per-value Decimal
+                # conversion and division here)
                 async_query = """
                     SELECT 
-                        w.entry_price, w.stop_loss, w.target_price,
-                        (SELECT array_agg(spl.price_level) FROM stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'support') as support_levels,
-                        (SELECT array_agg(spl.price_level) FROM stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'resistance') as resistance_levels
+                        w.entry_price / 100.0::float8 AS entry_price,
+                        w.stop_loss / 100.0::float8 AS stop_loss,
+                        w.target_price / 100.0::float8 AS target_price,
+                        lv.support_levels, lv.resistance_levels
                     FROM watchlist w
+                    LEFT JOIN LATERAL (
+                        SELECT
+                            array_agg(spl.price_level / 100.0::float8) FILTER (WHERE spl.level_type = 'support') AS support_levels,
+                            array_agg(spl.price_level / 100.0::float8) FILTER (WHERE spl.level_type = 'resistance') AS resistance_levels
+                        FROM stock_price_levels spl
+                        WHERE spl.ticker = w.ticker
+                    ) lv ON true
                     WHERE w.ticker = $1
                 """
                 rows = await DBEngine.fetch(async_query, self.ticker)
@@ -161,39 +185,52 @@ class ChartWindow(ttk.Toplevel):
                     raw_resistances = row.get("resistance_levels") or []
 
                     if raw_entry is not None:
-                        price_r = float(raw_entry) / 100.0
-                        saved_levels.append((price_r, "blue", f"Entry: R{price_r:.2f}"))
+                        saved_levels.append((raw_entry, "blue", f"Entry: R{raw_entry:.2f}"))
                     if raw_stop is not None:
-                        price_r = float(raw_stop) / 100.0
-                        saved_levels.append((price_r, "red", f"Stop Loss: R{price_r:.2f}"))
+                        saved_levels.append((raw_stop, "red", f"Stop Loss: R{raw_stop:.2f}"))
                     if raw_target is not None:
-                        price_r = float(raw_target) / 100.0
-                        saved_levels.append((price_r, "green", f"Target: R{price_r:.2f}"))
+                        saved_levels.append((raw_target, "green", f"Target: R{raw_target:.2f}"))
 
                     for p in raw_supports:
                         if p is not None:
-                            price_r = float(p) / 100.0
-                            saved_levels.append((price_r, "green", f"Support: R{price_r:.2f}"))
+                            saved_levels.append((p, "green", f"Support: R{p:.2f}"))
 
                     for p in raw_resistances:
                         if p is not None:
-                            price_r = float(p) / 100.0
-                            saved_levels.append((price_r, "red", f"Resistance: R{price_r:.2f}"))
+                            saved_levels.append((p, "red", f"Resistance: R{p:.2f}"))
             except Exception:
                 saved_levels = []
+            return saved_levels
 
-            # Fetch period data
-            period_results = {}
-            for period_key, days in periods.items():
-                data = await get_historical_prices(self.ticker, days)
-                period_results[period_key] = data
+        async def _fetch():
+            # The queries are independent, so run them side by side on the
+            # pool instead of paying one round trip after another.
+            period_keys = list(periods)
+            saved_levels, metrics, next_release, *period_data = await asyncio.gather(
+                _fetch_levels(),
+                get_stock_metrics(self.ticker),
+                _fetch_next_release(),
+                *(get_historical_prices(self.ticker, periods[k]) for k in period_keys),
+            )
 
-            # Fetch metrics
-            metrics = await get_stock_metrics(self.ticker)
+            return {
+                "saved_levels": saved_levels,
+                "periods": dict(zip(period_keys, period_data)),
+                "metrics": metrics,
+                "next_release": next_release,
+            }
 
-            return {"saved_levels": saved_levels, "periods": period_results, "metrics": metrics}
+        async def _fetch_next_release():
+            try:
+                return await get_next_release_date(self.ticker)
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "[ChartWindow] Failed to load next release date for %s", self.ticker
+                )
+                return None
 
         def _on_loaded(result):
+            result = result or {}
             saved_levels = result.get("saved_levels", [])
             for period_key, data in result.get("periods", {}).items():
                 chart = self.charts.get(period_key)
@@ -206,20 +243,41 @@ class ChartWindow(ttk.Toplevel):
                     chart.plot(data, period_key)
 
             # Load metrics using fetched metrics
-            self.load_metrics(metrics=result.get("metrics"))
+            self.load_metrics(metrics=result.get("metrics"), next_release=result.get("next_release"))
+
+        cached = None if force else chart_cache_get(ticker)
+        if cached is not None:
+            _on_loaded(cached)
+            return
+
+        def _on_fetched(result):
+            if result is not None:
+                chart_cache_put(ticker, result)
+            _on_loaded(result)
 
         try:
-            self.async_run_bg(_fetch(), callback=_on_loaded)
+            self.async_run_bg(_fetch(), callback=_on_fetched)
         except Exception:
             # fallback to synchronous behavior if background runner fails
             try:
                 saved_levels = []
+                # Prices come back already in rands as float8, which asyncpg
+                # decodes straight to Python floats (no per-value Decimal
+                # conversion and division here)
                 async_query = """
                     SELECT 
-                        w.entry_price, w.stop_loss, w.target_price,
-                        (SELECT array_agg(spl.price_level) FROM stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'support') as support_levels,
-                        (SELECT array_agg(spl.price_level) FROM stock_price_levels spl WHERE spl.ticker = w.ticker AND spl.level_type = 'resistance') as resistance_levels
+                        w.entry_price / 100.0::float8 AS entry_price,
+                        w.stop_loss / 100.0::float8 AS stop_loss,
+                        w.target_price / 100.0::float8 AS target_price,
+                        lv.support_levels, lv.resistance_levels
                     FROM watchlist w
+                    LEFT JOIN LATERAL (
+                        SELECT
+                            array_agg(spl.price_level / 100.0::float8) FILTER (WHERE spl.level_type = 'support') AS support_levels,
+                            array_agg(spl.price_level / 100.0::float8) FILTER (WHERE spl.level_type = 'resistance') AS resistance_levels
+                        FROM stock_price_levels spl
+                        WHERE spl.ticker = w.ticker
+                    ) lv ON true
                     WHERE w.ticker = $1
                 """
                 rows = self.async_run(DBEngine.fetch(async_query, self.ticker))
@@ -242,85 +300,49 @@ class ChartWindow(ttk.Toplevel):
                 self.load_metrics()
             except Exception:
                 logging.getLogger(__name__).warning("[ChartWindow]   -> Failed to load charts (fallback): %s", exc_info=True)
-    def load_metrics(self, metrics=None):
-        """Load and display stock metrics. If metrics are provided, use them; otherwise fetch asynchronously."""
+    def load_metrics(self, metrics=None, next_release=None):
+        """Load and display stock metrics. If metrics are provided, use them; otherwise fetch in the background."""
         # Clear existing items
         for item in self.metrics_tree.get_children():
             self.metrics_tree.delete(item)
 
-        def _render_metrics(metrics):
+        # Helper to format and insert
+        def add_row(label, value, fmt="{}", tags=None):
+            display_val = fmt.format(value) if value is not None else "N/A"
+            if tags:
+                self.metrics_tree.insert("", END, values=(label, display_val), tags=tags)
+            else:
+                self.metrics_tree.insert("", END, values=(label, display_val))
+
+        def _render_metrics(metrics, next_event_date=None):
             if not metrics:
                 self.metrics_tree.insert("", END, values=("Status", "No metrics data available"))
-                return
-
-            # Helper to format and insert
-            def add_row(label, value, fmt="{}", tags=None):
-                display_val = fmt.format(value) if value is not None else "N/A"
-                if tags:
-                    self.metrics_tree.insert("", END, values=(label, display_val), tags=tags)
-                else:
-                    self.metrics_tree.insert("", END, values=(label, display_val))
+            else:
+                # Current Price (already in rands)
+                add_row("Current Price", metrics.get('current_price') or None, "R {:.2f}")
 
-            # Current Price
-            price = metrics.get('current_price')
-            add_row("Current Price", price/100 if price else None, "R {:.2f}")
+                # P/E Ratio
+                add_row("P/E Ratio", metrics.get('pe_ratio'), "{:.2f}")
 
-            # P/E Ratio
-            add_row("P/E Ratio", metrics.get('pe_ratio'), "{:.2f}")
+                # Dividend Yield
+                add_row("Dividend Yield", metrics.get('div_yield_perc'), "{:.2f}%")
 
-            # Dividend Yield
-            add_row("Dividend Yield", metrics.get('div_yield_perc'), "{:.2f}%")
+                # PEG Ratio (Historical)
+                add_row("PEG Ratio (Hist)", metrics.get('peg_ratio_historical'), "{:.2f}")
 
-            # PEG Ratio (Historical)
-            add_row("PEG Ratio (Hist)", metrics.get('peg_ratio_historical'), "{:.2f}")
+                # Graham Fair Value
+                add_row("Graham Fair Value", metrics.get('graham_fair_value') or None, "R {:.2f}")
 
-            # Graham Fair Value
-            gfv = metrics.get('graham_fair_value')
-            add_row("Graham Fair Value", gfv/100 if gfv else None, "R {:.2f}")
+                # Valuation Premium
+                add_row("Valuation Premium", metrics.get('valuation_premium_perc'), "{:.2f}%")
 
-            # Valuation Premium
-            add_row("Valuation Premium", metrics.get('valuation_premium_perc'), "{:.2f}%")
+                # Historical Growth CAGR
+                add_row("Hist. Growth CAGR", metrics.get('historical_growth_cagr'), "{:.2f}%")
 
-            # Historical Growth CAGR
-            add_row("Hist. Growth CAGR", metrics.get('historical_growth_cagr'), "{:.2f}%")
-            
-            # Financials Date
-            add_row("Financials Date", metrics.get('financials_date'), "{}")
-
-        if metrics is not None:
-            _render_metrics(metrics)
-            return
-
-        # Fetch metrics asynchronously
-        try:
-            # Prefer background runner if available
-            if hasattr(self, 'async_run_bg') and self.async_run_bg:
-                self.async_run_bg(get_stock_metrics(self.ticker), callback=_render_metrics)
-            else:
-                # Fallback to synchronous fetch if background runner is not available
-                metrics = self.async_run(get_stock_metrics(self.ticker))
-                _render_metrics(metrics)
-        except Exception:
-            try:
-                metrics = self.async_run(get_stock_metrics(self.ticker))
-            except Exception:
-                metrics = None
-            _render_metrics(metrics)
-        # Next results release date (estimated): same logic as fetch_watchlist_data
-        # Uses the 2nd most recent results_release_date + 1 year.
-        try:
-            next_release_q = """
-                SELECT (results_release_date + interval '1 year')::date AS next_event_date
-                FROM raw_stock_valuations
-                WHERE ticker = $1
-                ORDER BY results_release_date DESC
-                LIMIT 1 OFFSET 1
-            """
-            rows = self.async_run(DBEngine.fetch(next_release_q, self.ticker))
-            next_event_date = None
-            if rows:
-                next_event_date = rows[0].get("next_event_date")
+                # Financials Date
+                add_row("Financials Date", metrics.get('financials_date'), "{}")
 
+            # Next results release date (estimated): same logic as fetch_watchlist_data
             soon_tags = None
             try:
                 if next_event_date is not None:
@@ -335,8 +357,27 @@ class ChartWindow(ttk.Toplevel):
                 soon_tags = None
 
             add_row("Next Release Date", next_event_date, "{}", tags=soon_tags)
+
+        if metrics is not None:
+            _render_metrics(metrics, next_release)
+            return
+
+        async def _fetch():
+            metrics = await get_stock_metrics(self.ticker)
+            try:
+                next_event_date = await get_next_release_date(self.ticker)
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "[ChartWindow] Failed to load next release date for %s", self.ticker
+                )
+                next_event_date = None
+            return metrics, next_event_date
+
+        # Fetch metrics in the background so the Tk thread never waits on the DB
+        try:
+            self.async_run_bg(_fetch(), callback=lambda res: _render_metrics(*(res or (None, None))))
         except Exception:
-            logging.getLogger(__name__).exception(
-                "[ChartWindow] Failed to load next release date for %s", self.ticker
+            logging.getLogger(__name__).warning(
+                "[ChartWindow] Failed to schedule metrics load for %s", self.ticker, exc_info=True
             )
-            add_row("Next Release Date", None, "{}")
+            _render_metrics(None)
@@ -36,17 +36,17 @@ class DeepResearchTab(BaseTextTab):
         """Saves the content of the text widget to the database."""
         # Prevent saves during ticker transition/loading
         if self._loading:
-            logger.warning(f"[DeepResearch] Blocked save during load for {self.ticker}")
+            logger.warning("[DeepResearch] Blocked save during load for %s", self.ticker)
             return
             
-        content = self.get_content()
+        content = self.get_save_content()
         
         # Log what we're attempting to save
-        logger.info(f"[DeepResearch] save_content called for {self.ticker}, content length: {len(content) if content else 0}")
+        logger.debug("[DeepResearch] save_content called for %s, content length: %s", self.ticker, len(content) if content else 0)
         
         # Prevent saving blank content or placeholder text
         if not content or content == "No data available.":
-            logger.warning(f"[DeepResearch] Blocked blank save for {self.ticker}")
+            logger.warning("[DeepResearch] Blocked blank save for %s", self.ticker)
             try:
                 Messagebox.show_warning(
                     "Cannot Save Empty Content",
@@ -70,31 +70,31 @@ class DeepResearchTab(BaseTextTab):
     def save_async(self):
         # Prevent saves during ticker transition/loading
         if self._loading:
-            logger.warning(f"[DeepResearch] Blocked save_async during load for {self.ticker}")
+            logger.warning("[DeepResearch] Blocked save_async during load for %s", self.ticker)
             raise ValueError("Cannot save during content loading")
             
-        content = self.get_content()
+        content = self.get_save_content()
         
         # Log what we're attempting to save
-        logger.info(f"[DeepResearch] save_async called for {self.ticker}, content length: {len(content) if content else 0}")
+        logger.debug("[DeepResearch] save_async called for %s, content length: %s", self.ticker, len(content) if content else 0)
         
         # Prevent saving blank content or placeholder text
         if not content or content == "No data available.":
-            logger.warning(f"[DeepResearch] Blocked blank save_async for {self.ticker}")
+            logger.warning("[DeepResearch] Blocked blank save_async for %s", self.ticker)
             raise ValueError("Cannot save empty deep research content")
         
-        logger.info(f"[DeepResearch] Proceeding with save for {self.ticker}")
+        logger.info("[DeepResearch] Proceeding with save for %s", self.ticker)
         return save_deep_research_data(self.ticker, content)
     
     def load_content(self, content):
         """Override to set loading flag during content load."""
         self._loading = True
-        logger.info(f"[DeepResearch] load_content called for {self.ticker}, setting loading=True")
+        logger.debug("[DeepResearch] load_content called for %s, setting loading=True", self.ticker)
         try:
             super().load_content(content)
         finally:
             self._loading = False
-            logger.info(f"[DeepResearch] load_content complete for {self.ticker}, setting loading=False")
+            logger.debug("[DeepResearch] load_content complete for %s, setting loading=False", self.ticker)
 
     def _on_spot_price_clicked(self):
         """Handler for the 'Share price at spot' button.
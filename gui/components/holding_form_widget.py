@@ -1,6 +1,17 @@
+import re
 import tkinter as tk
 import ttkbootstrap as ttk
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
+
+# Plain decimal number as typed, e.g. "12", "12.5", ".5", "12."
+_NUMBER_RE = re.compile(r"^\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)\s*$")
+
+
+def _parse_number(raw: str) -> Optional[float]:
+    """Return `raw` as a float, or None while it is empty or half-typed."""
+    if not raw or not _NUMBER_RE.match(raw):
+        return None
+    return float(raw)
 
 
 class HoldingFormWidget(ttk.Frame):
@@ -22,14 +33,36 @@ class HoldingFormWidget(ttk.Frame):
         self.avg_entry.grid(row=2, column=1, padx=6, pady=2, sticky="ew")
         self.columnconfigure(1, weight=1)
         self.change_callback = change_callback
+        self._change_after_id = None
         if change_callback:
-            self.ticker_var.trace_add("write", lambda *a: change_callback())
-            self.qty_var.trace_add("write", lambda *a: change_callback())
-            self.avg_var.trace_add("write", lambda *a: change_callback())
+            for var in (self.ticker_var, self.qty_var, self.avg_var):
+                var.trace_add("write", self._schedule_change)
+
+    def _schedule_change(self, *_args):
+        # set_values/clear and pastes write several vars at once; run the
+        # callback once when Tk is idle instead of once per write
+        if self._change_after_id is None:
+            self._change_after_id = self.after_idle(self._fire_change)
+
+    def _fire_change(self):
+        self._change_after_id = None
+        self.change_callback()
 
     def get_values(self):
         return (self.ticker_var.get().strip(), self.qty_var.get(), self.avg_var.get())
 
+    def get_parsed_values(self) -> Tuple[str, Optional[float], Optional[float]]:
+        """Like get_values, with quantity and price parsed (None if not numeric).
+
+        Used by the per-keystroke form validation so partial input such as
+        "12." never goes through float()'s exception path.
+        """
+        return (
+            self.ticker_var.get().strip(),
+            _parse_number(self.qty_var.get()),
+            _parse_number(self.avg_var.get()),
+        )
+
     def set_values(self, ticker: str, qty: str, avg: str):
         self.ticker_var.set(ticker or "")
         self.qty_var.set(qty or "")
@@ -6,6 +6,7 @@ import logging
 
 # Import notification/alert functions
 from modules.data.research import get_action_logs, mark_log_read, delete_action_log
+from core.utils.dates import format_minutes
 
 logger = logging.getLogger(__name__)
 
@@ -242,7 +243,7 @@ class NotificationWidget(ttk.Frame):
                         time_str = log_time[:16]  # ISO format, take first 16 chars
                     else:
                         try:
-                            time_str = log_time.strftime("%Y-%m-%d %H:%M")
+                            time_str = format_minutes(log_time)
                         except Exception:
                             time_str = str(log_time)[:16]
 
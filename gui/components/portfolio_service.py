@@ -11,6 +11,7 @@ import logging
 import asyncio
 
 from core.db.engine import DBEngine
+from components.analysis_service import invalidate_analysis_cache
 from modules.data.market import get_latest_price
 
 logger = logging.getLogger(__name__)
@@ -170,6 +171,7 @@ class PortfolioService:
                         await DBEngine.execute("INSERT INTO watchlist (ticker, status) VALUES ($1, $2)", ticker, "Active-Trade")
                 except Exception:
                     logger.exception("Failed to mark watchlist status for %s", ticker)
+                invalidate_analysis_cache(ticker)
         except Exception:
             logger.exception("Upsert holding failed")
 
@@ -229,6 +231,7 @@ class PortfolioService:
                     logger.info("Marked watchlist status for %s -> WL-Active", ticker)
                 except Exception:
                     logger.exception("Failed to mark watchlist status for %s", ticker)
+                invalidate_analysis_cache(ticker)
 
             return True
         except Exception:
@@ -12,6 +12,7 @@ from components.holdings_widget import HoldingsWidget
 from components.holding_form_widget import HoldingFormWidget
 from components.totals_status_widget import TotalsStatusWidget
 from components.button_utils import run_bg_with_button
+from components.analysis_service import invalidate_chart_cache
 
 logger = logging.getLogger(__name__)
 
@@ -203,7 +204,7 @@ class PortfolioWindow(ttk.Toplevel):
         try:
             # update status and use helper to disable the button while running
             self.status_label.configure(text="Downloading latest prices...")
-            run_bg_with_button(self.get_prices_btn, self.async_run_bg, run_price_update(), callback=self._on_prices_fetched)
+            run_bg_with_button(self.get_prices_btn, self.async_run_bg, run_price_update(refresh_tickers=True), callback=self._on_prices_fetched)
         except Exception:
             logger.exception("Failed starting price download")
             try:
@@ -215,6 +216,8 @@ class PortfolioWindow(ttk.Toplevel):
         try:
             # result is typically None; refresh data
             self.status_label.configure(text="Latest prices downloaded")
+            # Cached chart payloads hold the previous prices
+            invalidate_chart_cache()
             # reload portfolios + holdings (they will refresh totals via the existing hooks)
             try:
                 self.load_portfolios()
@@ -443,23 +446,16 @@ class PortfolioWindow(ttk.Toplevel):
                 return False
 
             # ticker required
-            ticker, qty_text, avg_text = self.form_widget.get_values() if hasattr(self, "form_widget") else ("", "", "")
-            ticker = (ticker or "").strip()
+            ticker, qty, avg = self.form_widget.get_parsed_values() if hasattr(self, "form_widget") else ("", None, None)
             if not ticker:
                 self.add_update_btn.configure(state="disabled")
                 return False
 
-            # quantity and avg price must be numeric
-            qty_text = (qty_text or "").strip()
-            avg_text = (avg_text or "").strip()
-            if qty_text == "" or avg_text == "":
+            # quantity and avg price must be numeric (None while empty or half-typed)
+            if qty is None or avg is None:
                 self.add_update_btn.configure(state="disabled")
                 return False
 
-            # try parse
-            float(qty_text)
-            float(avg_text)
-
             # everything looked ok -> enable
             self.add_update_btn.configure(state="normal")
             return True
@@ -31,7 +31,7 @@ class ResearchTab(BaseTextTab):
 
     def save_content(self):
         """Saves the content of the text widget to the database."""
-        content = self.get_content()
+        content = self.get_save_content()
         import logging
         logger = logging.getLogger(__name__)
         logger.debug("ResearchTab.save_content called for %s (len=%d)", self.ticker, len(content) if content is not None else 0)
@@ -56,7 +56,7 @@ class ResearchTab(BaseTextTab):
 
     def save_async(self):
         """Create the coroutine used to save current research content."""
-        content = self.get_content()
+        content = self.get_save_content()
         import logging
         logging.getLogger(__name__).debug("ResearchTab.save_async for %s (len=%d)", self.ticker, len(content) if content is not None else 0)
         return save_research_data(self.ticker, content)
@@ -90,7 +90,11 @@ class ResearchTab(BaseTextTab):
             if hasattr(self, "async_run_bg") and self.async_run_bg:
                 def on_generated(result):
                     try:
-                        self.load_content(result)
+                        # None means generation failed; nothing to save then
+                        if result:
+                            self.load_unsaved_content(result)
+                        else:
+                            self.load_content(result)
                     except Exception:
                         logger.exception("Failed applying generated research result to UI")
 
@@ -103,7 +107,7 @@ class ResearchTab(BaseTextTab):
 
             new_research = self.async_run(generate_master_research(self.ticker, deep_research_content))
             # Update UI
-            self.load_content(new_research)
+            self.load_unsaved_content(new_research)
             logger.info("Research generation complete.")
         except Exception as e:
             logger.exception("Error generating research")
@@ -3,14 +3,12 @@ from ttkbootstrap.constants import TOP, X, BOTH
 
 # --- NEW IMPORT ---
 from modules.data.research import (
-    get_research_data,
-    get_sens_for_ticker,
     save_strategy_data,
     save_research_data,
     save_deep_research_data,
     get_action_logs,
     mark_log_read,
-    get_stock_category,
+    get_research_bundle,
 )
 from modules.analysis.engine import generate_master_research
 from components.deep_research_tab import DeepResearchTab
@@ -49,33 +47,17 @@ class ResearchWindow(ttk.Toplevel):
 
     def on_action_log_notification(self, payload: str):
         """Callback for DB notifications to reload the action log."""
-        self.after(0, self.action_log_tab.load_action_logs)
+        if self.action_log_tab is not None:
+            self.after(0, self.action_log_tab.load_action_logs)
 
     def update_ticker(self, ticker):
         """Update the window with a new ticker"""
         self.ticker = ticker
         self.title(f"{ticker} - Research & Action Log")
         
-        # Update title label if present (do this asynchronously to avoid blocking)
+        # Title (with category) is refreshed by load_research below
         if hasattr(self, 'title_label'):
-            def _on_category_loaded(category):
-                if category:
-                    self.title_label.configure(text=f"{ticker} — {category} — Research & Analysis")
-                else:
-                    self.title_label.configure(text=f"{ticker} - Research & Analysis")
-
-            try:
-                self.async_run_bg(get_stock_category(ticker), callback=_on_category_loaded)
-            except Exception:
-                # fallback to synchronous fetch if background runner fails
-                try:
-                    category = self.async_run(get_stock_category(ticker))
-                except Exception:
-                    category = None
-                if category:
-                    self.title_label.configure(text=f"{ticker} — {category} — Research & Analysis")
-                else:
-                    self.title_label.configure(text=f"{ticker} - Research & Analysis")
+            self.title_label.configure(text=f"{ticker} - Research & Analysis")
         else:
             # fallback: search existing label
             for widget in self.winfo_children():
@@ -89,7 +71,8 @@ class ResearchWindow(ttk.Toplevel):
         self.deep_research_tab.ticker = ticker
         self.master_strategy_tab.ticker = ticker
         self.master_research_tab.ticker = ticker
-        self.action_log_tab.ticker = ticker
+        if self.action_log_tab is not None:
+            self.action_log_tab.ticker = ticker
 
         self.load_research()
 
@@ -124,57 +107,68 @@ class ResearchWindow(ttk.Toplevel):
         self.notebook.add(self.master_strategy_tab, text="Strategy")
         self.notebook.add(self.master_research_tab, text="Research")
 
-        self.sens_tab = SensTab(self.notebook)
-        self.notebook.add(self.sens_tab, text="SENS")
-
-        self.action_log_tab = ActionLogTab(self.notebook, self.ticker, self.async_run, self.async_run_bg)
-        self.notebook.add(self.action_log_tab, text="Action Log")
+        # SENS and Action Log start as empty placeholders; the real tab (and
+        # the action log query) is only built the first time it is opened.
+        self.sens_tab = None
+        self.action_log_tab = None
+        self._sens_data = None
+        self._lazy_tabs = {}
+        for text, build in (("SENS", self._build_sens_tab), ("Action Log", self._build_action_log_tab)):
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=text)
+            self._lazy_tabs[str(placeholder)] = (placeholder, build)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event=None):
+        entry = self._lazy_tabs.pop(self.notebook.select(), None)
+        if entry is not None:
+            placeholder, build = entry
+            build(placeholder)
+
+    def _build_sens_tab(self, placeholder):
+        self.sens_tab = SensTab(placeholder)
+        self.sens_tab.pack(fill=BOTH, expand=True)
+        self.sens_tab.load_content(self._sens_data)
+
+    def _build_action_log_tab(self, placeholder):
+        self.action_log_tab = ActionLogTab(placeholder, self.ticker, self.async_run, self.async_run_bg)
+        self.action_log_tab.pack(fill=BOTH, expand=True)
+        self.action_log_tab.load_action_logs()
 
     def load_research(self):
-        """Load research data without blocking the GUI by using background tasks."""
-        def _on_research_loaded(data):
-            # Update title/category asynchronously
-            try:
-                self.async_run_bg(
-                    get_stock_category(self.ticker),
-                    callback=lambda category: self.title_label.configure(text=f"{self.ticker} — {category} — Research & Analysis") if category else self.title_label.configure(text=f"{self.ticker} - Research & Analysis"),
-                )
-            except Exception:
-                # fallback: sync fetch
-                try:
-                    category = self.async_run(get_stock_category(self.ticker))
-                except Exception:
-                    category = None
-                if category:
-                    self.title_label.configure(text=f"{self.ticker} — {category} — Research & Analysis")
-                else:
-                    self.title_label.configure(text=f"{self.ticker} - Research & Analysis")
+        """Load research, SENS and category in one background fetch without blocking the GUI."""
+        def _set_title(category):
+            if category:
+                self.title_label.configure(text=f"{self.ticker} — {category} — Research & Analysis")
+            else:
+                self.title_label.configure(text=f"{self.ticker} - Research & Analysis")
+
+        def _on_bundle_loaded(bundle):
+            bundle = bundle or {}
+            data = bundle.get("research")
+
+            _set_title(bundle.get("category"))
 
             # Delegate loading to child tabs (immediate update from fetched data)
             self.deep_research_tab.load_content(data.get("deepresearch") if data else None)
             self.master_strategy_tab.load_content(data.get("strategy") if data else None)
             self.master_research_tab.load_content(data.get("research") if data else None)
+            # Kept for the SENS tab in case it has not been opened yet
+            self._sens_data = bundle.get("sens")
+            if self.sens_tab is not None:
+                self.sens_tab.load_content(self._sens_data)
 
-            # Load SENS data asynchronously
-            try:
-                self.async_run_bg(get_sens_for_ticker(self.ticker), callback=lambda s: self.sens_tab.load_content(s))
-            except Exception:
-                try:
-                    s = self.async_run(get_sens_for_ticker(self.ticker))
-                except Exception:
-                    s = None
-                self.sens_tab.load_content(s)
-
-            # Refresh action log (non-blocking)
-            self.action_log_tab.load_action_logs()
+            # Refresh action log (non-blocking) once its tab exists
+            if self.action_log_tab is not None:
+                self.action_log_tab.load_action_logs()
 
-        # Kick off the background fetch for the main research payload
+        # Kick off a single background fetch for the whole research payload
         try:
-            self.async_run_bg(get_research_data(self.ticker), callback=_on_research_loaded)
+            self.async_run_bg(get_research_bundle(self.ticker), callback=_on_bundle_loaded)
         except Exception:
             # fallback: synchronous fetch if background runner fails
             try:
-                data = self.async_run(get_research_data(self.ticker))
+                bundle = self.async_run(get_research_bundle(self.ticker))
             except Exception:
-                data = None
-            _on_research_loaded(data)
+                bundle = None
+            _on_bundle_loaded(bundle)
@@ -1,5 +1,8 @@
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import HORIZONTAL, BOTH, VERTICAL, LEFT, RIGHT, Y, WORD, END, NORMAL, DISABLED
+from ttkbootstrap.constants import HORIZONTAL, BOTH, VERTICAL, LEFT, RIGHT, Y, WORD, END, DISABLED
+
+from components.text_utils import set_text
+from core.utils.dates import format_minutes
 
 
 class SensTab(ttk.Frame):
@@ -52,13 +55,21 @@ class SensTab(ttk.Frame):
         self.sens_map.clear()
 
         if sens_data:
-            for item in sens_data:
-                d_str = item["publication_datetime"].strftime("%Y-%m-%d %H:%M")
+            # Build the display rows first, then hand each one to Tk as a
+            # tuple with an explicit iid so the lookup map needs no
+            # round trip back from the tree.
+            rows = [None] * len(sens_data)
+            for i, item in enumerate(sens_data):
+                d_str = format_minutes(item["publication_datetime"])
                 content = item["content"]
-                first_line = content.strip().split("\n")[0] if content else "No content"
-
-                iid = self.tree.insert("", END, values=(d_str, first_line))
+                first_line = content.strip().split("\n", 1)[0] if content else "No content"
+                iid = str(i)
+                rows[i] = (iid, (d_str, first_line))
                 self.sens_map[iid] = content
+
+            insert = self.tree.insert
+            for iid, values in rows:
+                insert("", END, iid=iid, values=values)
         else:
             self.tree.insert("", END, values=("", "No SENS announcements found."))
 
@@ -69,7 +80,5 @@ class SensTab(ttk.Frame):
         item_id = selection[0]
         content = self.sens_map.get(item_id, "Content not found.")
 
-        self.text_widget.config(state=NORMAL)
-        self.text_widget.delete("1.0", END)
-        self.text_widget.insert("1.0", content)
-        self.text_widget.config(state=DISABLED)
\ No newline at end of file
+        self.text_widget.config(state=DISABLED)
+        set_text(self.text_widget, content)
\ No newline at end of file
@@ -4,6 +4,7 @@ from tkinter import messagebox
 from typing import Callable, Optional
 
 from modules.data.watchlist import set_watchlist_status
+from components.analysis_service import invalidate_analysis_cache
 import logging
 from components.button_utils import run_bg_with_button
 
@@ -66,6 +67,7 @@ class StatusWidget(ttk.Frame):
         logger.info("StatusWidget._on_done called for %s result=%s", self.ticker_getter(), result)
 
         if result:
+            invalidate_analysis_cache(self.ticker_getter())
             messagebox.showinfo("Success", f"Status for {self.ticker_getter()} set to {self.status_var.get()}")
             if callable(self.on_saved):
                 try:
@@ -1,4 +1,5 @@
 from modules.data.research import save_strategy_data
+from components.analysis_service import invalidate_analysis_cache
 from components.base_text_tab import BaseTextTab
 from components.button_utils import run_bg_with_button
 import logging
@@ -6,6 +7,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+async def _save_strategy(ticker, content):
+    """Save the strategy and drop the ticker's cached analysis row."""
+    try:
+        return await save_strategy_data(ticker, content)
+    finally:
+        invalidate_analysis_cache(ticker)
+
+
 class StrategyTab(BaseTextTab):
     """A tab for displaying and editing the investment strategy."""
 
@@ -15,18 +24,18 @@ class StrategyTab(BaseTextTab):
 
     def save_content(self):
         """Saves the content of the text widget to the database."""
-        content = self.get_content()
+        content = self.get_save_content()
         # Provide save_async factory for BaseTextTab to run in background
         if hasattr(self, "async_run_bg") and self.async_run_bg:
             try:
-                run_bg_with_button(self.save_btn, self.async_run_bg, save_strategy_data(self.ticker, content))
+                run_bg_with_button(self.save_btn, self.async_run_bg, _save_strategy(self.ticker, content))
                 return
             except Exception:
                 pass
 
-        self.async_run(save_strategy_data(self.ticker, content))
+        self.async_run(_save_strategy(self.ticker, content))
 
     def save_async(self):
-        content = self.get_content()
-        return save_strategy_data(self.ticker, content)
+        content = self.get_save_content()
+        return _save_strategy(self.ticker, content)
         logger.info("Strategy saved for %s", self.ticker)
\ No newline at end of file
@@ -13,6 +13,7 @@ from core.utils.technical_utils import (
     update_analysis_db,
 )
 from core.utils.chart_drawing_utils import build_lines_from_state
+from core.utils.trading import upside_pct
 from components.analysis_service import fetch_analysis, delete_price_level
 from components.analysis_control_panel import AnalysisControlPanel
 from components.status_widget import StatusWidget
@@ -48,6 +49,8 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
         self.support_levels = []
         self.resistance_levels = []
         # Horizontal-line storage handled by BaseChart.horizontal_lines
+        # Pending coalesced level redraw (see _schedule_draw_levels)
+        self._levels_after_id = None
         
         # Zone detection settings
         self.zone_settings = dict(ZoneSettingsDialog.DEFAULTS)
@@ -248,13 +251,12 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
             # Let BaseChart handle candles ONLY (no lines)
             # We do NOT add horizontal lines here because calling canvas.draw() after mpf.plot() clears the candles
             # Lines will only appear when user presses 'e', 'l', or 't' keys
+            # The frame build/resampling (heaviest for 5 Years) runs off the
+            # Tk thread; the candles are drawn when it lands
             logging.getLogger(__name__).debug(
-                "[TechAnalysis] Calling BaseChart.plot() with period_key=%s", period_key
-            )
-            self.chart.plot(data, period_key, lines=None)
-            logging.getLogger(__name__).debug(
-                "[TechAnalysis] BaseChart.plot() completed - candles rendered"
+                "[TechAnalysis] Calling BaseChart.plot_async() with period_key=%s", period_key
             )
+            self.chart.plot_async(data, period_key, lines=None)
             # Ensure window stays on top after chart loads
             try:
                 self.lift()
@@ -290,49 +292,29 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
         strategy          = values["strategy"]
 
         # --- 2) Convert GUI values (rand) back to cents for DB ---
-        entry_c  = int(self.entry_price * 100)   if self.entry_price  is not None else None
-        target_c = int(self.target_price * 100)  if self.target_price is not None else None
-        stop_c   = int(self.stop_loss * 100)     if self.stop_loss    is not None else None
+        #     (round, not int(): 0.29 * 100 is 28.999... in floating point)
+        entry_c  = round(self.entry_price * 100)  if self.entry_price  is not None else None
+        target_c = round(self.target_price * 100) if self.target_price is not None else None
+        stop_c   = round(self.stop_loss * 100)    if self.stop_loss    is not None else None
         # Persist the support/res lists (in cents) - send None if empty
         support_cs = None
         resistance_cs = None
         if getattr(self, 'support_levels', None):
-            support_cs = [int(p * 100) for (_id, p) in self.support_levels if p is not None]
+            support_cs = [round(p * 100) for (_id, p) in self.support_levels if p is not None]
         if getattr(self, 'resistance_levels', None):
-            resistance_cs = [int(p * 100) for (_id, p) in self.resistance_levels if p is not None]
-
-        # --- 3) Clear existing lines on the chart ---
-        clearer = getattr(self.chart, "clear_horizontal_lines", None)
-        if callable(clearer):
-            clearer()
-        else:
-            # If BaseChart doesn't provide clear_horizontal_lines (very old instances),
-            # skip explicit clearing and rely on the chart API to manage state.
-            logging.getLogger(__name__).warning(
-                "[TechAnalysis] clear_horizontal_lines not available — skipping explicit clear"
-            )
+            resistance_cs = [round(p * 100) for (_id, p) in self.resistance_levels if p is not None]
+
+        # --- 3) Redraw the lines from the UPDATED prices in one update ---
+        lines = build_lines_from_state(
+            self.entry_price,
+            self.stop_loss,
+            self.target_price,
+            getattr(self, 'support_levels', None),
+            getattr(self, 'resistance_levels', None),
+        )
+        self.chart.set_horizontal_lines(lines)
 
-        # --- 4) Draw new lines from the UPDATED prices ---
-        if self.entry_price is not None:
-            self.chart.add_horizontal_line(
-                self.entry_price, 'blue', f'Entry: R{self.entry_price:.2f}'
-            )
-        if self.stop_loss is not None:
-            self.chart.add_horizontal_line(
-                self.stop_loss, 'red', f'Stop Loss: R{self.stop_loss:.2f}'
-            )
-        if self.target_price is not None:
-            self.chart.add_horizontal_line(
-                self.target_price, 'green', f'Target: R{self.target_price:.2f}'
-            )
-        for (_id, p) in getattr(self, 'support_levels', []) or []:
-            if p is not None:
-                self.chart.add_horizontal_line(p, 'green', f'Support: R{p:.2f}')
-        for (_id, p) in getattr(self, 'resistance_levels', []) or []:
-            if p is not None:
-                self.chart.add_horizontal_line(p, 'red', f'Resistance: R{p:.2f}')
-
-        # --- 5) Direction flag ---
+        # --- 4) Direction flag ---
         is_long = True
         if self.entry_price is not None and self.target_price is not None:
             is_long = self.target_price > self.entry_price
@@ -345,7 +327,7 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
             str(is_long),
         )
 
-        # --- 6) Persist to DB in CENTS ---
+        # --- 5) Persist to DB in CENTS ---
         # offload DB updates to helper that performs the same async operations
         async def update_db_wrapper():
             await self.data_manager.update_analysis(self.ticker, entry_c, stop_c, target_c, is_long, strategy, support_cs, resistance_cs)
@@ -402,15 +384,14 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 except Exception:
                     pass
                 try:
-                    self._draw_all_levels()
+                    self._schedule_draw_levels()
                 except Exception:
                     logging.getLogger(__name__).exception('Failed redrawing after support deletion')
                 return
 
             # Delete persisted level from DB
             async def delete_task():
-                await self.data_manager.delete_price_level(level_id)
-                # No-op: leave for context (ensures we still call delete).
+                return await self.data_manager.delete_price_level(level_id)
             # Optimistically remove it from our in-memory list + UI so chart updates immediately
             try:
                 for i, (lid, p) in enumerate(self.support_levels):
@@ -422,14 +403,17 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 except Exception:
                     pass
                 try:
-                    self._draw_all_levels()
+                    self._schedule_draw_levels()
                 except Exception:
                     logging.getLogger(__name__).exception('Failed optimistic redraw after support delete')
             except Exception:
                 pass
 
-            def on_deleted(_res=None):
-                # refresh to reflect deleted row
+            def on_deleted(ok=None):
+                # The level is already gone from the panel and chart; only
+                # reload (restoring it) if the delete did not go through
+                if ok:
+                    return
                 try:
                     self.load_existing_data()
                 except Exception:
@@ -455,13 +439,13 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 except Exception:
                     pass
                 try:
-                    self._draw_all_levels()
+                    self._schedule_draw_levels()
                 except Exception:
                     logging.getLogger(__name__).exception('Failed redrawing after resistance deletion')
                 return
 
             async def delete_task():
-                await self.data_manager.delete_price_level(level_id)
+                return await self.data_manager.delete_price_level(level_id)
 
             # Optimistically remove persisted level from our in-memory list + UI and redraw
             try:
@@ -474,13 +458,15 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 except Exception:
                     pass
                 try:
-                    self._draw_all_levels()
+                    self._schedule_draw_levels()
                 except Exception:
                     logging.getLogger(__name__).exception('Failed optimistic redraw after resistance delete')
             except Exception:
                 pass
 
-            def on_deleted(_res=None):
+            def on_deleted(ok=None):
+                if ok:
+                    return
                 try:
                     self.load_existing_data()
                 except Exception:
@@ -490,6 +476,29 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
         except Exception:
             logging.getLogger(__name__).exception('Failed processing delete resistance request')
 
+    def _schedule_draw_levels(self):
+        """Redraw the levels shortly, coalescing back-to-back state changes.
+
+        Loads, deletes and zone detection each update several pieces of state
+        in a row; they all land in one set_horizontal_lines built from the
+        latest state when the timer fires.
+        """
+        if self._levels_after_id is not None:
+            try:
+                self.after_cancel(self._levels_after_id)
+            except Exception:
+                pass
+        # A keypress draw still pending in the drawer holds older lines; the
+        # redraw below covers it
+        drawer = getattr(self, 'analysis_drawer', None)
+        if drawer is not None:
+            drawer.cancel()
+        self._levels_after_id = self.after(50, self._flush_draw_levels)
+
+    def _flush_draw_levels(self):
+        self._levels_after_id = None
+        self._draw_all_levels()
+
     def _draw_all_levels(self):
         """Rebuild the chart horizontal lines from the in-memory levels and entry/target/stop."""
         try:
@@ -503,8 +512,9 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
         except Exception:
             logging.getLogger(__name__).exception('Failed building levels to draw')
             lines = []
+        # An empty list is applied too, so removing the last level clears it
         setter = getattr(self.chart, 'set_horizontal_lines', None)
-        if callable(setter) and lines:
+        if callable(setter):
             try:
                 setter(lines)
             except Exception:
@@ -530,19 +540,10 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 self.entry_price = self.data_manager.price_from_db(raw_entry)
                 self.target_price = self.data_manager.price_from_db(raw_target)
                 self.stop_loss = self.data_manager.price_from_db(raw_stop)
-                # Build lists of persisted (id, price) tuples
-                try:
-                    self.support_levels = []
-                    for _id, p in zip(raw_support_ids, raw_support_prices):
-                        self.support_levels.append((int(_id) if _id is not None else None, self.data_manager.price_from_db(p)))
-                except Exception:
-                    self.support_levels = []
-                try:
-                    self.resistance_levels = []
-                    for _id, p in zip(raw_res_ids, raw_res_prices):
-                        self.resistance_levels.append((int(_id) if _id is not None else None, self.data_manager.price_from_db(p)))
-                except Exception:
-                    self.resistance_levels = []
+                # Build lists of persisted (id, price) tuples; level ids are
+                # ints and prices already floats in rands from the query
+                self.support_levels = list(zip(raw_support_ids, raw_support_prices))
+                self.resistance_levels = list(zip(raw_res_ids, raw_res_prices))
                 strategy = data.get("strategy")
                 status = data.get("status")
 
@@ -569,30 +570,9 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 except Exception:
                     logging.getLogger(__name__).exception("Failed updating status widget")
 
-                # Pass the prices to BaseChart so it can draw them after the plot
-                to_store = self.data_manager.saved_levels_from_row(data)
-                # We'll build a full final lines list below including support/resistance
-
-                # Build the full set of lines from DB and in-memory levels
-                try:
-                    # to_store includes entry/target/stop from DB via build_saved_levels_from_row
-                    if getattr(self, 'support_levels', None):
-                        for (_id, p) in self.support_levels:
-                            if p is not None:
-                                to_store.append((p, 'green', f'Support: R{p:.2f}'))
-                except Exception:
-                    pass
-                try:
-                    if getattr(self, 'resistance_levels', None):
-                        for (_id, p) in self.resistance_levels:
-                            if p is not None:
-                                to_store.append((p, 'red', f'Resistance: R{p:.2f}'))
-                except Exception:
-                    pass
-                if to_store:
-                    setter = getattr(self.chart, "set_horizontal_lines", None)
-                    if callable(setter):
-                        setter(to_store)
+                # One line set built from the state loaded above (entry/target/
+                # stop plus support/resistance), applied in a single update
+                self._schedule_draw_levels()
                 # Update navigation state in case parent watchlist changed
                 try:
                     self._update_navigation_state()
@@ -650,11 +630,7 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                         if hasattr(self, 'entry_price') and self.entry_price is not None:
                             is_long = self.target_price > self.entry_price
 
-                        if is_long:
-                            gain = (self.target_price - cp) / cp * 100
-                        else:
-                            gain = (cp - self.target_price) / cp * 100
-
+                        gain = upside_pct(cp, self.target_price, is_long)
                         upside_str = f"Upside: {abs(float(gain)):.1f}%"
                         self.upside_label.config(text=upside_str)
                     else:
@@ -721,7 +697,7 @@ class TechnicalAnalysisWindow(ttk.Toplevel):
                 logging.getLogger(__name__).exception('Failed updating analysis panel with detected zones')
 
             try:
-                self._draw_all_levels()
+                self._schedule_draw_levels()
             except Exception:
                 logging.getLogger(__name__).exception('Failed drawing detected zones')
         except Exception:
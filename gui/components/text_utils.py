@@ -0,0 +1,85 @@
+"""Helpers for filling Tk Text widgets without needless buffer rewrites.
+
+Usage:
+  from components.text_utils import set_text
+
+  set_text(self.text_widget, content)
+
+`set_text` remembers a short digest of the last text it wrote to a widget.
+If the same text is written again and the user has not edited the widget
+since, the delete+insert is skipped entirely, which keeps large documents
+(deep research, SENS bodies) cheap when the same ticker or item is
+re-selected.
+"""
+from typing import Any
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def set_text(widget: Any, text: str) -> bool:
+    """Replace the contents of a Text widget, skipping the rewrite if unchanged.
+
+    Works on read-only (DISABLED) widgets too: the original state is restored
+    afterwards. Returns True if the widget was rewritten.
+    """
+    text = text or ""
+    digest = _digest(text)
+    try:
+        if getattr(widget, "_text_digest", None) == digest and not widget.edit_modified():
+            return False
+    except Exception:
+        # edit_modified unsupported; fall through and rewrite
+        pass
+
+    state = None
+    try:
+        state = str(widget.cget("state"))
+        if state != "normal":
+            widget.configure(state="normal")
+    except Exception:
+        state = None
+
+    widget.replace("1.0", "end-1c", text)
+
+    try:
+        widget.edit_modified(False)
+    except Exception:
+        pass
+    widget._text_digest = digest
+
+    if state and state != "normal":
+        try:
+            widget.configure(state=state)
+        except Exception:
+            logger.debug("set_text: could not restore widget state %s", state)
+    return True
+
+
+def mark_text_clean(widget: Any) -> None:
+    """Record the widget's current buffer as unmodified (e.g. after a save).
+
+    The digest is taken from what is on screen, so a later set_text of the
+    last *loaded* text is not mistaken for a no-op.
+    """
+    widget._text_digest = _digest(widget.get("1.0", "end-1c"))
+    try:
+        widget.edit_modified(False)
+    except Exception:
+        pass
+
+
+def text_or_none(widget: Any):
+    """Return a Text widget's contents for saving, or None if blank.
+
+    Reads up to end-1c so Tk's trailing newline is never copied, and uses
+    isspace() rather than strip() so a large buffer is not re-allocated
+    just to test for emptiness.
+    """
+    s = widget.get("1.0", "end-1c")
+    return s if s and not s.isspace() else None
@@ -1,28 +1,32 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH, TOP, X, LEFT, RIGHT, VERTICAL, Y, W, E, CENTER, END
+import logging
+from collections import deque
 from datetime import date, datetime
 
 # --- UPDATED IMPORTS ---
 # 1. Utilities moved to core
-from core.utils.trading import get_proximity_status
+from core.utils.trading import get_proximity_status, upside_pct
 
 # 2. Data fetching moved to modules
 from modules.data.watchlist import fetch_watchlist_data
 from components.watchlist_sorting import sort_watchlist_records, sort_treeview_column
 
-# 3. Child windows (Note: These will need refactoring next)
-from components.chart_window import ChartWindow
-from components.research_window import ResearchWindow
-from components.technical_analysis_window import TechnicalAnalysisWindow
+# 3. Child widgets. The technical analysis and portfolio windows pull in
+# matplotlib/pandas, so they are imported when first opened instead of here.
 from components.todo_widget import TodoWidget
 from components.notification_widget import NotificationWidget
 # Sorting logic is implemented in `components.watchlist_sorting` to reduce the
 # size of this module and make sorting reusable across the project.
 
-from components.portfolio_window import PortfolioWindow
-
 
 class WatchlistWidget(ttk.Frame):
+    # Rows inserted per after() callback when rendering the watchlist
+    _RENDER_CHUNK = 200
+    # Delay used to coalesce rapid filter changes into one re-render
+    _FILTER_DEBOUNCE_MS = 150
+    _COLUMNS = ("Ticker", "Name", "Price", "Proximity", "BTE", "Event", "RR", "PEG", "Upside", "Strategy")
+
     def __init__(self, parent, on_select_callback, async_run, async_run_bg, notifier):
         # CHANGED: Removed 'db_layer' from arguments, added async_run_bg
         super().__init__(parent)
@@ -32,8 +36,24 @@ class WatchlistWidget(ttk.Frame):
         self.notifier = notifier
 
         # Cache the last loaded rows so the dropdown filter can re-render
-        # without re-querying the DB.
+        # without re-querying the DB. Rows are kept pre-sorted, and each row's
+        # Treeview item outlives filter changes (hidden rows are detached,
+        # not deleted), so re-filtering neither re-sorts nor re-formats.
         self._watchlist_last_data = []
+        self._tree_iids = set()
+        # Display values per item, as inserted, so column sorts read them
+        # from Python instead of asking Tk for every cell
+        self._tree_values = {}
+        self._tree_day = None
+        self._visible_iids = []
+        # Bumped per refresh so a slower, superseded fetch cannot overwrite
+        # the rows of a newer one
+        self._refresh_generation = 0
+
+        # Rows still waiting to be inserted by a chunked render.
+        self._pending_rows = deque()
+        self._render_after_id = None
+        self._filter_after_id = None
 
         # Tickers whose new-deepresearch highlight has been acknowledged (clicked).
         self._dr_acknowledged: set[str] = set()
@@ -128,10 +148,10 @@ class WatchlistWidget(ttk.Frame):
             width=12,
         )
         self.watchlist_filter_combo.pack(side=LEFT, padx=2)
-        self.watchlist_filter_combo.bind("<<ComboboxSelected>>", lambda e: self._render_watchlist())
+        self.watchlist_filter_combo.bind("<<ComboboxSelected>>", self._schedule_render)
 
         # --- COLUMNS ---
-        cols = ("Ticker", "Name", "Price", "Proximity", "BTE", "Event", "RR", "PEG", "Upside", "Strategy")
+        cols = self._COLUMNS
         self.tree = ttk.Treeview(parent_frame, columns=cols, show="headings")
 
         self.tree.heading("Ticker", text="Ticker")
@@ -185,8 +205,10 @@ class WatchlistWidget(ttk.Frame):
 
     def get_ordered_tickers(self):
         """Return the list of tickers in the tree, in display order."""
+        self._flush_pending_rows()
         try:
-            return [self.tree.item(i)["values"][0] for i in self.tree.get_children("")]
+            # Rows are inserted with iid=ticker, so the iids are the tickers
+            return list(self.tree.get_children(""))
         except Exception:
             return []
 
@@ -200,15 +222,30 @@ class WatchlistWidget(ttk.Frame):
 
 
     def refresh_watchlist(self):
-        """Refresh watchlist data (non-blocking)."""
+        """Refresh watchlist data (non-blocking).
+
+        The fetch and the sort both run on the background loop; the Tk thread
+        only swaps the result in and streams rows into the tree.
+        """
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+
+        async def _fetch_sorted():
+            # Filtering keeps order, so sorting once here covers every
+            # later re-render.
+            return sort_watchlist_records(await fetch_watchlist_data())
+
         def on_data_loaded(data):
+            if generation != self._refresh_generation:
+                return
             # Cache rows for client-side filtering.
             self._watchlist_last_data = data or []
+            self._clear_tree_items()
 
             # Render immediately (applies current dropdown filter).
             self._render_watchlist()
 
-        self.async_run_bg(fetch_watchlist_data(), callback=on_data_loaded)
+        self.async_run_bg(_fetch_sorted(), callback=on_data_loaded)
 
     def _get_filtered_watchlist_rows(self, rows):
         """Apply the toolbar dropdown filter to watchlist rows."""
@@ -233,179 +270,233 @@ class WatchlistWidget(ttk.Frame):
         if filter_type == "pre-trade":
             return [r for r in rows if (r.get("status") == "Pre-Trade")]
         if filter_type == "no-research":
-            def has_research(r):
-                v = r.get("deepresearch")
-                if v is None:
-                    return False
-                return str(v).strip() != ""
-
-            return [r for r in rows if not has_research(r)]
+            return [r for r in rows if not r.get("has_deepresearch")]
 
         # Unknown selection -> no filtering.
         return list(rows)
 
+    def _schedule_render(self, event=None):
+        """Debounce filter changes so a burst of selections re-renders once."""
+        if self._filter_after_id is not None:
+            try:
+                self.after_cancel(self._filter_after_id)
+            except Exception:
+                pass
+        self._filter_after_id = self.after(self._FILTER_DEBOUNCE_MS, self._on_filter_debounced)
+
+    def _on_filter_debounced(self):
+        self._filter_after_id = None
+        self._render_watchlist()
+
     def _render_watchlist(self):
-        """Re-render the treeview from cached rows, applying the dropdown filter."""
+        """Re-render the treeview from cached rows, applying the dropdown filter.
+
+        The first _RENDER_CHUNK rows are inserted immediately so the visible
+        part of the list paints at once; the remainder is streamed in via
+        short after() callbacks so large watchlists never block the Tk loop.
+        Rows that already have an item are only re-attached.
+        """
         data = self._get_filtered_watchlist_rows(self._watchlist_last_data)
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Cancel any chunked render still in progress from a previous call
+        if self._render_after_id is not None:
+            try:
+                self.after_cancel(self._render_after_id)
+            except Exception:
+                pass
+            self._render_after_id = None
+        self._pending_rows.clear()
+
+        if date.today() != self._tree_day:
+            # Day counts and the new-research highlight depend on the date
+            self._clear_tree_items()
+
+        # Rows were sorted on load so the most important status groups come
+        # first; duplicate tickers keep their first row
+        self._visible_iids = list(dict.fromkeys(row["ticker"] for row in data))
+        self._pending_rows.extend(row for row in data if row["ticker"] not in self._tree_iids)
+        self._insert_pending_rows()
+
+    def _clear_tree_items(self):
+        """Delete every row item, attached or detached."""
+        if self._tree_iids:
+            self.tree.delete(*self._tree_iids)
+            self._tree_iids.clear()
+            self._tree_values.clear()
+        self._tree_day = date.today()
+
+    def _insert_pending_rows(self, all_rows=False):
+        """Insert the next chunk of pending rows (or all of them) into the tree."""
+        self._render_after_id = None
+        today = self._tree_day
+        known = self._tree_iids
+        pending = self._pending_rows
+        insert = self.tree.insert
+        n = len(pending) if all_rows else min(self._RENDER_CHUNK, len(pending))
+        for _ in range(n):
+            row = pending.popleft()
+            if row["ticker"] in known:
+                # Duplicate ticker in the result set; keep the first row
+                logging.getLogger(__name__).debug("Skipping duplicate watchlist row for %s", row.get("ticker"))
+                continue
+            values, row_tag = self._format_watchlist_row(row, today)
+            # Use the ticker as the item id so handlers can read it by name
+            insert("", "end", iid=row["ticker"], values=values, tags=(row_tag,))
+            known.add(row["ticker"])
+            self._tree_values[row["ticker"]] = values
+        # One Tcl call attaches the visible rows in order and detaches the rest
+        self.tree.set_children("", *[iid for iid in self._visible_iids if iid in known])
+        if pending:
+            self._render_after_id = self.after(1, self._insert_pending_rows)
+
+    def _flush_pending_rows(self):
+        """Insert every row still waiting from a chunked render."""
+        if self._render_after_id is not None:
+            try:
+                self.after_cancel(self._render_after_id)
+            except Exception:
+                pass
+            self._render_after_id = None
+        if self._pending_rows:
+            self._insert_pending_rows(all_rows=True)
+
+    def _format_watchlist_row(self, row, today):
+        """Build the Treeview values tuple and background tag for one watchlist row."""
+        # 1. Event Days
+        next_date = row.get("next_event_date")
+        days_str = "-"
+
+        if next_date:
+            days_str = f"{next_date.toordinal() - today.toordinal()}d"
+
+        # 2. Background Tag
+        row_tag = ""
+        # Check if deep research was generated today.
+        dr_date = row.get("deepresearch_date")
+        dr_is_new = False
+        if dr_date is not None:
+            try:
+                if hasattr(dr_date, "date"):
+                    dr_is_new = dr_date.date() == today
+                else:
+                    dr_is_new = dr_date == today
+            except Exception:
+                pass
+
+        if row.get("unread_log_count", 0) > 0:
+            row_tag = "unread"
+        elif dr_is_new and row["ticker"] not in self._dr_acknowledged:
+            row_tag = "new_deepresearch"
+        elif row["is_holding"]:
+            row_tag = "holding"
+        elif row["status"] == "Pre-Trade":
+            row_tag = "pretrade"
+        elif not row.get("has_deepresearch"):
+            row_tag = "no_research"
+
+        # 3. Proximity Text
+        prox_text, _ = get_proximity_status(
+            row["close_price"], row["entry_price"], row["stop_loss"], row["target"], row.get("is_long", True)
+        )
 
-        if not data:
-            return
+        # If we have an entry but got no proximity due to missing price data,
+        # show a placeholder so the column remains populated and sortable.
+        if (prox_text is None or str(prox_text).strip() == "" or str(prox_text).strip().lower() == "no data") and row.get("entry_price") is not None:
+            try:
+                import logging
+                logging.getLogger(__name__).debug(
+                    "Proximity unavailable for %s (price=%s entry=%s stop=%s target=%s)",
+                    row.get("ticker"), row.get("close_price"), row.get("entry_price"), row.get("stop_loss"), row.get("target"),
+                )
+            except Exception:
+                pass
+            prox_text = "(N/A) Entry"
+
+        # 4. Truncate Text
+        strategy_text = str(row.get("strategy", "") or "").replace("\n", " ")
+        if len(strategy_text) > 100:
+            strategy_text = strategy_text[:100] + "..."
+
+        full_name = row["full_name"] if row["full_name"] else ""
+        short_name = full_name[:10]
+
+        price_val = row["close_price"]
+        price_str = f"{int(price_val)}" if price_val is not None else "-"
+
+        # 5. BTE (Better Than Entry): how much current price is better than entry
+        entry_price = row.get("entry_price")
+        is_long = row.get("is_long", True)
+        if entry_price is None or price_val is None:
+            bte_str = "-"
+        else:
+            try:
+                # BTE (Better Than Entry) should be positive when the current
+                # price is 'better' relative to entry for the trade direction.
+                # - For long positions: price < entry is better -> diff = entry - price
+                # - For short positions: price > entry is better -> diff = price - entry
+                if is_long:
+                    diff = entry_price - price_val
+                else:
+                    diff = price_val - entry_price
 
-        today = date.today()
-
-        # Sort incoming data so Treeview shows the most important status groups in the desired order
-        for row in sort_watchlist_records(data):
-            # 1. Event Days
-            next_date = row.get("next_event_date")
-            days_str = "-"
-
-            if next_date:
-                days = (next_date - today).days
-                days_str = f"{days}d"
-
-            # 2. Background Tag
-            row_tag = ""
-            # Check if deep research was generated today.
-            dr_date = row.get("deepresearch_date")
-            dr_is_new = False
-            if dr_date is not None:
-                try:
-                    if hasattr(dr_date, "date"):
-                        dr_is_new = dr_date.date() == today
-                    else:
-                        dr_is_new = dr_date == today
-                except Exception:
-                    pass
-
-            if row.get("unread_log_count", 0) > 0:
-                row_tag = "unread"
-            elif dr_is_new and row["ticker"] not in self._dr_acknowledged:
-                row_tag = "new_deepresearch"
-            elif row["is_holding"]:
-                row_tag = "holding"
-            elif row["status"] == "Pre-Trade":
-                row_tag = "pretrade"
-            elif not row.get("deepresearch"):
-                row_tag = "no_research"
-
-            # 3. Proximity Text
-            prox_text, _ = get_proximity_status(
-                row["close_price"], row["entry_price"], row["stop_loss"], row["target"], row.get("is_long", True)
-            )
-
-            # If we have an entry but got no proximity due to missing price data,
-            # show a placeholder so the column remains populated and sortable.
-            if (prox_text is None or str(prox_text).strip() == "" or str(prox_text).strip().lower() == "no data") and row.get("entry_price") is not None:
-                try:
-                    import logging
-                    logging.getLogger(__name__).debug(
-                        "Proximity unavailable for %s (price=%s entry=%s stop=%s target=%s)",
-                        row.get("ticker"), row.get("close_price"), row.get("entry_price"), row.get("stop_loss"), row.get("target"),
-                    )
-                except Exception:
-                    pass
-                prox_text = "(N/A) Entry"
-
-            # 4. Truncate Text
-            strategy_text = str(row.get("strategy", "") or "").replace("\n", " ")
-            if len(strategy_text) > 100:
-                strategy_text = strategy_text[:100] + "..."
-
-            full_name = row["full_name"] if row["full_name"] else ""
-            short_name = full_name[:10]
-
-            price_val = row["close_price"]
-            price_str = f"{int(price_val)}" if price_val is not None else "-"
-
-            # 5. BTE (Better Than Entry): how much current price is better than entry
-            entry_price = row.get("entry_price")
-            is_long = row.get("is_long", True)
-            if entry_price is None or price_val is None:
+                pct = (diff / entry_price) * 100 if entry_price != 0 else 0
+                sign = "+" if pct >= 0 else "-"
+                bte_str = f"{sign}{abs(pct):.2f}%"
+            except Exception:
                 bte_str = "-"
-            else:
-                try:
-                    # BTE (Better Than Entry) should be positive when the current
-                    # price is 'better' relative to entry for the trade direction.
-                    # - For long positions: price < entry is better -> diff = entry - price
-                    # - For short positions: price > entry is better -> diff = price - entry
-                    if is_long:
-                        diff = entry_price - price_val
-                    else:
-                        diff = price_val - entry_price
-
-                    pct = (diff / entry_price) * 100 if entry_price != 0 else 0
-                    sign = "+" if pct >= 0 else "-"
-                    bte_str = f"{sign}{abs(pct):.2f}%"
-                except Exception:
-                    bte_str = "-"
-
-            # Format RR (reward_risk_ratio) coming from DB (numeric/Decimal)
-            rr_val = row.get("reward_risk_ratio")
-            if rr_val is None:
-                rr_str = "-"
-            else:
-                try:
-                    rr_str = f"{float(rr_val):.2f}"
-                except Exception:
-                    rr_str = str(rr_val)
-
-            # PEG: use peg_ratio returned from fetch_watchlist_data if present
-            peg_val = row.get("peg_ratio") or row.get("peg_ratio_historical")
-            if peg_val is None:
-                peg_str = "-"
-            else:
-                try:
-                    peg_str = f"{float(peg_val):.2f}"
-                except Exception:
-                    peg_str = str(peg_val)
-
-            # 6. Upside: expected percent return if target is reached
-            target_val = row.get("target")
+
+        # Format RR (reward_risk_ratio) coming from DB (numeric/Decimal)
+        rr_val = row.get("reward_risk_ratio")
+        if rr_val is None:
+            rr_str = "-"
+        else:
             try:
-                # Upside should be the percent return from current price -> target
-                # For long: (target - current) / current
-                # For short: (current - target) / current
-                if price_val is None or target_val is None or price_val == 0:
-                    upside_str = "-"
-                else:
-                    if is_long:
-                        gain = (target_val - price_val) / price_val * 100
-                    else:
-                        gain = (price_val - target_val) / price_val * 100
-                    upside_str = f"{abs(float(gain)):.2f}%"
+                rr_str = f"{float(rr_val):.2f}"
+            except Exception:
+                rr_str = str(rr_val)
+
+        # PEG: use peg_ratio returned from fetch_watchlist_data if present
+        peg_val = row.get("peg_ratio") or row.get("peg_ratio_historical")
+        if peg_val is None:
+            peg_str = "-"
+        else:
+            try:
+                peg_str = f"{float(peg_val):.2f}"
             except Exception:
-                upside_str = "-"
-
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    row["ticker"],
-                    short_name,
-                    price_str,
-                    prox_text,
-                    bte_str,
-                    days_str,
-                    rr_str,
-                    peg_str,
-                    upside_str,
-                    strategy_text,
-                ),
-                tags=(row_tag,),
-            )
+                peg_str = str(peg_val)
+
+        # 6. Upside: expected percent return if target is reached
+        target_val = row.get("target")
+        try:
+            # Upside should be the percent return from current price -> target
+            # For long: (target - current) / current
+            # For short: (current - target) / current
+            gain = upside_pct(price_val, target_val, is_long)
+            upside_str = "-" if gain is None else f"{abs(float(gain)):.2f}%"
+        except Exception:
+            upside_str = "-"
+
+        values = (
+            row["ticker"],
+            short_name,
+            price_str,
+            prox_text,
+            bte_str,
+            days_str,
+            rr_str,
+            peg_str,
+            upside_str,
+            strategy_text,
+        )
+        return values, row_tag
 
     def _on_row_click(self, event):
         sel = self.tree.selection()
         if sel:
-            item = self.tree.item(sel[0])
-            ticker = item["values"][0]
+            ticker = sel[0]
 
             # Dismiss bright-red deep-research highlight on click.
-            if "new_deepresearch" in (item.get("tags") or ()):
+            if "new_deepresearch" in (self.tree.item(ticker, "tags") or ()):
                 self._dr_acknowledged.add(ticker)
                 self.tree.item(sel[0], tags=())
 
@@ -415,8 +506,7 @@ class WatchlistWidget(ttk.Frame):
         """Open chart and research windows when row is double-clicked"""
         sel = self.tree.selection()
         if sel:
-            item = self.tree.item(sel[0])
-            ticker = item["values"][0]
+            ticker = sel[0]
 
             # Open Chart and Research windows, creating them if they don't exist.
             # This logic is similar to on_ticker_select in main.py but is triggered by a double-click.
@@ -426,7 +516,16 @@ class WatchlistWidget(ttk.Frame):
     def sort_column(self, col, reverse):
         # Delegate the sorting to the centralized utility so this file remains
         # small and the logic can be reused / tested separately.
-        sort_treeview_column(self.tree, col, reverse)
+        self._flush_pending_rows()
+        idx = self._COLUMNS.index(col)
+        values = self._tree_values
+
+        def value_of(iid):
+            # Tk hands cell values back as strings; match that
+            val = values[iid][idx]
+            return "" if val is None else str(val)
+
+        sort_treeview_column(self.tree, col, reverse, value_of=value_of)
 
     def open_technical_analysis(self):
         """Open the Technical Analysis window for the selected ticker."""
@@ -434,13 +533,16 @@ class WatchlistWidget(ttk.Frame):
         if not sel:
             return
 
-        item = self.tree.item(sel[0])
-        ticker = item["values"][0]
-        
+        ticker = sel[0]
+
+        from components.technical_analysis_window import TechnicalAnalysisWindow
+
         TechnicalAnalysisWindow(self, ticker, self.async_run_bg, on_status_saved_callback=self.refresh)
 
     def open_portfolio_manager(self):
         # Open the portfolio manager window
+        from components.portfolio_window import PortfolioWindow
+
         PortfolioWindow(self, self.async_run, self.async_run_bg)
 
 
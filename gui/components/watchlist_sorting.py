@@ -1,7 +1,14 @@
-from datetime import date, datetime
+from datetime import date
 import re
 
 
+_STATUS_ORDER = {"Active-Trade": 0, "Pre-Trade": 1, "WL-Active": 2}
+_NO_EVENT = 999999
+# Status ranks are spaced wider than any possible days-to-event spread (day
+# ordinals stay below 4M), so rank and days fold into one integer sort key
+_STATUS_STRIDE = 10_000_000
+
+
 def sort_watchlist_records(rows, today=None):
     """Return rows sorted by status priority and days to next event.
 
@@ -10,25 +17,29 @@ def sort_watchlist_records(rows, today=None):
     """
     if today is None:
         today = date.today()
+    # Compare day ordinals so each row costs one int subtraction rather
+    # than building a timedelta
+    today_ord = today.toordinal()
+    status_order = _STATUS_ORDER.get
 
-    def _status_priority(s):
-        order = {"Active-Trade": 0, "Pre-Trade": 1, "WL-Active": 2}
-        return order.get(s, 3)
-
-    def _days_to_event(row):
-        next_date = row.get("next_event_date")
+    def _days_to_event(next_date):
         if not next_date:
-            return 999999
+            return _NO_EVENT
         try:
-            return (next_date - today).days
-        except Exception:
+            return next_date.toordinal() - today_ord
+        except AttributeError:
             try:
                 # Support string dates in ISO format as fallback
-                return (datetime.strptime(next_date, "%Y-%m-%d").date() - today).days
+                return date.fromisoformat(next_date).toordinal() - today_ord
             except Exception:
-                return 999999
+                return _NO_EVENT
 
-    return sorted(rows, key=lambda r: (_status_priority(r.get("status")), _days_to_event(r)))
+    # A single int per row compares in C; a (status, days) tuple key costs a
+    # tuple allocation per row and element-wise comparisons in the sort
+    return sorted(
+        rows,
+        key=lambda r: status_order(r.get("status"), 3) * _STATUS_STRIDE + _days_to_event(r.get("next_event_date")),
+    )
 
 
 # Treeview column sorting helper -------------------------------------------------
@@ -36,22 +47,28 @@ def sort_watchlist_records(rows, today=None):
 # early if the tree has no items or the column is unknown.
 
 
-def sort_treeview_column(tree, col, reverse=False):
+def sort_treeview_column(tree, col, reverse=False, value_of=None):
     """Sort a ttk.Treeview by the given column.
 
     Parameters
     - tree: ttk.Treeview instance
     - col: column name as displayed in the tree (e.g. "Event", "BTE")
     - reverse: bool
+    - value_of: optional callable(iid) -> the item's display string for
+      `col`, for callers that keep the inserted values; avoids one Tcl
+      round trip per row. Defaults to reading the cell from the tree.
 
-    The function moves the items in the tree to match the sorted order and
+    The function reorders the items in the tree to match the sorted order and
     re-registers the heading's command to toggle sorting.
     """
     items = tree.get_children("")
     if not items:
         return
 
-    l = [(tree.set(k, col), k) for k in items]
+    if value_of is None:
+        l = [(tree.set(k, col), k) for k in items]
+    else:
+        l = [(value_of(k), k) for k in items]
 
     if col == "Event":
 
@@ -123,12 +140,12 @@ def sort_treeview_column(tree, col, reverse=False):
     else:
         l.sort(reverse=reverse)
 
-    for index, (val, k) in enumerate(l):
-        tree.move(k, "", index)
+    # One Tcl call reorders every row instead of a move() per item
+    tree.set_children("", *[k for _val, k in l])
 
     # Replace heading with the appropriate toggling command
     try:
-        tree.heading(col, command=lambda: sort_treeview_column(tree, col, not reverse))
+        tree.heading(col, command=lambda: sort_treeview_column(tree, col, not reverse, value_of))
     except Exception:
         # If the heading can't be set (rare cases if col doesn't exist), ignore
         pass
@@ -1,30 +1,77 @@
+import asyncio
 import asyncpg
 import logging
+import os
+from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 from core.config import DB_CONFIG
 
+# Per-session settings sent at connect time. Server-side TCP keepalives stop
+# NAT/firewalls silently dropping pooled connections while the GUI sits idle,
+# and application_name makes our sessions identifiable in pg_stat_activity.
+_SERVER_SETTINGS = {
+    "application_name": os.environ.get("DB_APPLICATION_NAME", "stock_analysis"),
+    "tcp_keepalives_idle": "30",
+    "tcp_keepalives_interval": "10",
+    "tcp_keepalives_count": "3",
+}
+
+
 class DBEngine:
     _pool = None
+    # Task creating the pool; concurrent first callers all await this one
+    _pool_task = None
 
     @classmethod
     async def get_pool(cls):
-        """Returns the connection pool, creating it if necessary."""
+        """Returns the connection pool, creating it if necessary.
+
+        Start-up fires several background coroutines at once (service init,
+        notifier listeners, the first watchlist fetch); they share a single
+        in-flight creation instead of each building (and leaking) a pool.
+        """
         if cls._pool is None:
+            if cls._pool_task is None:
+                cls._pool_task = asyncio.ensure_future(cls._create_pool())
+            task = cls._pool_task
             try:
-                cls._pool = await asyncpg.create_pool(
-                    host=DB_CONFIG["host"],
-                    database=DB_CONFIG["dbname"],
-                    user=DB_CONFIG["user"],
-                    password=DB_CONFIG["password"],
-                    min_size=2,
-                    max_size=10
-                )
-            except Exception:
-                logger.exception("CRITICAL DB ERROR: Could not create pool")
-                raise
+                pool = await asyncio.shield(task)
+            finally:
+                if cls._pool_task is task and task.done():
+                    cls._pool_task = None
+            if cls._pool is None:
+                cls._pool = pool
         return cls._pool
 
+    @classmethod
+    async def _create_pool(cls):
+        try:
+            return await asyncpg.create_pool(
+                host=DB_CONFIG["host"],
+                database=DB_CONFIG["dbname"],
+                user=DB_CONFIG["user"],
+                password=DB_CONFIG["password"],
+                min_size=2,
+                max_size=10,
+                # Keep idle pooled connections open (asyncpg closes them after
+                # 5 minutes by default), so the first click after the GUI has
+                # sat idle doesn't pay a fresh connect + auth. The server-side
+                # keepalives above stop them being silently dropped meanwhile.
+                max_inactive_connection_lifetime=0,
+                # asyncpg prepares every query once per connection and reuses
+                # the statement, but by default drops it from the cache after
+                # 5 minutes. The GUI's queries are a fixed set of
+                # parameterised texts (the per-ticker price/level/metrics
+                # lookups run on every chart open), so keep them prepared for
+                # the life of the connection instead of re-parsing/planning.
+                max_cached_statement_lifetime=0,
+                server_settings=_SERVER_SETTINGS,
+            )
+        except Exception:
+            logger.exception("CRITICAL DB ERROR: Could not create pool")
+            raise
+
     @classmethod
     async def close(cls):
         """Closes the connection pool."""
@@ -44,4 +91,24 @@ class DBEngine:
         """Helper for running INSERT/UPDATE queries."""
         pool = await cls.get_pool()
         async with pool.acquire() as conn:
-            return await conn.execute(query, *args)
\ No newline at end of file
+            return await conn.execute(query, *args)
+
+    @classmethod
+    async def executemany(cls, query, args):
+        """Helper for running the same INSERT/UPDATE over many parameter tuples."""
+        pool = await cls.get_pool()
+        async with pool.acquire() as conn:
+            return await conn.executemany(query, args)
+
+    @classmethod
+    @asynccontextmanager
+    async def transaction(cls):
+        """Borrow one pooled connection for a multi-statement unit of work.
+
+        Commits when the block exits normally and rolls back on error, so a
+        failed statement never leaves a half-applied save behind.
+        """
+        pool = await cls.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
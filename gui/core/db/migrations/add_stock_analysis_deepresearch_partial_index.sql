@@ -0,0 +1,12 @@
+-- Migration: partial index for the "no deep research" watchlist filter
+-- get_watchlist_tickers_without_deepresearch uses a NOT EXISTS anti-join on
+-- stock_analysis. Indexing only the rows that actually have deep research lets
+-- the planner resolve that probe with an index-only scan instead of fetching
+-- (and detoasting) every deepresearch value to evaluate TRIM().
+
+CREATE INDEX IF NOT EXISTS idx_stock_analysis_has_deepresearch
+  ON stock_analysis (ticker)
+  WHERE deepresearch IS NOT NULL AND TRIM(deepresearch) <> '';
+
+-- Refresh planner statistics so the new index is considered immediately
+ANALYZE stock_analysis;
@@ -10,13 +10,17 @@ logger = logging.getLogger(__name__)
 class DBNotifier:
     """
     Manages PostgreSQL LISTEN/NOTIFY for real-time database change notifications.
-    Uses a dedicated connection to listen for notifications on specified channels.
+    Uses one dedicated connection to listen for notifications on all channels.
     """
 
     def __init__(self):
         self._connection: Optional[asyncpg.Connection] = None
-        self._listener_tasks: Dict[str, asyncio.Task] = {}
+        self._keep_alive_task: Optional[asyncio.Task] = None
+        self._channels: set = set()
         self._callbacks: Dict[str, List[Callable]] = {}
+        # Serialises channel setup so concurrent callers (several widgets
+        # register at start-up) cannot each LISTEN on the same channel
+        self._lock = asyncio.Lock()
 
     async def add_listener(self, channel: str, callback: Callable[[str], None]):
         """
@@ -33,18 +37,28 @@ class DBNotifier:
         self._callbacks[channel].append(callback)
 
         # If we are not already listening on this channel, start a new listener.
-        if channel not in self._listener_tasks:
-            # Get a dedicated connection for listening
-            pool = await DBEngine.get_pool()
-            conn = await pool.acquire()
+        async with self._lock:
+            if channel in self._channels:
+                return
+            conn = await self._get_connection()
 
             # Add the actual asyncpg listener
             await conn.add_listener(channel, self._notification_handler)
-
-            # Store the task and connection so we can manage them
-            self._listener_tasks[channel] = asyncio.create_task(self._keep_alive(conn))
+            self._channels.add(channel)
             logger.info("Notifier: Started listening on channel '%s'", channel)
 
+    async def _get_connection(self) -> asyncpg.Connection:
+        """Return the single listener connection, acquiring it on first use.
+
+        Every channel shares this one connection, so LISTEN only ever pins a
+        single pool slot and the rest of the pool stays free for queries.
+        """
+        if self._connection is None:
+            pool = await DBEngine.get_pool()
+            self._connection = await pool.acquire()
+            self._keep_alive_task = asyncio.create_task(self._keep_alive(self._connection))
+        return self._connection
+
     def _notification_handler(self, connection, pid, channel, payload):
         """Internal handler that dispatches notifications to all registered callbacks for a channel."""
         if channel in self._callbacks:
@@ -85,13 +99,17 @@ class DBNotifier:
 
     async def stop_listening(self):
         """Stop listening and cleanup resources."""
-        for channel, task in self._listener_tasks.items():
+        task = self._keep_alive_task
+        if task is not None:
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
                 pass
-            logger.info("Notifier: Stopped listening on channel '%s'", channel)
+            for channel in self._channels:
+                logger.info("Notifier: Stopped listening on channel '%s'", channel)
 
-        self._listener_tasks.clear()
+        self._keep_alive_task = None
+        self._connection = None
+        self._channels.clear()
         self._callbacks.clear()
@@ -1,9 +1,23 @@
 # core.utils package
-from .chart_drawing_utils import prepare_mpf_hlines, add_legend_for_hlines
-from .dataframe_utils import prepare_df_source
-
-__all__ = [
-    "prepare_mpf_hlines",
-    "add_legend_for_hlines",
-    "prepare_df_source",
-]
+#
+# The chart helpers pull in pandas/matplotlib/mplfinance, so they are resolved
+# on first attribute access rather than whenever a light submodule such as
+# core.utils.trading (on the watchlist start-up path) is imported.
+import importlib
+
+_LAZY_EXPORTS = {
+    "prepare_mpf_hlines": ".chart_drawing_utils",
+    "add_legend_for_hlines": ".chart_drawing_utils",
+    "prepare_df_source": ".dataframe_utils",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,6 +5,18 @@ from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
 
 
+def hline_style(label: Optional[str]) -> Tuple[str, float]:
+    """Return (linestyle, linewidth) for a stored horizontal line.
+
+    Support & resistance use solid thicker lines; everything else is dashed.
+    """
+    if label:
+        lab = str(label).lower()
+        if lab.startswith("support") or lab.startswith("resistance"):
+            return "-", 2.6
+    return "--", 1.5
+
+
 def prepare_mpf_hlines(
     stored_hlines: List[Tuple[float, str, str]],
     extra_lines: Optional[Any] = None,
@@ -155,7 +167,8 @@ def build_lines_from_state(
     """Build a list of (price, color, label) tuples from the provided state.
 
     `support_levels` and `resistance_levels` are expected to be lists of
-    (id_or_None, price) tuples.
+    (id_or_None, price) tuples. Repeated support (or resistance) prices are
+    drawn once.
     """
     lines = []
     try:
@@ -165,14 +178,21 @@ def build_lines_from_state(
             lines.append((stop_loss, "red", f"Stop Loss: R{stop_loss:.2f}"))
         if target_price is not None:
             lines.append((target_price, "green", f"Target: R{target_price:.2f}"))
-        if support_levels:
-            for (_id, p) in support_levels:
-                if p is not None:
-                    lines.append((p, "green", f"Support: R{p:.2f}"))
-        if resistance_levels:
-            for (_id, p) in resistance_levels:
-                if p is not None:
-                    lines.append((p, "red", f"Resistance: R{p:.2f}"))
+        for levels, color, name in (
+            (support_levels, "green", "Support"),
+            (resistance_levels, "red", "Resistance"),
+        ):
+            # Set lookup keyed on the rounded price, so duplicates are
+            # dropped in one pass and float noise doesn't defeat the match
+            seen = set()
+            for (_id, p) in levels or ():
+                if p is None:
+                    continue
+                key = round(p, 4)
+                if key in seen:
+                    continue
+                seen.add(key)
+                lines.append((p, color, f"{name}: R{p:.2f}"))
     except Exception:
         # Be robust: return what we have even on partial failures
         pass
@@ -182,28 +202,17 @@ def build_lines_from_state(
 # Public chart drawing helpers for the application
 
 
-def build_ma_addplots(
-    df_source: Optional[pd.DataFrame],
-    df_display: Optional[pd.DataFrame],
-    ax: Axes,
-) -> Optional[List[Any]]:
+def compute_daily_mas(df_source: Optional[pd.DataFrame]) -> Optional[Tuple[pd.Series, pd.Series]]:
     """
-    Build 50- and 200-day simple moving-average addplots.
+    Compute the daily 50- and 200-day SMAs over the last 300 calendar days of
+    df_source (assumed daily OHLC in rands).
 
-    - Uses the last 300 calendar days from df_source (assumed daily OHLC in rands).
-    - Computes daily SMAs and reindexes them to df_display.index so that the
-      MAs line up with whatever resampling is used (3M/6M daily, 1Y weekly,
-      5Y monthly, etc.).
-    - Returns a list of mpf.make_addplot(...) objects or None if not possible.
-
-    IMPORTANT for external-axes mode:
-    - We must pass ax=<Axes> to make_addplot(), NOT panel=0, otherwise
-      mplfinance will complain that addplot 'ax' kwargs are invalid.
+    Depends only on the source data, so callers can compute it once per load
+    and hand it to build_ma_addplots for every replot of the same data.
+    Returns (ma50, ma200) or None if not possible.
     """
     if df_source is None or df_source.empty:
         return None
-    if df_display is None or df_display.empty:
-        return None
     if "Close" not in df_source.columns:
         return None
     if not isinstance(df_source.index, pd.DatetimeIndex):
@@ -212,16 +221,44 @@ def build_ma_addplots(
     # Restrict to last 300 calendar days of source data
     end = df_source.index.max()
     start = end - pd.Timedelta(days=300)
-    df_window = df_source.loc[start:end].copy()
+    close = df_source.loc[start:end, "Close"]
 
-    if df_window.empty:
+    if close.empty:
         return None
 
-    close = df_window["Close"].astype(float)
-
     # 50- and 200-day SMAs on *daily* data
     ma50 = close.rolling(window=50, min_periods=1).mean()
     ma200 = close.rolling(window=200, min_periods=1).mean()
+    return ma50, ma200
+
+
+def build_ma_addplots(
+    df_source: Optional[pd.DataFrame],
+    df_display: Optional[pd.DataFrame],
+    ax: Axes,
+    daily_mas: Optional[Tuple[pd.Series, pd.Series]] = None,
+) -> Optional[List[Any]]:
+    """
+    Build 50- and 200-day simple moving-average addplots.
+
+    - Uses `daily_mas` from compute_daily_mas if given, else computes them
+      from df_source.
+    - Reindexes the daily SMAs to df_display.index so that the
+      MAs line up with whatever resampling is used (3M/6M daily, 1Y weekly,
+      5Y monthly, etc.).
+    - Returns a list of mpf.make_addplot(...) objects or None if not possible.
+
+    IMPORTANT for external-axes mode:
+    - We must pass ax=<Axes> to make_addplot(), NOT panel=0, otherwise
+      mplfinance will complain that addplot 'ax' kwargs are invalid.
+    """
+    if df_display is None or df_display.empty:
+        return None
+    if daily_mas is None:
+        daily_mas = compute_daily_mas(df_source)
+    if daily_mas is None:
+        return None
+    ma50, ma200 = daily_mas
 
     # Align the MAs to df_display.index (which might be weekly/monthly)
     ma50_resampled = ma50.reindex(df_display.index, method="pad")
@@ -1,6 +1,12 @@
 from typing import Optional, Tuple, Any
 import pandas as pd
 
+# Columns the charts actually plot. Anything else (ticker, volume from wider
+# queries, bookkeeping columns) is dropped so resampling, the MA addplots and
+# mplfinance's conversions only walk the price data.
+_OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
+_PRICE_COLUMNS = ("open_price", "high_price", "low_price", "close_price")
+
 
 def prepare_df_source(data: Optional[Any], period_key: Optional[str]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """Prepare incoming data into a cleaned OHLC pandas DataFrame for plotting.
@@ -12,13 +18,15 @@ def prepare_df_source(data: Optional[Any], period_key: Optional[str]) -> Tuple[O
     Behavior mirrors the original logic in BaseChart.plot:
     - If data is None/empty returns (None, 'No data available')
     - If period_key is None returns (None, 'No period key specified')
-    - Accepts a pandas.DataFrame OR a list/iterable of dicts containing
+    - Accepts a pandas.DataFrame OR a list/iterable of dicts (or DB records) containing
       trade_date/open_price/high_price/low_price/close_price
     - If a DataFrame is passed it is copied. Otherwise it creates a DataFrame,
       converts the trade_date to datetime, sets it to index and converts price
       cents to rands (divides by 100).
     - Renames open_price/high_price/low_price/close_price to Open/High/Low/Close.
     - Drops rows missing any of Open/High/Low/Close and returns error if empty.
+    - Keeps only the OHLC columns, as float32 (plenty for prices and half the
+      data matplotlib has to push through on every redraw).
     """
     # Basic data/period checks
     if data is None or (isinstance(data, (list, tuple)) and not data):
@@ -32,17 +40,28 @@ def prepare_df_source(data: Optional[Any], period_key: Optional[str]) -> Tuple[O
         if isinstance(data, pd.DataFrame):
             df_source = data.copy()
         else:
-            df_source = pd.DataFrame(data)
-            if "trade_date" not in df_source.columns:
+            # Build the frame column by column straight from the rows
+            # (dicts or DB records), rather than letting pandas infer a
+            # schema from every row
+            rows = data if isinstance(data, (list, tuple)) else list(data)
+            if not rows:
+                return None, "No data available"
+            try:
+                trade_dates = [r["trade_date"] for r in rows]
+            except (KeyError, TypeError):
                 return None, "Missing 'trade_date' column in provided data"
 
-            df_source["trade_date"] = pd.to_datetime(df_source["trade_date"])
-            df_source.set_index("trade_date", inplace=True)
+            columns = {}
+            for col in _PRICE_COLUMNS:
+                try:
+                    columns[col] = [r[col] for r in rows]
+                except (KeyError, TypeError):
+                    continue
+            df_source = pd.DataFrame(columns, index=pd.DatetimeIndex(pd.to_datetime(trade_dates), name="trade_date"))
 
             # Convert prices (cents -> rands)
-            for col in ["open_price", "high_price", "low_price", "close_price"]:
-                if col in df_source.columns:
-                    df_source[col] = pd.to_numeric(df_source[col], errors="coerce") / 100.0
+            for col in columns:
+                df_source[col] = pd.to_numeric(df_source[col], errors="coerce") / 100.0
 
             df_source = df_source.rename(
                 columns={
@@ -54,11 +73,13 @@ def prepare_df_source(data: Optional[Any], period_key: Optional[str]) -> Tuple[O
             )
 
         # Clean: require valid OHLC
-        df_source = df_source.dropna(subset=["Open", "High", "Low", "Close"])
+        df_source = df_source.dropna(subset=_OHLC_COLUMNS)
 
         if df_source.empty:
             return None, "No valid OHLC data"
 
+        df_source = df_source[_OHLC_COLUMNS].astype("float32")
+
         return df_source, None
 
     except Exception as ex:
@@ -6,12 +6,22 @@ def _calculate_days_to_event(event_dates):
     Returns the minimum days to the next event from a list of date objects.
     Returns 999 if no future events found.
     """
-    today = date.today()
+    # Integer ordinals avoid a timedelta per date
+    today_ord = date.today().toordinal()
     min_days = 999
 
     for d in event_dates:
-        if d and d >= today:
-            days = (d - today).days
-            if days < min_days:
+        if d:
+            days = d.toordinal() - today_ord
+            if 0 <= days < min_days:
                 min_days = days
     return min_days
+
+
+def format_minutes(dt):
+    """
+    Format a datetime as 'YYYY-MM-DD HH:MM' (same as strftime("%Y-%m-%d %H:%M")).
+    Uses the C isoformat fast path; slicing drops any UTC offset that
+    timestamptz values carry.
+    """
+    return dt.isoformat(sep=" ", timespec="minutes")[:16]
@@ -96,3 +96,16 @@ def get_proximity_status(price, entry, stop, target, is_long: bool = True, proxi
 
     # Prefer an empty status when nothing matches
     return "", "secondary"
+
+
+def upside_pct(price, target, is_long: bool = True):
+    """Percent return from `price` to `target` in the trade's direction.
+
+    Positive when the target is a gain (above price for longs, below for
+    shorts). Returns None when price/target are missing or price is zero.
+    """
+    if price is None or target is None or price == 0:
+        return None
+    # +1 for long, -1 for short: one expression for both directions
+    direction = 1 if is_long else -1
+    return direction * (target - price) / price * 100
@@ -1,4 +1,5 @@
 from core.db.engine import DBEngine
+from modules.data.metrics import invalidate_next_release_date
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,9 +50,8 @@ async def upsert_raw_fundamentals(ticker: str, periods: list):
     """
     # Note: Simplified UPDATE clause for brevity, add fields as needed
     try:
-        for p in periods:
-            await DBEngine.execute(
-                query,
+        records = [
+            (
                 ticker,
                 p["results_period_end"],
                 p["results_period_label"],
@@ -62,6 +62,12 @@ async def upsert_raw_fundamentals(ticker: str, periods: list):
                 p.get("nav_ps_zarc"),
                 p.get("quick_ratio"),
             )
+            for p in periods
+        ]
+        # One batched round trip for all periods instead of one per period
+        if records:
+            await DBEngine.executemany(query, records)
+        invalidate_next_release_date(ticker)
         return True
     except Exception:
         logger.exception("Error upserting raw fundamentals")
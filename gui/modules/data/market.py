@@ -1,8 +1,29 @@
 from core.db.engine import DBEngine
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# The ticker universe (stock_details) rarely changes, but the market agent
+# asks for it on every price and SENS cycle; keep it for ten minutes.
+_TICKERS_TTL = 600
+_tickers_cache = None  # (monotonic timestamp, tuple of tickers)
+
+
+async def load_tickers(refresh=False):
+    """All tickers in stock_details, memoized for `_TICKERS_TTL` seconds.
+
+    Pass refresh=True (e.g. for a user-initiated update) to bypass and
+    reload the cached list.
+    """
+    global _tickers_cache
+    if not refresh and _tickers_cache is not None and time.monotonic() - _tickers_cache[0] < _TICKERS_TTL:
+        return list(_tickers_cache[1])
+    rows = await DBEngine.fetch("SELECT ticker FROM stock_details")
+    tickers = tuple(r["ticker"] for r in rows)
+    _tickers_cache = (time.monotonic(), tickers)
+    return list(tickers)
+
 
 async def get_latest_price(ticker: str):
     query = """
@@ -14,15 +35,30 @@ async def get_latest_price(ticker: str):
     return dict(row[0]) if row else None
 
 
+async def get_last_trade_date(ticker: str):
+    """Return the most recent stored trade_date for `ticker`, or None."""
+    row = await DBEngine.fetch(
+        "SELECT MAX(trade_date) AS d FROM daily_stock_data WHERE ticker = $1", ticker
+    )
+    return row[0]["d"] if row else None
+
+
 async def get_historical_prices(ticker: str, days: int):
+    # Prices are cast to float8 so asyncpg decodes them to plain floats; the
+    # chart DataFrame then gets float columns instead of object columns of
+    # Decimals that need converting cell by cell
     query = """
-        SELECT trade_date, open_price, high_price, low_price, close_price
+        SELECT trade_date,
+               open_price::float8 AS open_price, high_price::float8 AS high_price,
+               low_price::float8 AS low_price, close_price::float8 AS close_price
         FROM daily_stock_data
         WHERE ticker = $1 AND trade_date >= CURRENT_DATE - INTERVAL '1 day' * $2
         ORDER BY trade_date ASC
     """
-    rows = await DBEngine.fetch(query, ticker, days)
-    return [dict(row) for row in rows]
+    # Records are returned as-is (they support row["col"] like a dict);
+    # prepare_df_source reads them column by column, so a dict per row
+    # would only be built to be thrown away
+    return await DBEngine.fetch(query, ticker, days)
 
 
 async def insert_price_hit_log(ticker, level):
@@ -36,3 +72,68 @@ async def insert_price_hit_log(ticker, level):
     except Exception:
         logger.exception("DB ERROR: Failed to insert price hit log")
         return False
+
+
+_DAILY_COLUMNS = ("ticker", "trade_date", "open_price", "high_price", "low_price", "close_price", "volume")
+_DAILY_VALUE_COLUMNS = _DAILY_COLUMNS[2:]
+
+# Batches at least this large are loaded through COPY instead of executemany
+COPY_THRESHOLD = 500
+
+
+async def upsert_daily_prices(records, update_columns=_DAILY_VALUE_COLUMNS):
+    """Bulk upsert (ticker, trade_date, open, high, low, close, volume) tuples.
+
+    Small batches use a single executemany. Large batches (e.g. a 5y
+    download) are COPYed into a temp staging table and merged with one
+    INSERT ... SELECT ... ON CONFLICT, avoiding per-row protocol overhead.
+    `update_columns` controls which columns are overwritten on conflict.
+    If the batch is rejected, it is retried row by row so one bad row is
+    logged and skipped rather than losing the whole update. Returns the
+    number of records saved.
+    """
+    # One row per (ticker, trade_date), the last one winning as it would with
+    # row-by-row upserts: yfinance can repeat a day around the intraday/close
+    # overlap, and ON CONFLICT DO UPDATE cannot touch the same row twice in
+    # one statement
+    records = list({(r[0], r[1]): r for r in records}.values())
+    if not records:
+        return 0
+
+    cols = ", ".join(_DAILY_COLUMNS)
+    set_clause = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+    placeholders = ", ".join(f"${i}" for i in range(1, len(_DAILY_COLUMNS) + 1))
+    insert_q = (
+        f"INSERT INTO daily_stock_data ({cols}) VALUES ({placeholders})"
+        f" ON CONFLICT (ticker, trade_date) DO UPDATE SET {set_clause}"
+    )
+
+    pool = await DBEngine.get_pool()
+    async with pool.acquire() as conn:
+        try:
+            if len(records) < COPY_THRESHOLD:
+                # executemany is atomic, so a failure leaves nothing applied
+                await conn.executemany(insert_q, records)
+                return len(records)
+
+            async with conn.transaction():
+                await conn.execute(
+                    "CREATE TEMP TABLE staging_daily (LIKE daily_stock_data INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table("staging_daily", records=records, columns=_DAILY_COLUMNS)
+                await conn.execute(
+                    f"INSERT INTO daily_stock_data ({cols}) SELECT {cols} FROM staging_daily"
+                    f" ON CONFLICT (ticker, trade_date) DO UPDATE SET {set_clause}"
+                )
+            return len(records)
+        except Exception:
+            logger.exception("Bulk price upsert of %s rows failed; retrying row by row", len(records))
+
+        saved = 0
+        for rec in records:
+            try:
+                await conn.execute(insert_q, *rec)
+                saved += 1
+            except Exception:
+                logger.exception("Error upserting price row %s %s", rec[0], rec[1])
+        return saved
@@ -1,26 +1,55 @@
+import time
+
 from core.db.engine import DBEngine
 
+# Next-release estimates only move when new results are loaded, so they are
+# kept per ticker for a few minutes. The watchlist fetch seeds the cache with
+# the value it already computes for every row, and loading fundamentals for a
+# ticker invalidates its entry.
+_EVENT_DATE_TTL = 600
+_event_date_cache = {}
+
+
+def cache_next_release_dates(pairs):
+    """Store (ticker, next_event_date) pairs computed elsewhere."""
+    now = time.monotonic()
+    for ticker, next_date in pairs:
+        _event_date_cache[ticker] = (now, next_date)
+
+
+def invalidate_next_release_date(ticker: str = None):
+    """Drop the cached next-release date for a ticker (or all if None)."""
+    if ticker is None:
+        _event_date_cache.clear()
+    else:
+        _event_date_cache.pop(ticker, None)
+
+
 async def get_stock_metrics(ticker: str):
     """
     Get current stock metrics from the v_live_valuations view.
     Returns a dictionary with keys:
-    - current_price
+    - current_price (rands)
     - pe_ratio
     - div_yield_perc
     - peg_ratio_historical
-    - graham_fair_value
+    - graham_fair_value (rands)
     - valuation_premium_perc
+    - historical_growth_cagr
     - financials_date
+
+    Values come back display-ready: cents are converted to rands and every
+    figure is rounded to 2 places by the server, so the caller only formats.
     """
     query = """
         SELECT 
-            current_price,
-            pe_ratio,
-            div_yield_perc,
-            peg_ratio_historical,
-            graham_fair_value,
-            valuation_premium_perc,
-            historical_growth_cagr,
+            ROUND(current_price::numeric / 100, 2) AS current_price,
+            ROUND(pe_ratio::numeric, 2) AS pe_ratio,
+            ROUND(div_yield_perc::numeric, 2) AS div_yield_perc,
+            ROUND(peg_ratio_historical::numeric, 2) AS peg_ratio_historical,
+            ROUND(graham_fair_value::numeric / 100, 2) AS graham_fair_value,
+            ROUND(valuation_premium_perc::numeric, 2) AS valuation_premium_perc,
+            ROUND(historical_growth_cagr::numeric, 2) AS historical_growth_cagr,
             financials_date
         FROM v_live_valuations
         WHERE ticker = $1
@@ -29,3 +58,26 @@ async def get_stock_metrics(ticker: str):
     if row:
         return dict(row[0])
     return None
+
+
+async def get_next_release_date(ticker: str):
+    """
+    Estimate the next results release date for a ticker.
+    Uses the 2nd most recent results_release_date + 1 year
+    (same logic as fetch_watchlist_data).
+    """
+    entry = _event_date_cache.get(ticker)
+    if entry is not None and time.monotonic() - entry[0] <= _EVENT_DATE_TTL:
+        return entry[1]
+
+    query = """
+        SELECT (results_release_date + interval '1 year')::date AS next_event_date
+        FROM raw_stock_valuations
+        WHERE ticker = $1
+        ORDER BY results_release_date DESC
+        LIMIT 1 OFFSET 1
+    """
+    rows = await DBEngine.fetch(query, ticker)
+    next_date = rows[0].get("next_event_date") if rows else None
+    cache_next_release_dates([(ticker, next_date)])
+    return next_date
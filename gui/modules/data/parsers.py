@@ -8,6 +8,17 @@ from modules.data.parse_utils import (
     parse_financial_value,
 )
 
+# Header cells that name a financial year, e.g. "Jun 2024"
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+# Row labels (lower-cased once here, not per row) -> share statistics keys
+_SHARE_STATS_FIELDS = {
+    "12 month heps": "heps_12m_zarc",
+    "12 month dividend": "dividend_12m_zarc",
+    "cash generated per share": "cash_gen_ps_zarc",
+    "net asset value per share (zarc)": "nav_ps_zarc",
+}
+
 
 def parse_multi_year_share_statistics(table_html: str) -> List[Dict[str, Any]]:
     """
@@ -32,7 +43,7 @@ def parse_multi_year_share_statistics(table_html: str) -> List[Dict[str, Any]]:
         texts = [c.get_text(strip=True).replace("\n", " ") for c in cells]
         if len(texts) < 2:
             continue
-        if any(re.search(r"\b(19|20)\d{2}\b", t) for t in texts[1:]):
+        if any(_YEAR_RE.search(t) for t in texts[1:]):
             header_row = row
             headers = texts
             break
@@ -82,21 +93,14 @@ def parse_multi_year_share_statistics(table_html: str) -> List[Dict[str, Any]]:
         for p in periods_info
     ]
 
-    field_map = {
-        "12 Month HEPS": "heps_12m_zarc",
-        "12 Month Dividend": "dividend_12m_zarc",
-        "Cash Generated Per Share": "cash_gen_ps_zarc",
-        "Net Asset Value Per Share (ZARc)": "nav_ps_zarc",
-    }
-
     for row in rows[1:]:
         cols = row.find_all(["td", "th"])
         if not cols:
             continue
-        label = cols[0].get_text(strip=True)
+        label = cols[0].get_text(strip=True).lower()
 
-        for f_label, f_key in field_map.items():
-            if f_label.lower() in label.lower():
+        for f_label, f_key in _SHARE_STATS_FIELDS.items():
+            if f_label in label:
                 for p_idx, p_info in enumerate(periods_info):
                     if p_info["column_idx"] < len(cols):
                         val = parse_financial_value(
@@ -129,7 +133,7 @@ def parse_multi_year_ratios(table_html: str) -> List[Dict[str, Any]]:
         texts = [c.get_text(strip=True).replace("\n", " ") for c in cells]
         if len(texts) < 2:
             continue
-        if any(re.search(r"\b(19|20)\d{2}\b", t) for t in texts[1:]):
+        if any(_YEAR_RE.search(t) for t in texts[1:]):
             header_row = row
             headers = texts
             break
@@ -164,7 +168,7 @@ def parse_multi_year_ratios(table_html: str) -> List[Dict[str, Any]]:
         cols = row.find_all(["td", "th"])
         if not cols:
             continue
-        if "Quick Ratio".lower() in cols[0].get_text(strip=True).lower():
+        if "quick ratio" in cols[0].get_text(strip=True).lower():
             for p_idx, p_info in enumerate(periods_info):
                 if p_info["column_idx"] < len(cols):
                     val = parse_financial_value(
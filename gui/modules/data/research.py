@@ -1,5 +1,15 @@
+import time
+from collections import OrderedDict
+
 from core.db.engine import DBEngine
 
+# SENS rows are immutable once published, so recently viewed tickers are
+# kept in a small LRU. Entries expire after a TTL so announcements saved by
+# other processes still show up, and local inserts invalidate immediately.
+_SENS_CACHE_TTL = 300
+_SENS_CACHE_MAX = 64
+_sens_cache = OrderedDict()
+
 
 async def get_action_logs(ticker: str, limit=50):
     """Get action logs for a ticker."""
@@ -26,21 +36,41 @@ async def delete_action_log(log_id: int):
     await DBEngine.execute(query, log_id)
 
 
+_RESEARCH_QUERY = """
+    SELECT 
+        strategy,
+        research,
+        deepresearch,
+        deepresearch_date
+    FROM stock_analysis
+    WHERE ticker = $1
+"""
+
+_SENS_QUERY = """
+    SELECT publication_datetime, content
+    FROM SENS
+    WHERE ticker = $1
+    ORDER BY publication_datetime DESC
+    LIMIT $2
+"""
+
+_SENS_INSERT = "INSERT INTO SENS (ticker, publication_datetime, content) VALUES ($1, $2, $3)"
+
+_CATEGORY_QUERY = """
+    SELECT sc.name as category
+    FROM stock_details sd
+    LEFT JOIN stock_categories sc ON sd.stock_category_id = sc.category_id
+    WHERE sd.ticker = $1
+    LIMIT 1
+"""
+
+
 async def get_research_data(ticker: str):
     """Get all research data for a ticker from stock_analysis table."""
-    query = """
-        SELECT 
-            strategy,
-            research,
-            deepresearch,
-            deepresearch_date
-        FROM stock_analysis
-        WHERE ticker = $1
-    """
     import logging
     logger = logging.getLogger(__name__)
 
-    rows = await DBEngine.fetch(query, ticker)
+    rows = await DBEngine.fetch(_RESEARCH_QUERY, ticker)
     if rows:
         logger.debug("get_research_data: found row for %s", ticker)
         return dict(rows[0])
@@ -49,34 +79,90 @@ async def get_research_data(ticker: str):
         return None
 
 
+def _sens_cache_get(ticker: str, limit):
+    key = (ticker, limit)
+    entry = _sens_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, rows = entry
+    if time.monotonic() - cached_at > _SENS_CACHE_TTL:
+        _sens_cache.pop(key, None)
+        return None
+    _sens_cache.move_to_end(key)
+    return list(rows)
+
+
+def _sens_cache_put(ticker: str, limit, rows):
+    _sens_cache[(ticker, limit)] = (time.monotonic(), list(rows))
+    _sens_cache.move_to_end((ticker, limit))
+    while len(_sens_cache) > _SENS_CACHE_MAX:
+        _sens_cache.popitem(last=False)
+
+
+def invalidate_sens_cache(ticker: str = None):
+    """Drop cached SENS rows for a ticker (or for all tickers if None)."""
+    if ticker is None:
+        _sens_cache.clear()
+        return
+    for key in [k for k in _sens_cache if k[0] == ticker]:
+        _sens_cache.pop(key, None)
+
+
 async def get_sens_for_ticker(ticker: str, limit=50):
     """Get SENS announcements for a ticker."""
-    query = """
-        SELECT publication_datetime, content
-        FROM SENS
-        WHERE ticker = $1
-        ORDER BY publication_datetime DESC
-        LIMIT $2
+    cached = _sens_cache_get(ticker, limit)
+    if cached is not None:
+        return cached
+    rows = await DBEngine.fetch(_SENS_QUERY, ticker, limit)
+    result = [dict(row) for row in rows]
+    _sens_cache_put(ticker, limit, result)
+    return result
+
+
+async def insert_sens_records(records):
+    """Insert SENS announcements in a single batch.
+
+    `records` is an iterable of (ticker, publication_datetime, content) tuples.
+    Returns the number of rows submitted.
     """
-    rows = await DBEngine.fetch(query, ticker, limit)
-    return [dict(row) for row in rows]
+    records = list(records)
+    if not records:
+        return 0
+    await DBEngine.executemany(_SENS_INSERT, records)
+    for ticker in {r[0] for r in records}:
+        invalidate_sens_cache(ticker)
+    return len(records)
 
 
 async def get_stock_category(ticker: str):
     """Return the category name for a given ticker (or None)."""
-    query = """
-        SELECT sc.name as category
-        FROM stock_details sd
-        LEFT JOIN stock_categories sc ON sd.stock_category_id = sc.category_id
-        WHERE sd.ticker = $1
-        LIMIT 1
-    """
-    rows = await DBEngine.fetch(query, ticker)
+    rows = await DBEngine.fetch(_CATEGORY_QUERY, ticker)
     if rows:
         return rows[0].get('category')
     return None
 
 
+async def get_research_bundle(ticker: str, sens_limit=50):
+    """Get research data, SENS and category for a ticker in one pool checkout.
+
+    Returns a dict with keys 'research' (dict or None), 'sens' (list) and
+    'category' (str or None).
+    """
+    sens = _sens_cache_get(ticker, sens_limit)
+    pool = await DBEngine.get_pool()
+    async with pool.acquire() as conn:
+        research_row = await conn.fetchrow(_RESEARCH_QUERY, ticker)
+        if sens is None:
+            sens = [dict(row) for row in await conn.fetch(_SENS_QUERY, ticker, sens_limit)]
+            _sens_cache_put(ticker, sens_limit, sens)
+        category_row = await conn.fetchrow(_CATEGORY_QUERY, ticker)
+    return {
+        "research": dict(research_row) if research_row else None,
+        "sens": sens,
+        "category": category_row.get("category") if category_row else None,
+    }
+
+
 async def save_strategy_data(ticker: str, content: str):
     """Upsert the strategy value for a ticker.
 
@@ -86,6 +172,7 @@ async def save_strategy_data(ticker: str, content: str):
         INSERT INTO stock_analysis (ticker, strategy)
         VALUES ($1, $2)
         ON CONFLICT (ticker) DO UPDATE SET strategy = EXCLUDED.strategy
+        WHERE stock_analysis.strategy IS DISTINCT FROM EXCLUDED.strategy
     """
     await DBEngine.execute(query, ticker, content)
 
@@ -99,6 +186,7 @@ async def save_research_data(ticker: str, content: str):
         INSERT INTO stock_analysis (ticker, research)
         VALUES ($1, $2)
         ON CONFLICT (ticker) DO UPDATE SET research = EXCLUDED.research
+        WHERE stock_analysis.research IS DISTINCT FROM EXCLUDED.research
     """
     try:
         logger.debug("Saving research for %s (content len=%d)", ticker, len(content) if content is not None else 0)
@@ -122,6 +210,7 @@ async def save_deep_research_data(ticker: str, content: str):
         INSERT INTO stock_analysis (ticker, deepresearch)
         VALUES ($1, $2)
         ON CONFLICT (ticker) DO UPDATE SET deepresearch = EXCLUDED.deepresearch
+        WHERE stock_analysis.deepresearch IS DISTINCT FROM EXCLUDED.deepresearch
     """
     await DBEngine.execute(query, ticker, content)
 
@@ -97,25 +97,33 @@ class FundamentalsScraper:
 async def get_watchlist_tickers_without_deepresearch(limit: int | None = None):
     """Return list of watchlist tickers that have no deepresearch (NULL or empty).
 
-    Tolerates '.JO' suffix by joining stock_analysis on both the exact and REPLACE(ticker, '.JO','') value.
+    Tolerates '.JO' suffix by matching stock_analysis on both the exact and REPLACE(ticker, '.JO','') value.
+    Uses a NOT EXISTS anti-join so the planner can answer it from the
+    idx_stock_analysis_has_deepresearch partial index without detoasting
+    the research text.
     """
     logger = logging.getLogger(__name__)
     query = """
         SELECT w.ticker
         FROM watchlist w
         JOIN stock_details sd ON w.ticker = sd.ticker
-        LEFT JOIN stock_analysis sa ON (sa.ticker = w.ticker OR sa.ticker = REPLACE(w.ticker, '.JO', ''))
         WHERE w.status NOT IN ('WL-Sleep')
-          AND (sa.deepresearch IS NULL OR TRIM(sa.deepresearch) = '')
+          AND NOT EXISTS (
+              SELECT 1
+              FROM stock_analysis sa
+              WHERE sa.ticker IN (w.ticker, REPLACE(w.ticker, '.JO', ''))
+                AND sa.deepresearch IS NOT NULL
+                AND TRIM(sa.deepresearch) <> ''
+          )
         ORDER BY
             CASE WHEN sd.priority = 'A' THEN 1
                  WHEN sd.priority = 'B' THEN 2
                  ELSE 3 END,
             w.ticker
+        LIMIT $1
     """
-    if limit:
-        query += f" LIMIT {limit}"
-    rows = await DBEngine.fetch(query)
+    # Bound LIMIT (NULL means no limit) keeps this a single cached statement
+    rows = await DBEngine.fetch(query, limit or None)
     tickers = [r['ticker'] for r in rows]
     logger.info("get_watchlist_tickers_without_deepresearch: found %d tickers", len(tickers))
     return tickers
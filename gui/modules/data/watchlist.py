@@ -1,4 +1,5 @@
 from core.db.engine import DBEngine
+from modules.data.metrics import cache_next_release_dates
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,11 @@ async def fetch_watchlist_data():
             w.is_long,
             p.close_price,
             w.reward_risk_ratio,
-            sa.strategy,
-            sa.deepresearch,
+            -- Only what the grid shows: the strategy column is cut at 100
+            -- characters and deep research is just a present/absent flag, so
+            -- the full documents are not shipped for every row
+            LEFT(sa.strategy, 101) AS strategy,
+            COALESCE(TRIM(sa.deepresearch) <> '', false) AS has_deepresearch,
             sa.deepresearch_date,
             lv.peg_ratio_historical as peg_ratio,
             (SELECT trigger_content FROM action_log a 
@@ -52,7 +56,9 @@ async def fetch_watchlist_data():
             w.ticker
     """
     rows = await DBEngine.fetch(query)
-    return [dict(row) for row in rows]
+    result = [dict(row) for row in rows]
+    cache_next_release_dates((r["ticker"], r["next_event_date"]) for r in result)
+    return result
 
 
 async def select_tickers_for_valuation(limit=None):
@@ -159,11 +165,11 @@ async def select_tickers_for_valuation(limit=None):
         SELECT ticker FROM ticker_valuation_status
         WHERE next_expected_date IS NULL OR next_expected_date <= CURRENT_DATE
         ORDER BY last_valuation_date ASC NULLS FIRST, in_portfolio DESC, priority, ticker
+        LIMIT $1
     """
-    if limit:
-        query += f" LIMIT {limit}"  # Simple limit append for int safety
-
-    rows = await DBEngine.fetch(query)
+    # LIMIT is bound rather than formatted in so every call reuses the same
+    # prepared statement; a NULL limit returns all rows
+    rows = await DBEngine.fetch(query, limit or None)
     selected_tickers = [row["ticker"] for row in rows]
     
     logger.info('%s', '\n' + ('='*80))
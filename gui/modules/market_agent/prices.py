@@ -1,16 +1,41 @@
+import asyncio
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import date, timedelta
 from decimal import Decimal
 from core.db.engine import DBEngine
-from core.utils.math import convert_yf_price_to_cents
+from modules.data.market import load_tickers, upsert_daily_prices
 import logging
 
 logger = logging.getLogger(__name__)
 
+_yf_session = None
 
-async def run_price_update():
-    """Downloads prices and triggers alerts."""
+
+def _get_yf_session():
+    """Shared HTTP session for yfinance so TLS/keep-alive and Yahoo's cookie
+    and crumb survive across price updates.
+
+    yfinance 1.x only accepts curl_cffi sessions; returns None (yfinance's
+    default) if curl_cffi is unavailable.
+    """
+    global _yf_session
+    if _yf_session is None:
+        try:
+            from curl_cffi import requests as curl_requests
+
+            _yf_session = curl_requests.Session(impersonate="chrome")
+        except Exception:
+            logger.debug("curl_cffi session unavailable; using yfinance default")
+    return _yf_session
+
+
+async def run_price_update(refresh_tickers=False):
+    """Downloads prices and triggers alerts.
+
+    refresh_tickers reloads the ticker list instead of using the cached one.
+    """
     logger.info("+++ Running Price Update +++")
 
     # 1. Determine Date Range
@@ -36,8 +61,7 @@ async def run_price_update():
     logger.debug("Download params: %s", params)
 
     # 2. Get Tickers
-    rows = await DBEngine.fetch("SELECT ticker FROM stock_details")
-    tickers = [r["ticker"] for r in rows]
+    tickers = await load_tickers(refresh=refresh_tickers)
     if not tickers:
         logger.debug("No tickers found in DB.")
         return
@@ -45,7 +69,13 @@ async def run_price_update():
     # 3. Download
     logger.info("Downloading for %s tickers...", len(tickers))
     try:
-        data = yf.download(tickers, auto_adjust=True, progress=False, **params)
+        # One batched download for every ticker, fetched concurrently by
+        # yfinance's worker threads. It runs off the event loop so the GUI's
+        # other DB work keeps flowing while Yahoo responds.
+        data = await asyncio.to_thread(
+            yf.download, tickers, auto_adjust=True, progress=False, threads=True,
+            session=_get_yf_session(), **params
+        )
         logger.debug("Downloaded data shape: %s", data.shape)
         if data.empty:
             logger.debug("Data is empty.")
@@ -107,32 +137,33 @@ async def _process_and_save(data, all_tickers):
         logger.debug("Missing columns. Have: %s, Need: %s", df.columns, required)
         return 0
 
-    count = 0
+    # Coerce once, then keep only rows whose close, volume and date are
+    # usable: a bad cell drops its own row (as the per-row path did) instead
+    # of making a whole-column cast fail the batch. Missing volume counts as 0.
+    close = pd.to_numeric(df["c"], errors="coerce").astype("float64")
+    volume = pd.to_numeric(df["v"], errors="coerce").fillna(0).astype("float64")
+    trade_dates = pd.to_datetime(df["trade_date"], errors="coerce")
+    keep = (np.isfinite(close) & np.isfinite(volume) & trade_dates.notna()).to_numpy()
+    if not keep.all():
+        logger.debug("Skipping %s price rows with invalid close/volume/date", int((~keep).sum()))
+    df, volume, trade_dates = df[keep], volume[keep], trade_dates[keep]
+    if df.empty:
+        return 0
 
-    q = """
-        INSERT INTO daily_stock_data (ticker, trade_date, open_price, high_price, low_price, close_price, volume)
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-        ON CONFLICT (ticker, trade_date) DO UPDATE SET close_price = EXCLUDED.close_price
-    """
+    # Build every column once (dates via .dt.date, cents via a vectorised
+    # trunc that matches convert_yf_price_to_cents) and zip into tuples,
+    # instead of converting cell by cell per row.
+    dates = trade_dates.dt.date.tolist()
+    o, h, l, c = (_cents_column(df[col]) for col in ("o", "h", "l", "c"))
+    v = volume.astype("int64").tolist()
 
-    for _, row in df.iterrows():
-        try:
-            # Skip if critical data is missing
-            if pd.isna(row["c"]):
-                continue
-
-            args = (
-                row["ticker"],
-                row["trade_date"].date(),
-                convert_yf_price_to_cents(row["o"]),
-                convert_yf_price_to_cents(row["h"]),
-                convert_yf_price_to_cents(row["l"]),
-                convert_yf_price_to_cents(row["c"]),
-                int(row["v"]) if not pd.isna(row["v"]) else 0,
-            )
-            await DBEngine.execute(q, *args)
-            count += 1
-        except Exception:
-            logger.exception("Error processing row")
-            continue
-    return count
+    records = list(zip(df["ticker"].tolist(), dates, o, h, l, c, v))
+    return await upsert_daily_prices(records, update_columns=("close_price",))
+
+
+def _cents_column(series):
+    """Vectorised convert_yf_price_to_cents: truncate to int; NaN, inf or
+    non-numeric cells -> None."""
+    values = pd.to_numeric(series, errors="coerce").astype("float64")
+    values = values.where(np.isfinite(values))
+    return np.trunc(values).astype("Int64").to_numpy(dtype=object, na_value=None).tolist()
@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import threading
 from core.db.engine import DBEngine
+from modules.data.market import load_tickers
+from modules.data.research import insert_sens_records
 from core.config import DB_CONFIG
 import logging
 
@@ -19,9 +21,7 @@ async def run_sens_check():
     logger.info("\n[%s] --- Running SENS Check ---", datetime.now().strftime('%H:%M'))
 
     # 1. Fetch Tickers
-    q_tickers = "SELECT ticker FROM stock_details"
-    rows = await DBEngine.fetch(q_tickers)
-    db_tickers = {r["ticker"].replace(".JO", "") for r in rows}
+    db_tickers = {t.replace(".JO", "") for t in await load_tickers()}
 
     if not db_tickers:
         return
@@ -36,6 +36,9 @@ async def run_sens_check():
         return
 
     new_items = []
+    # (ticker, pub_date) already queued this run: the SENS table has no unique
+    # constraint, and the DB check below can't see rows not yet inserted
+    seen = set()
 
     for row in sens_rows:
         try:
@@ -57,6 +60,10 @@ async def run_sens_check():
             if not pub_date:
                 continue
 
+            key = (ticker, pub_date)
+            if key in seen:
+                continue
+
             # Check DB
             exists_q = (
                 "SELECT 1 FROM SENS WHERE ticker = $1 AND publication_datetime = $2"
@@ -76,24 +83,38 @@ async def run_sens_check():
 
             content = _fetch_content(link)
 
-            # Insert
-            ins_q = "INSERT INTO SENS (ticker, publication_datetime, content) VALUES ($1, $2, $3)"
-            await DBEngine.execute(ins_q, f"{ticker}.JO", pub_date, content)
-
             logger.info("  -> NEW SENS: %s @ %s", ticker, pub_date)
-            new_items.append((f"{ticker}.JO", content))
+            seen.add(key)
+            new_items.append((f"{ticker}.JO", pub_date, content))
 
         except Exception:
             logger.exception("Error processing row")
 
     if not new_items:
         logger.info("No new SENS announcements found.")
+        return
+
+    # Insert all new announcements in one batch; if that is rejected, retry
+    # one by one so a single bad row doesn't drop (or skip the AI trigger
+    # for) the valid announcements
+    try:
+        await insert_sens_records(new_items)
+    except Exception:
+        logger.exception("Batch SENS insert failed; retrying row by row")
+        saved = []
+        for item in new_items:
+            try:
+                await insert_sens_records([item])
+                saved.append(item)
+            except Exception:
+                logger.exception("Error saving SENS %s @ %s", item[0], item[1])
+        new_items = saved
 
     # Trigger AI
     import modules.analysis.engine as ai_engine
 
     # Inside run_sens_check loop:
-    for t_full, content in new_items:
+    for t_full, _pub_date, content in new_items:
         # We await it directly. Since this is an async function,
         # it runs cooperatively within the event loop.
         await ai_engine.analyze_new_sens(t_full, content)
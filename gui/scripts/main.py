@@ -62,9 +62,8 @@ from core.db.engine import DBEngine
 from core.db.notifier import DBNotifier
 from components.watchlist import WatchlistWidget
 
-
-from components.chart_window import ChartWindow
-from components.research_window import ResearchWindow
+# ChartWindow/ResearchWindow (matplotlib, AI engine) are imported on the first
+# ticker selection so the main window appears before those stacks load.
 
 
 class CommandCenter(ttk.Window):
@@ -129,6 +128,10 @@ class CommandCenter(ttk.Window):
                 # Refresh watchlist once DB is ready
                 self.watchlist.refresh()
 
+                # Load the chart stack in the background once the watchlist
+                # is up, so the first ticker click doesn't pay for it
+                self.after(1000, self._warm_chart_imports)
+
                 # Auto-start market agent if enabled via env var (default: enabled)
                 try:
                     auto = os.environ.get("AUTO_START_AGENT", "1").lower()
@@ -152,6 +155,25 @@ class CommandCenter(ttk.Window):
 
         self.async_run_bg(setup_services(), callback=on_services_ready)
 
+    def _warm_chart_imports(self):
+        """Import pandas/matplotlib/mplfinance on a daemon thread.
+
+        Only modules are imported (no Tk objects are created), so this is
+        safe off the main thread; the first ChartWindow then finds them in
+        sys.modules instead of blocking the UI on a ~1s import.
+        """
+
+        def _warm():
+            import importlib
+
+            for name in ("core.utils.dataframe_utils", "core.utils.chart_drawing_utils"):
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    logging.getLogger(__name__).debug("Chart warm-up import failed: %s", name, exc_info=True)
+
+        threading.Thread(target=_warm, name="chart-warmup", daemon=True).start()
+
     def _run_event_loop(self):
         """Run the asyncio event loop in a separate thread"""
         asyncio.set_event_loop(self.loop)
@@ -230,6 +252,9 @@ class CommandCenter(ttk.Window):
         """Callback when watchlist row is clicked"""
         logging.getLogger(__name__).info("Selected: %s", ticker)
 
+        from components.chart_window import ChartWindow
+        from components.research_window import ResearchWindow
+
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
 
@@ -0,0 +1,20 @@
+from scripts.trim_sens_footers import _normalize_text, trim_sens_footer
+
+
+def test_normalize_text_strips_trailing_whitespace_and_collapses_blanks():
+    text = "\r\n\nLine one   \r\nLine two\t\n\n\n\n\nLine three \n\n"
+    assert _normalize_text(text) == "Line one\nLine two\n\n\nLine three\n"
+
+
+def test_trim_at_produced_by_renormalizes_form_feeds():
+    text = "Page one \x0cPage two\nProduced by SENS"
+    trimmed, result = trim_sens_footer(text)
+    assert trimmed == "Page one\nPage two\n"
+    assert result.reason == "cut_at_produced_by"
+    assert result.changed
+
+
+def test_trim_collapses_form_feed_runs_in_kept_text():
+    text = "Intro\n\x0c\x0c\x0c\x0c\x0cBody\nProduced by the JSE SENS Department"
+    trimmed, _ = trim_sens_footer(text)
+    assert trimmed == "Intro\n\n\nBody\n"
@@ -12,6 +12,10 @@ Heuristics (in order):
 By default this runs in dry-run mode and prints what it *would* do.
 Use --in-place to rewrite files.
 
+Files found not to need trimming are remembered by (mtime, size) in
+.trim_sens_footers.cache.json under the scan root and skipped on later runs
+until they change (--no-cache to re-check everything).
+
 Examples:
   python gui/scripts/trim_sens_footers.py --dry-run
   python gui/scripts/trim_sens_footers.py --in-place --backup
@@ -22,7 +26,13 @@ from __future__ import annotations
 
 import argparse
 import glob
+import io
+import json
+import os
 import re
+import shutil
+import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -37,6 +47,12 @@ _FOOTER_MARKER_RE = re.compile(
     re.IGNORECASE | re.MULTILINE,
 )
 
+# Longest the buffered per-file report may sit unflushed during a scan
+_PROGRESS_FLUSH_SECS = 0.5
+
+# Glob patterns that are just an optional "**/" plus "*<suffix>"
+_SIMPLE_SUFFIX_PATTERN_RE = re.compile(r"^(\*\*/)?\*(\.[\w.]+)$")
+
 
 @dataclass(frozen=True)
 class TrimResult:
@@ -47,15 +63,16 @@ class TrimResult:
 
 
 def _normalize_text(text: str) -> str:
-    t = (text or "").replace("\r\n", "\n").replace("\r", "\n")
-    # Strip trailing whitespace per line.
-    lines = [ln.rstrip() for ln in t.split("\n")]
-
-    # Collapse excessive blank lines (keep max 2).
+    # Stream lines through StringIO: newline=None translates \r\n / \r on
+    # the fly, so no replace()d copies or intermediate line list are built
+    # before the normalised output.
     out: list[str] = []
     blank_run = 0
-    for ln in lines:
-        if ln.strip() == "":
+    for raw_ln in io.StringIO(text or "", newline=None):
+        # Strip trailing whitespace per line.
+        ln = raw_ln.rstrip()
+        # Collapse excessive blank lines (keep max 2).
+        if not ln.strip():
             blank_run += 1
             if blank_run <= 2:
                 out.append("")
@@ -147,10 +164,38 @@ def trim_sens_footer(text: str) -> tuple[str, TrimResult]:
     return original, TrimResult(False, "no_change", len(original), len(original))
 
 
+def _scan_suffix(root: Path, suffix: str, recursive: bool) -> list[Path]:
+    """List files under root whose name ends with suffix.
+
+    Uses os.scandir directly: no pattern compilation or fnmatch per entry,
+    and DirEntry's cached type avoids an extra stat per file.
+    """
+    out: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        out.append(Path(entry.path))
+        except OSError:
+            continue
+    out.sort()
+    return out
+
+
 def _iter_target_files(root: Path, patterns: list[str]) -> list[Path]:
     files: list[Path] = []
     for pat in patterns:
-        files.extend(root.glob(pat))
+        m = _SIMPLE_SUFFIX_PATTERN_RE.match(pat)
+        if m:
+            # "*.txt" / "**/*.txt": plain suffix match, no glob machinery
+            files.extend(_scan_suffix(root, m.group(2), recursive=bool(m.group(1))))
+        else:
+            files.extend(p for p in root.glob(pat) if p.is_file())
     # De-dup while preserving order.
     seen: set[Path] = set()
     out: list[Path] = []
@@ -160,7 +205,7 @@ def _iter_target_files(root: Path, patterns: list[str]) -> list[Path]:
             continue
         seen.add(rp)
         out.append(p)
-    return [p for p in out if p.is_file()]
+    return out
 
 
 def _expand_path_specs(specs: list[str], *, repo_root: Path, gui_root: Path) -> list[Path]:
@@ -230,6 +275,31 @@ def _expand_path_specs(specs: list[str], *, repo_root: Path, gui_root: Path) ->
     return out
 
 
+_CACHE_FILENAME = ".trim_sens_footers.cache.json"
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_cache(cache_path: Path) -> dict[str, list[int]]:
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path: Path, cache: dict[str, list[int]]) -> None:
+    try:
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as ex:
+        print(f"WARN could not write cache {cache_path}: {ex}")
+
+
 def main(argv: list[str] | None = None) -> int:
     script_dir = Path(__file__).resolve().parent
     gui_root = script_dir.parent
@@ -253,6 +323,11 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--in-place", action="store_true", help="Rewrite files in place")
     parser.add_argument("--backup", action="store_true", help="When using --in-place, write a .bak copy")
     parser.add_argument("--dry-run", action="store_true", help="Show changes but do not write")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-read every file, ignoring the {_CACHE_FILENAME} of files already known to need no trim",
+    )
     args = parser.parse_args(argv)
 
     if args.paths:
@@ -269,37 +344,88 @@ def main(argv: list[str] | None = None) -> int:
     changed = 0
     total = 0
     saved_chars = 0
-
-    for path in targets:
-        total += 1
+    skipped = 0
+
+    # Files that needed no trim last time are skipped while their
+    # (mtime_ns, size) is unchanged; os.stat is far cheaper than a read.
+    cache_path = (gui_root if args.paths else args.root) / _CACHE_FILENAME
+    cache = {} if args.no_cache else _load_cache(cache_path)
+    new_cache: dict[str, list[int]] = {}
+
+    # The per-file TRIM/KEEP report would otherwise cost one write() per
+    # line on a terminal; block-buffer it while scanning, flushing at most
+    # every _PROGRESS_FLUSH_SECS so interactive runs still show progress.
+    # The caller's stdout buffering is restored afterwards.
+    prev_line_buffering = getattr(sys.stdout, "line_buffering", None)
+    if prev_line_buffering:
         try:
-            raw = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception as ex:
-            print(f"SKIP {path}: read failed: {ex}")
-            continue
+            sys.stdout.reconfigure(line_buffering=False)
+        except (AttributeError, ValueError):
+            prev_line_buffering = None
+
+    try:
+        last_flush = time.monotonic()
+        for path in targets:
+            total += 1
+            key = str(path.resolve())
+            sig = _file_signature(path)
+            if sig is not None and cache.get(key) == sig:
+                new_cache[key] = sig
+                skipped += 1
+                continue
+            try:
+                raw = path.read_text(encoding="utf-8", errors="ignore")
+            except Exception as ex:
+                print(f"SKIP {path}: read failed: {ex}")
+                continue
 
-        trimmed, info = trim_sens_footer(raw)
-        if info.changed:
-            changed += 1
-            saved_chars += max(0, info.original_chars - info.trimmed_chars)
-
-            print(f"TRIM {path} ({info.reason}) chars {info.original_chars} -> {info.trimmed_chars}")
-
-            if write_enabled:
-                try:
-                    if args.backup:
-                        bak = path.with_suffix(path.suffix + ".bak")
-                        if not bak.exists():
-                            bak.write_text(raw, encoding="utf-8")
-                    path.write_text(trimmed, encoding="utf-8")
-                except Exception as ex:
-                    print(f"ERROR {path}: write failed: {ex}")
-        else:
-            print(f"KEEP {path} ({info.reason})")
+            trimmed, info = trim_sens_footer(raw)
+            if info.changed:
+                changed += 1
+                saved_chars += max(0, info.original_chars - info.trimmed_chars)
+
+                print(f"TRIM {path} ({info.reason}) chars {info.original_chars} -> {info.trimmed_chars}")
+
+                if write_enabled:
+                    try:
+                        if args.backup:
+                            bak = path.with_suffix(path.suffix + ".bak")
+                            if not bak.exists():
+                                # Byte-for-byte copy: no decode/re-encode, and
+                                # bytes dropped by errors="ignore" are kept.
+                                shutil.copyfile(path, bak)
+                        path.write_text(trimmed, encoding="utf-8")
+                        # Now trimmed, so it can be skipped next run
+                        sig = _file_signature(path)
+                        if sig is not None:
+                            new_cache[key] = sig
+                    except Exception as ex:
+                        print(f"ERROR {path}: write failed: {ex}")
+            else:
+                print(f"KEEP {path} ({info.reason})")
+                if sig is not None:
+                    new_cache[key] = sig
+            now = time.monotonic()
+            if now - last_flush >= _PROGRESS_FLUSH_SECS:
+                sys.stdout.flush()
+                last_flush = now
+    finally:
+        if prev_line_buffering:
+            try:
+                sys.stdout.reconfigure(line_buffering=True)
+            except (AttributeError, ValueError):
+                pass
 
-    print(f"\nProcessed {total} file(s). Trimmed {changed}. Saved ~{saved_chars} characters.")
+    if not args.dry_run:
+        _save_cache(cache_path, new_cache)
+
+    print(
+        f"\nProcessed {total} file(s) ({skipped} unchanged since last run). "
+        f"Trimmed {changed}. Saved ~{saved_chars} characters."
+    )
     if args.dry_run or not args.in_place:
         print("No files were modified (dry-run / not in-place).")
+    sys.stdout.flush()
     return 0
 
 
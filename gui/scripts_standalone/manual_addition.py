@@ -6,9 +6,12 @@ GUI_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if GUI_ROOT not in sys.path:
     sys.path.insert(0, GUI_ROOT)
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+logger = logging.getLogger(__name__)
+
 # Async DBEngine import fallback (matches other scripts)
 def _try_import_dbengine():
     """Try importing the async DBEngine and print detailed tracebacks on failure."""
@@ -28,11 +31,9 @@ def _try_import_dbengine():
         attempts.append(("gui.core.db.engine", exc, traceback.format_exc()))
 
     # Emit helpful debug details so running the script shows the real import error.
-    print("DEBUG: _try_import_dbengine: failed to import DBEngine from any candidate module")
+    logger.error("_try_import_dbengine: failed to import DBEngine from any candidate module")
     for name, exc, tb in attempts:
-        print(f"  Attempted import: {name}")
-        print(f"    Exception: {exc}")
-        print(tb)
+        logger.error("  Attempted import: %s\n    Exception: %s\n%s", name, exc, tb)
 
     return None, None
 
@@ -40,14 +41,105 @@ DBEngine, DBENGINE_IMPORT_PATH = _try_import_dbengine()
 
 
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+import functools
 import threading
-import yfinance as yf
+import time
 import asyncio
-import pandas as pd
 import queue
 
+# yfinance/pandas/numpy are imported on first download rather than here:
+# together they add several hundred ms to start-up for a dialog that is
+# mostly used to edit names.
+
+
+
+
+def _parse_sens_datetime(value):
+    """Parse 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' (midnight) into a datetime.
+
+    Uses datetime.fromisoformat, which handles both forms in one C-level
+    call. Returns None if the string is not a valid date/time.
+    """
+    value = value.strip()
+    if len(value) == 10:
+        value += " 00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+# Rows per server-side cursor fetch / treeview batch during refresh
+_REFRESH_CHUNK = 500
+
+# --- SQL used by the editor (built once at import) ---
+_Q_SELECT_STOCKS = "SELECT ticker, full_name FROM stock_details ORDER BY ticker"
+_Q_SELECT_MISSING_NAMES = (
+    "SELECT ticker, full_name FROM stock_details WHERE full_name IS NULL OR full_name = '' ORDER BY ticker"
+)
+_Q_INSERT_STOCK = "INSERT INTO stock_details (ticker, full_name) VALUES ($1, $2)"
+_Q_UPDATE_STOCK = "UPDATE stock_details SET ticker = $1, full_name = $2 WHERE ticker = $3"
+_Q_DELETE_STOCK = "DELETE FROM stock_details WHERE ticker = $1"
+_Q_INSERT_WATCHLIST = "INSERT INTO watchlist (ticker, status) VALUES ($1, $2)"
+
+
+def _rows_affected(status):
+    """Row count from an asyncpg command tag such as 'UPDATE 1', or None."""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return None
+
 
+@functools.lru_cache(maxsize=4096)
+def _format_ticker(ticker_str):
+    ticker = ticker_str.strip().upper()
+    if not ticker.endswith(".JO"):
+        ticker = f"{ticker}.JO"
+    return ticker
+
+
+_yf_session = None
+_yf_session_lock = threading.Lock()
+
+
+def _get_yf_session():
+    """Shared HTTP session for yfinance so TLS/keep-alive survive across clicks.
+
+    yfinance 1.x only accepts curl_cffi sessions; returns None (yfinance's
+    default) if curl_cffi is unavailable.
+    """
+    global _yf_session
+    with _yf_session_lock:
+        if _yf_session is None:
+            try:
+                from curl_cffi import requests as curl_requests
+
+                _yf_session = curl_requests.Session(impersonate="chrome")
+            except Exception:
+                logger.debug("curl_cffi session unavailable; using yfinance default")
+        return _yf_session
+
+
+# yf.download results keyed by (ticker, start/period), kept for an hour so
+# re-clicks and retries for the same ticker skip the network.
+_YF_CACHE_TTL = 3600
+_yf_cache = {}
+
+
+def _cached_yf_download(ticker, **kwargs):
+    """yf.download with a short-lived in-process cache of the result frame."""
+    key = (tuple(ticker) if isinstance(ticker, list) else ticker, tuple(sorted(kwargs.items())))
+    hit = _yf_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _YF_CACHE_TTL:
+        return hit[1].copy()
+    import yfinance as yf
+
+    data = yf.download(ticker, session=_get_yf_session(), **kwargs)
+    if not data.empty:
+        _yf_cache[key] = (time.monotonic(), data)
+    return data.copy()
 
 
 class StockEditorApp:
@@ -56,8 +148,21 @@ class StockEditorApp:
         master.title("Stock Details & SENS Editor")
         master.geometry("700x800")
 
+        # --- Async loop shared by every DB call ---
+        # DBEngine's asyncpg pool is bound to the loop that created it, so all
+        # queries run on one long-lived loop thread and reuse its pooled
+        # connections instead of paying a fresh connect per click.
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self.loop_thread.start()
+
         # --- NEW: Threading & Polling Setup ---
         self.download_queue = queue.Queue()
+        # The queue is only polled while a download worker is running.
+        self._poll_id = None
+        self._active_downloads = 0
+        self._refresh_in_flight = False
+        self._refresh_pending = False
 
         # --- Variables ---
         self.filter_var = tk.BooleanVar()
@@ -82,10 +187,10 @@ class StockEditorApp:
         )
         filter_check.pack(side="left", padx=5)
 
-        refresh_button = ttk.Button(
+        self.refresh_button = ttk.Button(
             filter_frame, text="Refresh Data", command=self.refresh_data
         )
-        refresh_button.pack(side="right", padx=5)
+        self.refresh_button.pack(side="right", padx=5)
 
         # --- Treeview Frame (Data Table) ---
         columns = ("ticker", "full_name")
@@ -107,7 +212,7 @@ class StockEditorApp:
         self.tree.pack(fill="both", expand=True)
 
         # Bind selection event
-        print("DEBUG: Binding <<TreeviewSelect>> to on_tree_select")
+        logger.debug("Binding <<TreeviewSelect>> to on_tree_select")
         self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
 
         # --- Form Frame (Add/Edit) ---
@@ -159,6 +264,13 @@ class StockEditorApp:
         )
         self.download_button.pack(side="left", padx=15)
 
+        self.download_all_button = ttk.Button(
+            button_container,
+            text="Download 5Y (All Listed)",
+            command=self.download_5y_all_ui,
+        )
+        self.download_all_button.pack(side="left", padx=5)
+
         self.watchlist_button = ttk.Button(
             button_container, text="Add to Watchlist", command=self.add_to_watchlist
         )
@@ -216,21 +328,17 @@ class StockEditorApp:
         self.analyze_sens_button.pack(side="left", padx=10)
 
         # --- Initial Data Load ---
-        print("DEBUG: Performing initial data load...")
+        logger.debug("Performing initial data load...")
         self.refresh_data()
-        print("DEBUG: Initialization complete.")
-
-        # --- Start Poller ---
-        # --- CORRECTED LINE ---
-        self.master.after(100, self.process_download_queue)
+        logger.debug("Initialization complete.")
 
     # --- Database Functions ---
 
     def get_connection(self):
         """Check for async `DBEngine` availability (returns DBEngine or None)."""
-        print("DEBUG: get_connection: Checking async DBEngine availability...")
+        logger.debug("get_connection: Checking async DBEngine availability...")
         if DBEngine is None:
-            print("DEBUG: get_connection: DBEngine not available.")
+            logger.debug("get_connection: DBEngine not available.")
             messagebox.showerror(
                 "Database Error",
                 "DBEngine not available. Ensure `core.db.engine` can be imported.",
@@ -238,92 +346,166 @@ class StockEditorApp:
             return None
         return DBEngine
 
+    # --- Async loop helpers ---
+    def _run_event_loop(self):
+        """Run the asyncio event loop in a separate thread."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _run_async(self, coro, timeout=120):
+        """Run a coroutine on the shared loop and wait for its result.
+
+        Safe to call from the Tk thread or from worker threads.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout=timeout)
+
+    def on_closing(self):
+        """Close the DB pool and stop the loop before destroying the window."""
+        try:
+            if DBEngine is not None:
+                self._run_async(DBEngine.close(), timeout=10)
+        except Exception as e:
+            logger.error("on_closing: pool close failed: %s", e)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.master.destroy()
+
     # --- Sync wrappers for async DBEngine ---
     def _fetch_sync(self, query, *args):
         """Synchronously run `DBEngine.fetch`. Raises if DBEngine unavailable."""
         if DBEngine is None:
             raise RuntimeError("DBEngine not available")
-        return asyncio.run(DBEngine.fetch(query, *args))
+        return self._run_async(DBEngine.fetch(query, *args))
 
     def _execute_sync(self, query, *args):
         """Synchronously run `DBEngine.execute`. Raises if DBEngine unavailable."""
         if DBEngine is None:
             raise RuntimeError("DBEngine not available")
-        return asyncio.run(DBEngine.execute(query, *args))
+        return self._run_async(DBEngine.execute(query, *args))
 
-    def format_ticker(self, ticker_str):
+    @staticmethod
+    def format_ticker(ticker_str):
         """Ensures ticker is in the correct .JO format."""
         if not ticker_str:
             return None
-        ticker = ticker_str.strip().upper()
-        if not ticker.endswith(".JO"):
-            ticker = f"{ticker}.JO"
-        return ticker
+        return _format_ticker(ticker_str)
 
     def refresh_data(self):
-        """Fetches data from the DB and populates the treeview (uses async DBEngine)."""
-        print("DEBUG: refresh_data: Starting...")
-        # Clear existing tree
-        print("DEBUG: refresh_data: Clearing old tree data.")
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        """Fetch stock_details in the background and repopulate the treeview.
 
-        try:
-            if self.filter_var.get():
-                print("DEBUG: refresh_data: Fetching unmatched entries.")
-                query = "SELECT ticker, full_name FROM stock_details WHERE full_name IS NULL OR full_name = '' ORDER BY ticker"
-            else:
-                print("DEBUG: refresh_data: Fetching all entries.")
-                query = "SELECT ticker, full_name FROM stock_details ORDER BY ticker"
+        The query streams through a server-side cursor on the shared loop;
+        rows are posted to `download_queue` in chunks as ("REFRESH_ROWS",
+        (first, rows)) and applied by `process_download_queue`, so the Tk
+        thread never waits on the DB and the first rows show up early.
+        """
+        logger.debug("refresh_data: Starting...")
+        if DBEngine is None:
+            self.get_connection()
+            return
+        if self._refresh_in_flight:
+            # Re-run once the current fetch lands so the latest filter wins
+            self._refresh_pending = True
+            return
 
-            rows = self._fetch_sync(query)
-            print(f"DEBUG: refresh_data: Found {len(rows)} records.")
+        if self.filter_var.get():
+            logger.debug("refresh_data: Fetching unmatched entries.")
+            query = _Q_SELECT_MISSING_NAMES
+        else:
+            logger.debug("refresh_data: Fetching all entries.")
+            query = _Q_SELECT_STOCKS
 
-            for r in rows or []:
-                self.tree.insert("", "end", values=(r.get("ticker"), r.get("full_name")))
-        except Exception as e:
-            print(f"DEBUG: refresh_data: FAILED: {e}")
-            messagebox.showerror("Database Error", f"Error fetching data: {e}")
-        print("DEBUG: refresh_data: Finished.")
+        self._refresh_in_flight = True
+        self.refresh_button.config(state="disabled")
+
+        def _done(fut):
+            # Runs on the loop thread; tell the Tk poller the stream ended
+            try:
+                self.download_queue.put(("REFRESH_DONE", fut.result()))
+            except Exception as e:
+                self.download_queue.put(("REFRESH_ERROR", str(e)))
+
+        asyncio.run_coroutine_threadsafe(self._stream_refresh(query), self.loop).add_done_callback(_done)
+        self._schedule_queue_poll()
+
+    async def _stream_refresh(self, query):
+        """Stream `query` through a cursor, posting (ticker, full_name) chunks. Returns the row count."""
+        pool = await DBEngine.get_pool()
+        count = 0
+        first = True
+        chunk = []
+        async with pool.acquire() as conn:
+            # asyncpg cursors need a transaction
+            async with conn.transaction():
+                async for r in conn.cursor(query, prefetch=_REFRESH_CHUNK):
+                    chunk.append((r["ticker"], r["full_name"]))
+                    if len(chunk) >= _REFRESH_CHUNK:
+                        self.download_queue.put(("REFRESH_ROWS", (first, chunk)))
+                        count += len(chunk)
+                        first, chunk = False, []
+        # Always post the tail, so an empty result still clears the tree
+        self.download_queue.put(("REFRESH_ROWS", (first, chunk)))
+        return count + len(chunk)
+
+    def _populate_tree(self, rows, clear=True):
+        """Append `rows` to the treeview, clearing it first if `clear` (Tk thread only)."""
+        if clear:
+            children = self.tree.get_children()
+            if children:
+                self.tree.delete(*children)
+
+        # Unpack the tree while inserting so Tk does one geometry pass
+        # for the whole batch instead of one per row.
+        self.tree.pack_forget()
+        try:
+            for values in rows:
+                self.tree.insert("", "end", values=values)
+        finally:
+            self.tree.pack(fill="both", expand=True)
+
+    def _finish_refresh(self):
+        self._refresh_in_flight = False
+        self.refresh_button.config(state="normal")
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_data()
 
     def add_stock(self):
         """Adds a new stock record to the database (async DBEngine)."""
-        print("DEBUG: add_stock: Starting...")
+        logger.debug("add_stock: Starting...")
         ticker = self.format_ticker(self.ticker_entry.get())
         full_name = self.full_name_entry.get().strip()
 
         if not ticker:
             messagebox.showwarning("Input Error", "Ticker cannot be empty.")
-            print("DEBUG: add_stock: Aborted, ticker empty.")
+            logger.debug("add_stock: Aborted, ticker empty.")
             return
 
         try:
-            query = "INSERT INTO stock_details (ticker, full_name) VALUES ($1, $2)"
-            print(f"DEBUG: add_stock: Executing query with ({ticker}, {full_name})")
-            self._execute_sync(query, ticker, full_name)
+            logger.debug("add_stock: Executing query with (%s, %s)", ticker, full_name)
+            self._execute_sync(_Q_INSERT_STOCK, ticker, full_name)
 
             messagebox.showinfo("Success", f"Successfully added {ticker}.")
             self.refresh_data()
             self.clear_form_and_selection()
 
         except Exception as e:
-            print(f"DEBUG: add_stock: FAILED (Exception): {e}")
+            logger.error("add_stock: FAILED (Exception): %s", e)
             msg = str(e).lower()
             if "duplicate" in msg or "unique" in msg:
                 messagebox.showerror("Database Error", f"Error: Ticker '{ticker}' already exists.")
             else:
                 messagebox.showerror("Database Error", f"Error adding record: {e}")
-        print("DEBUG: add_stock: Finished.")
+        logger.debug("add_stock: Finished.")
 
     def update_stock(self):
         """Updates an existing stock record (uses async DBEngine)."""
-        print("DEBUG: update_stock: Starting...")
+        logger.debug("update_stock: Starting...")
         selected_item = self.tree.focus()
         if not selected_item:
             messagebox.showwarning(
                 "Selection Error", "Please select an item from the list to update."
             )
-            print("DEBUG: update_stock: Aborted, no item selected.")
+            logger.debug("update_stock: Aborted, no item selected.")
             return
 
         original_ticker = self.tree.item(selected_item)["values"][0]
@@ -332,20 +514,16 @@ class StockEditorApp:
 
         if not new_ticker:
             messagebox.showwarning("Input Error", "Ticker cannot be empty.")
-            print("DEBUG: update_stock: Aborted, new ticker is empty.")
+            logger.debug("update_stock: Aborted, new ticker is empty.")
             return
 
         try:
-            query = "UPDATE stock_details SET ticker = $1, full_name = $2 WHERE ticker = $3"
-            print(
-                f"DEBUG: update_stock: Executing query with ({new_ticker}, {new_full_name}, {original_ticker})"
-            )
-            result = self._execute_sync(query, new_ticker, new_full_name, original_ticker)
+            logger.debug("update_stock: Executing query with (%s, %s, %s)", new_ticker, new_full_name, original_ticker)
+            result = self._execute_sync(_Q_UPDATE_STOCK, new_ticker, new_full_name, original_ticker)
 
-            # Check whether the row existed (best-effort)
-            rows = self._fetch_sync("SELECT 1 FROM stock_details WHERE ticker = $1", new_ticker)
-            if not rows:
-                # If update didn't change anything and the new ticker doesn't exist, warn
+            # The command tag ("UPDATE <n>") says whether a row matched,
+            # so no follow-up SELECT round trip is needed.
+            if _rows_affected(result) == 0:
                 messagebox.showwarning("Update Error", f"No record found for ticker: {original_ticker}")
             else:
                 messagebox.showinfo("Success", f"Successfully updated {original_ticker}.")
@@ -354,23 +532,23 @@ class StockEditorApp:
             self.clear_form_and_selection()
 
         except Exception as e:
-            print(f"DEBUG: update_stock: FAILED (Exception): {e}")
+            logger.error("update_stock: FAILED (Exception): %s", e)
             msg = str(e).lower()
             if "unique" in msg or "duplicate" in msg:
                 messagebox.showerror("Database Error", f"Error: Ticker '{new_ticker}' already exists.")
             else:
                 messagebox.showerror("Database Error", f"Error updating record: {e}")
-        print("DEBUG: update_stock: Finished.")
+        logger.debug("update_stock: Finished.")
 
     def delete_stock(self):
         """Deletes a selected stock record (async DBEngine)."""
-        print("DEBUG: delete_stock: Starting...")
+        logger.debug("delete_stock: Starting...")
         selected_item = self.tree.focus()
         if not selected_item:
             messagebox.showwarning(
                 "Selection Error", "Please select an item from the list to delete."
             )
-            print("DEBUG: delete_stock: Aborted, no item selected.")
+            logger.debug("delete_stock: Aborted, no item selected.")
             return
 
         ticker = self.tree.item(selected_item)["values"][0]
@@ -378,24 +556,22 @@ class StockEditorApp:
         if not messagebox.askyesno(
             "Confirm Delete", f"Are you sure you want to delete {ticker}?"
         ):
-            print("DEBUG: delete_stock: User cancelled delete.")
+            logger.debug("delete_stock: User cancelled delete.")
             return
 
         try:
-            # Ensure row exists
-            rows = self._fetch_sync("SELECT ticker FROM stock_details WHERE ticker = $1", ticker)
-            if not rows:
+            result = self._execute_sync(_Q_DELETE_STOCK, ticker)
+            if _rows_affected(result) == 0:
                 messagebox.showwarning("Delete Error", f"No record found for ticker: {ticker}")
                 return
 
-            self._execute_sync("DELETE FROM stock_details WHERE ticker = $1", ticker)
             messagebox.showinfo("Success", f"Successfully deleted {ticker}.")
 
             self.refresh_data()
             self.clear_form_and_selection()
 
         except Exception as e:
-            print(f"DEBUG: delete_stock: FAILED (Exception): {e}")
+            logger.error("delete_stock: FAILED (Exception): %s", e)
             if "violates foreign key constraint" in str(e).lower():
                 messagebox.showerror(
                     "Delete Error",
@@ -403,11 +579,11 @@ class StockEditorApp:
                 )
             else:
                 messagebox.showerror("Database Error", f"Error deleting record: {e}")
-        print("DEBUG: delete_stock: Finished.")
+        logger.debug("delete_stock: Finished.")
 
     def add_to_watchlist(self):
         """Adds the current ticker to the watchlist with status 'Pending' (async DBEngine)."""
-        print("DEBUG: add_to_watchlist: Starting...")
+        logger.debug("add_to_watchlist: Starting...")
         ticker = self.format_ticker(self.ticker_entry.get())
 
         if not ticker:
@@ -415,18 +591,18 @@ class StockEditorApp:
             return
 
         try:
-            self._execute_sync("INSERT INTO watchlist (ticker, status) VALUES ($1, $2)", ticker, "Pending")
+            self._execute_sync(_Q_INSERT_WATCHLIST, ticker, "Pending")
             messagebox.showinfo("Success", f"Successfully added {ticker} to Watchlist.")
         except Exception as e:
-            print(f"DEBUG: add_to_watchlist: FAILED: {e}")
+            logger.error("add_to_watchlist: FAILED: %s", e)
             messagebox.showerror("Database Error", f"Error adding to watchlist: {e}")
-        print("DEBUG: add_to_watchlist: Finished.")
+        logger.debug("add_to_watchlist: Finished.")
 
     # --- SENS Functions ---
 
     def add_sens(self):
         """Adds a new SENS record to the database (async DBEngine)."""
-        print("DEBUG: add_sens: Starting...")
+        logger.debug("add_sens: Starting...")
 
         # 1. Get Ticker
         ticker = self.format_ticker(self.ticker_entry.get())
@@ -435,51 +611,44 @@ class StockEditorApp:
                 "Input Error",
                 "Ticker cannot be empty. Select a stock or type one in the 'Ticker' box.",
             )
-            print("DEBUG: add_sens: Aborted, ticker empty.")
+            logger.debug("add_sens: Aborted, ticker empty.")
             return
 
         # 2. Get Datetime
         datetime_str = self.sens_datetime_var.get().strip()
         if not datetime_str:
             messagebox.showwarning("Input Error", "Date/Time cannot be empty.")
-            print("DEBUG: add_sens: Aborted, datetime empty.")
+            logger.debug("add_sens: Aborted, datetime empty.")
             return
 
         # 3. Get Content
         content = self.sens_content_text.get("1.0", "end-1c").strip()
         if not content:
             messagebox.showwarning("Input Error", "SENS Content cannot be empty.")
-            print("DEBUG: add_sens: Aborted, content empty.")
+            logger.debug("add_sens: Aborted, content empty.")
             return
 
         # 4. Validate Datetime
-        pub_datetime = None
-        try:
-            pub_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-        except ValueError:
-            try:
-                pub_datetime = datetime.strptime(datetime_str, "%Y-%m-%d")
-                print(f"DEBUG: add_sens: Date-only detected. Using {pub_datetime}.")
-            except ValueError:
-                messagebox.showwarning(
-                    "Input Error",
-                    "Invalid Date/Time format. Please use YYYY-MM-DD HH:MM or just YYYY-MM-DD.",
-                )
-                print("DEBUG: add_sens: Aborted, invalid datetime format.")
-                return
+        pub_datetime = _parse_sens_datetime(datetime_str)
+        if pub_datetime is None:
+            messagebox.showwarning(
+                "Input Error",
+                "Invalid Date/Time format. Please use YYYY-MM-DD HH:MM or just YYYY-MM-DD.",
+            )
+            logger.debug("add_sens: Aborted, invalid datetime format.")
+            return
 
         # 5. Save to Database
         try:
-            query = "INSERT INTO SENS (ticker, publication_datetime, content) VALUES ($1, $2, $3)"
-            print(
-                f"DEBUG: add_sens: Executing query with ({ticker}, {pub_datetime}, [content])"
-            )
-            self._execute_sync(query, ticker, pub_datetime, content)
+            from modules.data.research import insert_sens_records
+
+            logger.debug("add_sens: Inserting SENS row (%s, %s, [content])", ticker, pub_datetime)
+            self._run_async(insert_sens_records([(ticker, pub_datetime, content)]))
 
             messagebox.showinfo("Success", f"Successfully added SENS for {ticker}.")
 
         except Exception as e:
-            print(f"DEBUG: add_sens: FAILED (Exception): {e}")
+            logger.error("add_sens: FAILED (Exception): %s", e)
             msg = str(e).lower()
             if "violates foreign key constraint" in msg or "foreign key" in msg:
                 messagebox.showerror(
@@ -491,7 +660,7 @@ class StockEditorApp:
                     "Database Error",
                     f"Error adding SENS record: {e}",
                 )
-        print("DEBUG: add_sens: Finished.")
+        logger.debug("add_sens: Finished.")
 
     # --- NEW DOWNLOAD LOGIC ---
 
@@ -509,13 +678,45 @@ class StockEditorApp:
         ):
             return
 
+        self._start_download_worker(self._threaded_download_worker, ticker)
+
+    def download_5y_all_ui(self):
+        """Click handler: download 5Y history for every ticker currently listed."""
+        tickers = [self.tree.item(i, "values")[0] for i in self.tree.get_children()]
+        if not tickers:
+            messagebox.showwarning("Input Error", "No tickers are listed.")
+            return
+
+        if not messagebox.askyesno(
+            "Confirm Download",
+            f"This will download 5 years of historical price data for {len(tickers)} tickers and save it to the database.\n\nContinue?",
+        ):
+            return
+
+        self._start_download_worker(self._threaded_batch_download_worker, tickers)
+
+    def _start_download_worker(self, target, arg):
         self.download_button.config(state="disabled", text="Downloading...")
+        self.download_all_button.config(state="disabled")
+
+        threading.Thread(target=target, args=(arg,), daemon=True).start()
+        self._active_downloads += 1
+        self._schedule_queue_poll()
 
-        threading.Thread(
-            target=self._threaded_download_worker,
-            args=(ticker,),
-            daemon=True,
-        ).start()
+    def _poll_interval(self):
+        """Queue poll delay in ms: fast while a refresh or download is in flight.
+
+        Polling stops entirely once nothing is outstanding, so the fast rate
+        only runs while a completion message is actually awaited.
+        """
+        if self._refresh_in_flight or self._active_downloads > 0:
+            return 20
+        return 100
+
+    def _schedule_queue_poll(self):
+        """Start polling the download queue if it is not already scheduled."""
+        if self._poll_id is None:
+            self._poll_id = self.master.after(self._poll_interval(), self.process_download_queue)
 
     # In manual_addition.py
 
@@ -526,8 +727,26 @@ class StockEditorApp:
                 self.download_queue.put(("ERROR", "DBEngine not available."))
                 return
 
-            print(f"DEBUG (DOWNLOAD): Starting 5Y download for {ticker}...")
-            data = yf.download(ticker, period="5y", auto_adjust=True)
+            from modules.data.market import get_last_trade_date
+
+            # Only fetch the delta when history already exists; the upsert
+            # handles any overlap with stored rows.
+            last_date = self._run_async(get_last_trade_date(ticker))
+            if last_date is not None and last_date >= date.today():
+                self.download_queue.put(("SUCCESS", f"{ticker} is already up to date ({last_date})."))
+                return
+
+            if last_date is not None:
+                start = last_date + timedelta(days=1)
+                logger.debug("download: Fetching %s from %s...", ticker, start)
+                data = _cached_yf_download(ticker, start=start, auto_adjust=True)
+            else:
+                logger.debug("download: Starting 5Y download for %s...", ticker)
+                data = _cached_yf_download(ticker, period="5y", auto_adjust=True)
+
+            if data.empty and last_date is not None:
+                self.download_queue.put(("SUCCESS", f"No new price data for {ticker} since {last_date}."))
+                return
 
             # --- NEW DEBUG CHECK: If DataFrame is empty ---
             if data.empty:
@@ -539,7 +758,7 @@ class StockEditorApp:
             # --- END NEW DEBUG CHECK ---
 
             # Use the async saver (run in this background thread)
-            records_saved, _ = asyncio.run(self._process_and_save_new_data(data, [ticker]))
+            records_saved, _ = self._run_async(self._process_and_save_new_data(data, [ticker]))
 
             self.download_queue.put((
                 "SUCCESS",
@@ -547,32 +766,78 @@ class StockEditorApp:
             ))
 
         except Exception as e:
-            print(f"ERROR (DOWNLOAD): Failed to download/save {ticker}: {e}")
+            logger.error("download: Failed to download/save %s: %s", ticker, e)
             self.download_queue.put(("ERROR", str(e)))  # Send the detailed error
 
-    def process_download_queue(self):
-        """Poller to update the GUI thread with download results."""
+    def _threaded_batch_download_worker(self, tickers):
+        """Worker: fetch many tickers in one threaded yf.download and save them in one batch."""
         try:
-            while not self.download_queue.empty():
+            if DBEngine is None:
+                self.download_queue.put(("ERROR", "DBEngine not available."))
+                return
+
+            logger.debug("download: Starting 5Y batch download for %s tickers...", len(tickers))
+            # threads=True lets yfinance fetch the tickers concurrently
+            data = _cached_yf_download(list(tickers), period="5y", auto_adjust=True, threads=True)
+            if data.empty:
+                self.download_queue.put(("ERROR", "YFinance returned an empty result for the listed tickers."))
+                return
+
+            records_saved, _ = self._run_async(self._process_and_save_new_data(data, list(tickers)))
+            self.download_queue.put((
+                "SUCCESS",
+                f"Successfully downloaded and saved {records_saved} records for {len(tickers)} tickers.",
+            ))
+
+        except Exception as e:
+            logger.error("download: Batch download failed: %s", e)
+            self.download_queue.put(("ERROR", str(e)))
+
+    def process_download_queue(self):
+        """Poller to update the GUI thread with download and refresh results.
+
+        Reschedules itself only while download workers or a refresh are
+        outstanding, so no timer runs when the editor is idle.
+        """
+        self._poll_id = None
+        while True:
+            try:
                 message_type, message = self.download_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._handle_queue_message(message_type, message)
+            except Exception:
+                logger.exception("process_download_queue: failed to handle %s", message_type)
 
-                self.download_button.config(
-                    state="normal", text="Download 5Y Price Data"
-                )
+        if self._active_downloads > 0 or self._refresh_in_flight:
+            self._schedule_queue_poll()
 
-                if message_type == "SUCCESS":
-                    messagebox.showinfo("Download Success", message)
-                elif message_type == "ERROR":
-                    messagebox.showerror("Download Error", message)
+    def _handle_queue_message(self, message_type, message):
+        if message_type == "REFRESH_ROWS":
+            first, rows = message
+            self._populate_tree(rows, clear=first)
+            return
+        if message_type == "REFRESH_DONE":
+            logger.debug("refresh_data: Found %s records.", message)
+            self._finish_refresh()
+            return
+        if message_type == "REFRESH_ERROR":
+            logger.error("refresh_data: FAILED: %s", message)
+            messagebox.showerror("Database Error", f"Error fetching data: {message}")
+            self._finish_refresh()
+            return
 
-        except queue.Empty:
-            pass
-        finally:
-            self.master.after(100, self.process_download_queue)
+        # Every download worker posts exactly one final message
+        self._active_downloads = max(0, self._active_downloads - 1)
 
-    # In manual_addition.py
+        self.download_button.config(state="normal", text="Download 5Y Price Data")
+        self.download_all_button.config(state="normal")
 
-    # In manual_addition.py
+        if message_type == "SUCCESS":
+            messagebox.showinfo("Download Success", message)
+        elif message_type == "ERROR":
+            messagebox.showerror("Download Error", message)
 
     async def _process_and_save_new_data(self, data, all_tickers):
         """Async helper: process the DataFrame and save rows using DBEngine only.
@@ -582,14 +847,27 @@ class StockEditorApp:
         if DBEngine is None:
             raise RuntimeError("DBEngine not available")
 
+        import numpy as np
+        import pandas as pd
+
         try:
-            # Simplify MultiIndex columns if present
-            if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.droplevel(1)
-                data.columns.name = None
+            if isinstance(data.columns, pd.MultiIndex) and len(all_tickers) > 1:
+                # Multi-ticker download: move the Ticker column level into rows
+                level = "Ticker" if "Ticker" in data.columns.names else 1
+                try:
+                    stacked = data.stack(level=level, future_stack=True)
+                except TypeError:
+                    # older pandas does not accept future_stack kw
+                    stacked = data.stack(level=level)
+                df = stacked.rename_axis(["Date", "ticker"]).reset_index()
+            else:
+                # Simplify MultiIndex columns if present
+                if isinstance(data.columns, pd.MultiIndex):
+                    data.columns = data.columns.droplevel(1)
+                    data.columns.name = None
 
-            df = data.reset_index()
-            df["ticker"] = all_tickers[0]
+                df = data.reset_index()
+                df["ticker"] = all_tickers[0]
 
             df.rename(
                 columns={
@@ -615,32 +893,36 @@ class StockEditorApp:
                 ]
             ]
 
-            df.dropna(subset=["close_price", "open_price", "high_price", "low_price"], inplace=True)
-
-            insert_q_async = (
-                "INSERT INTO daily_stock_data (ticker, trade_date, open_price, high_price, low_price, close_price, volume)"
-                " VALUES ($1, $2, $3, $4, $5, $6, $7)"
-                " ON CONFLICT (ticker, trade_date) DO UPDATE SET"
-                " open_price = EXCLUDED.open_price, high_price = EXCLUDED.high_price,"
-                " low_price = EXCLUDED.low_price, close_price = EXCLUDED.close_price,"
-                " volume = EXCLUDED.volume"
+            # Keep rows whose OHLC are all finite: one isfinite pass over a
+            # float64 block instead of pandas' per-column dropna path.
+            ohlc = df[["close_price", "open_price", "high_price", "low_price"]].to_numpy(dtype="float64", copy=False)
+            df = df.loc[np.isfinite(ohlc).all(axis=1)].copy()
+
+            # Build the parameter tuples column-wise instead of via iterrows():
+            # one C-level cast per column, then a single zip into Python values.
+            n = len(df)
+            if n == 0:
+                return 0, {}
+            # Round then cast all numeric columns in one pass, so 1234.9999
+            # becomes 1235 rather than truncating to 1234.
+            num_cols = ["open_price", "high_price", "low_price", "close_price", "volume"]
+            df["volume"] = df["volume"].fillna(0)
+            df[num_cols] = df[num_cols].round().astype("int64")
+
+            dates = df["trade_date"].dt.date.to_numpy().tolist()
+            data_to_insert = list(
+                zip(
+                    df["ticker"].tolist(),
+                    dates,
+                    *(df[c].tolist() for c in num_cols),
+                )
             )
 
-            count = 0
-            for _, row in df.iterrows():
-                await DBEngine.execute(
-                    insert_q_async,
-                    row["ticker"],
-                    row["trade_date"].date(),
-                    int(row["open_price"]),
-                    int(row["high_price"]),
-                    int(row["low_price"]),
-                    int(row["close_price"]),
-                    int(row["volume"]) if not pd.isna(row["volume"]) else 0,
-                )
-                count += 1
+            # executemany for small deltas, COPY + merge for full 5y loads
+            from modules.data.market import upsert_daily_prices
 
-            return count, {}
+            await upsert_daily_prices(data_to_insert)
+            return n, {}
 
         except KeyError as e:
             error_msg = (
@@ -657,7 +939,7 @@ class StockEditorApp:
         Gets the current Ticker and SENS content and sends them
         to the analysis_engine for AI analysis.
         """
-        print("DEBUG: trigger_sens_analysis: Starting...")
+        logger.debug("trigger_sens_analysis: Starting...")
 
         # 1. Get Ticker
         ticker = self.format_ticker(self.ticker_entry.get())
@@ -666,14 +948,14 @@ class StockEditorApp:
                 "Input Error",
                 "Ticker cannot be empty. Select a stock or type one in the 'Ticker' box.",
             )
-            print("DEBUG: trigger_sens_analysis: Aborted, ticker empty.")
+            logger.debug("trigger_sens_analysis: Aborted, ticker empty.")
             return
 
         # 2. Get Content
         content = self.sens_content_text.get("1.0", "end-1c").strip()
         if not content:
             messagebox.showwarning("Input Error", "SENS Content cannot be empty.")
-            print("DEBUG: trigger_sens_analysis: Aborted, content empty.")
+            logger.debug("trigger_sens_analysis: Aborted, content empty.")
             return
 
         # 3. Confirm with user
@@ -681,12 +963,12 @@ class StockEditorApp:
             "Confirm AI Analysis",
             f"This will run an AI analysis for {ticker} using the content in the text box and save the result to the Action Log.\n\n(Note: This does NOT save the SENS. Click 'Save New SENS' first if you haven't.)\n\nContinue?",
         ):
-            print("DEBUG: trigger_sens_analysis: User cancelled.")
+            logger.debug("trigger_sens_analysis: User cancelled.")
             return
 
         # 4. Start threaded analysis
         try:
-            print(f"     ==> Spawning AI thread for {ticker} from GUI...")
+            logger.debug("trigger_sens_analysis: Spawning AI thread for %s", ticker)
             threading.Thread(
                 target=analysis_engine.analyze_new_sens,
                 args=(ticker, content),  # Pass the .JO ticker
@@ -697,67 +979,67 @@ class StockEditorApp:
                 "Analysis Started",
                 f"AI analysis for {ticker} has been started in the background. \n\nCheck the 'Action Log' tab in the main app for the result in a few moments.",
             )
-            print("DEBUG: trigger_sens_analysis: Thread started.")
+            logger.debug("trigger_sens_analysis: Thread started.")
 
         except Exception as e:
-            print(f"DEBUG: trigger_sens_analysis: FAILED: {e}")
+            logger.error("trigger_sens_analysis: FAILED: %s", e)
             messagebox.showerror(
                 "Thread Error", f"Failed to start AI analysis thread: {e}"
             )
 
-        print("DEBUG: trigger_sens_analysis: Finished.")
+        logger.debug("trigger_sens_analysis: Finished.")
 
     # --- GUI Event Handlers ---
 
     def on_tree_select(self, event):
         """Populates the form when a tree item is selected."""
-        print("\nDEBUG: on_tree_select: Event triggered.")
+        logger.debug("on_tree_select: Event triggered.")
         selected_item = self.tree.focus()
         if not selected_item:
-            print("DEBUG: on_tree_select: No item focused, exiting.")
+            logger.debug("on_tree_select: No item focused, exiting.")
             return
 
         item = self.tree.item(selected_item)
         values = item["values"]
-        print(f"DEBUG: on_tree_select: Selected item values: {values}")
+        logger.debug("on_tree_select: Selected item values: %s", values)
         ticker, full_name = values
 
-        print("DEBUG: on_tree_select: Calling clear_entry_boxes()...")
+        logger.debug("on_tree_select: Calling clear_entry_boxes()...")
         self.clear_entry_boxes()
 
         # Strip .JO for cleaner editing
         if ticker.endswith(".JO"):
             ticker = ticker[:-3]
 
-        print(f"DEBUG: on_tree_select: Inserting '{ticker}' into ticker_entry.")
+        logger.debug("on_tree_select: Inserting '%s' into ticker_entry.", ticker)
         self.ticker_entry.insert(0, ticker)
-        print(f"DEBUG: on_tree_select: Inserting '{full_name}' into full_name_entry.")
+        logger.debug("on_tree_select: Inserting '%s' into full_name_entry.", full_name)
         self.full_name_entry.insert(0, full_name if full_name else "")
-        print("DEBUG: on_tree_select: Finished.")
+        logger.debug("on_tree_select: Finished.")
 
     def clear_entry_boxes(self):
         """Clears all text entry boxes in both forms."""
-        print("DEBUG: clear_entry_boxes: Clearing text boxes...")
+        logger.debug("clear_entry_boxes: Clearing text boxes...")
         self.ticker_entry.delete(0, "end")
         self.full_name_entry.delete(0, "end")
         self.sens_datetime_var.set("")
         self.sens_content_text.delete("1.0", "end")
-        print("DEBUG: clear_entry_boxes: Finished.")
+        logger.debug("clear_entry_boxes: Finished.")
 
     def clear_form_and_selection(self):
         """Clears all forms and deselects from the tree."""
-        print("DEBUG: clear_form_and_selection: Starting...")
+        logger.debug("clear_form_and_selection: Starting...")
         self.clear_entry_boxes()  # Call the new function
 
-        selected = self.tree.focus()
-        if selected:
-            print(f"DEBUG: clear_form_and_selection: Deselecting item {selected}")
-            self.tree.selection_remove(selected)
-        print("DEBUG: clear_form_and_selection: Finished.")
+        # One Tcl call clears the whole selection, however many rows are selected
+        self.tree.selection_set(())
+        logger.debug("clear_form_and_selection: Finished.")
 
 
 # --- Main execution ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
     root = tk.Tk()
     app = StockEditorApp(root)
+    root.protocol("WM_DELETE_WINDOW", app.on_closing)
     root.mainloop()